@@ -0,0 +1,126 @@
+"""
+Benchmark of the filtered and sorted aircraft list with and without the filter indexes.
+
+Prints the SQLite query plan of the pushed down query, to show which index is used, and the mean time of a page.
+
+Usage:
+    python -m benchmarks.bench_filter_indexes --aircrafts 100000 --repeat 20
+"""
+
+# Third party imports
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# Internal imports
+from src.config.database import configure_sqlite
+from src.models import Aircraft, AircraftData, AircraftType, Base
+from src.repository import AircraftRepository
+from src.schemas import AircraftFilterSchema, AircraftSortKey
+from src.utils.cache import InMemoryCacheBackend, LRUCache
+
+MANUFACTURERS = [f"Manufacturer {number}" for number in range(200)]
+FILTERS = AircraftFilterSchema(
+    aircraft_type=AircraftType.Fighter,
+    manufacturer="Manufacturer 7",
+    max_speed_gte=1500,
+    sort_by=AircraftSortKey.max_speed,
+    descending=True,
+)
+
+
+async def load_fleet(engine, aircrafts: int) -> None:
+    """Creates the schema and loads 'aircrafts' random aircraft with their data."""
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            insert(Aircraft.__table__),
+            [
+                {
+                    "aircraft_id": aircraft_id,
+                    "name": f"AC-{aircraft_id}",
+                    "manufacturer": random.choice(MANUFACTURERS),
+                    "aircraft_type": random.choice(list(AircraftType)),
+                    "first_flight": "1970-01-01",
+                }
+                for aircraft_id in range(1, aircrafts + 1)
+            ],
+        )
+        await connection.execute(
+            insert(AircraftData.__table__),
+            [
+                {
+                    "aircraft_id": aircraft_id,
+                    "fuel_consumption": random.randint(10, 3000),
+                    "ceiling": random.randint(2000, 20000),
+                    "weight": random.randint(500, 40000),
+                    "fuel": random.randint(100, 20000),
+                    "max_speed": random.randint(200, 3000),
+                    "cruise_speed": random.randint(150, 1000),
+                }
+                for aircraft_id in range(1, aircrafts + 1)
+            ],
+        )
+
+
+async def drop_filter_indexes(engine) -> None:
+    """Drops the indexes created for the list filters."""
+    async with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                await connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+
+async def measure(engine, repeat: int) -> tuple[list[str], float]:
+    """Returns the query plan of the filtered page and its mean execution time in milliseconds."""
+    query = AircraftRepository._aircrafts_query(filters=FILTERS).limit(100)
+    compiled = str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+
+    async with engine.connect() as connection:
+        plan = [row.detail for row in await connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))]
+
+    async with async_sessionmaker(bind=engine)() as session:
+        # A cache holding nothing, so every page is read from the database.
+        repository = AircraftRepository(
+            session, cache=InMemoryCacheBackend(LRUCache(max_entries=0, max_bytes=0, ttl=0))
+        )
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            await repository.display_aircrafts(limit=100, filters=FILTERS)
+        elapsed_time = (time.perf_counter() - start_time) / repeat * 1000
+
+    return plan, elapsed_time
+
+
+async def main(aircrafts: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = configure_sqlite(create_async_engine(f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"))
+        await load_fleet(engine, aircrafts)
+
+        for label in ("with indexes", "without indexes"):
+            if label == "without indexes":
+                await drop_filter_indexes(engine)
+            async with engine.connect() as connection:
+                await connection.execute(text("ANALYZE"))
+
+            plan, elapsed_time = await measure(engine, repeat)
+            print(f"{aircrafts} aircraft, {label}: {elapsed_time:.2f} ms per page")
+            for detail in plan:
+                print(f"    {detail}")
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--aircrafts", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(aircrafts=arguments.aircrafts, repeat=arguments.repeat))
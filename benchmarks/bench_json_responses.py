@@ -0,0 +1,93 @@
+"""
+Benchmark of 'GET /aircrafts/' with the validated and the fast JSON response paths.
+
+Walks the whole fleet page by page through the application, in process, and prints the number of requests per second
+and the 99th percentile latency of a page. The shared cache is sized to hold the fleet and warmed up first, so the
+measured time is spent on the response path rather than in the database.
+
+Usage:
+    python -m benchmarks.bench_json_responses --aircrafts 1000 10000 100000 --repeat 5
+"""
+
+# Third party imports
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# Internal imports
+from benchmarks.bench_filter_indexes import load_fleet
+from src.config.database import configure_sqlite, get_db, settings
+from src.main import app
+from src.utils.cache import cache_backend
+
+PAGE_SIZE = 1000
+
+
+async def walk_fleet(client: AsyncClient) -> list[float]:
+    """Requests every page of the fleet and returns the latency of every request in milliseconds."""
+    latencies = []
+    params = {"limit": PAGE_SIZE}
+    while True:
+        start_time = time.perf_counter()
+        response = await client.get("/aircrafts/", params=params)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+        response.raise_for_status()
+
+        if "X-Next-After-Id" not in response.headers:
+            return latencies
+        params["after_id"] = response.headers["X-Next-After-Id"]
+
+
+async def measure(aircrafts: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = configure_sqlite(create_async_engine(f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"))
+        await load_fleet(engine, aircrafts)
+        session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        async def get_bench_db():
+            async with session_maker() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = get_bench_db
+        cache_backend.cache.max_entries = 2 * aircrafts
+        await cache_backend.clear()
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            await walk_fleet(client)
+
+            for label, enabled in (("validated", False), ("fast", True)):
+                settings.fast_json_responses = enabled
+                latencies = []
+                start_time = time.perf_counter()
+                for _ in range(repeat):
+                    latencies += await walk_fleet(client)
+                elapsed_time = time.perf_counter() - start_time
+
+                p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else latencies[0]
+                print(
+                    f"{aircrafts} aircraft, {label}: {len(latencies) / elapsed_time:.1f} requests/s, "
+                    f"p99 {p99:.2f} ms per page of {PAGE_SIZE}"
+                )
+
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+
+async def main(aircrafts: list[int], repeat: int) -> None:
+    for count in aircrafts:
+        await measure(count, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--aircrafts", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(aircrafts=arguments.aircrafts, repeat=arguments.repeat))
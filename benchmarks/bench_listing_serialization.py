@@ -0,0 +1,73 @@
+"""
+Benchmark of listing the whole fleet through ORM objects and through plain rows validated in one batch.
+
+Prints the best time and the peak memory allocated while reading and validating all the aircraft.
+
+Usage:
+    python -m benchmarks.bench_listing_serialization --aircrafts 100000 --repeat 3
+"""
+
+# Third party imports
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# Internal imports
+from benchmarks.bench_filter_indexes import load_fleet
+from src.config.database import configure_sqlite
+from src.repository import AircraftRepository
+from src.schemas import AircraftDisplaySchema, AircraftFilterSchema
+
+
+async def orm_listing(repository: AircraftRepository) -> list:
+    """Lists the fleet by hydrating Aircraft and AircraftData objects and validating them one by one."""
+    aircrafts = (await repository.session.scalars(AircraftRepository._aircrafts_query())).all()
+    return [AircraftDisplaySchema.model_validate(aircraft) for aircraft in aircrafts]
+
+
+async def row_listing(repository: AircraftRepository) -> list:
+    """Lists the fleet from plain rows validated in one batch, like 'display_aircrafts' does."""
+    return await repository._load_aircrafts(None, None, AircraftFilterSchema(), None)
+
+
+async def main(aircrafts: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = configure_sqlite(create_async_engine(f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"))
+        await load_fleet(engine, aircrafts)
+        session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        for label, listing in (("ORM objects", orm_listing), ("plain rows", row_listing)):
+            elapsed_times = []
+            for _ in range(repeat):
+                async with session_maker() as session:
+                    start_time = time.perf_counter()
+                    await listing(AircraftRepository(session))
+                    elapsed_times.append(time.perf_counter() - start_time)
+
+            # Memory is traced in a separate run, tracing slows the allocations down.
+            async with session_maker() as session:
+                tracemalloc.start()
+                await listing(AircraftRepository(session))
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+            print(
+                f"{aircrafts} aircraft, {label}: {min(elapsed_times) * 1000:.0f} ms, "
+                f"peak {peak / 1024 / 1024:.1f} MiB allocated"
+            )
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--aircrafts", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(aircrafts=arguments.aircrafts, repeat=arguments.repeat))
@@ -0,0 +1,94 @@
+"""
+Benchmark of the parameter sweep evaluated on the process pool.
+
+Prints the time of a sweep over synthetic aircraft for every number of workers up to the number of CPUs, with
+the speedup over one worker, for the binary frames and the JSON lines encoded by the workers.
+
+Usage:
+    python -m benchmarks.bench_performance_sweep --aircrafts 2000 --fuel 50 --wind 20 --heading-step 5
+"""
+
+# Third party imports
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Internal imports
+from src.config.database import settings
+from src.schemas import PerformanceEngine
+from src.use_cases.sweep import PerformanceSweep
+
+
+def synthetic_sweep(aircrafts: int, fuel: int, wind: int, heading_step: float, engine: PerformanceEngine):
+    """Returns a sweep of aircraft with random cruise speeds, fuel consumptions, weights and fuel capacities."""
+    rng = np.random.default_rng(0)
+    aircraft = np.column_stack(
+        [
+            rng.uniform(150, 900, aircrafts),
+            rng.uniform(10, 3000, aircrafts),
+            rng.uniform(500, 300_000, aircrafts),
+            rng.uniform(100, 150_000, aircrafts),
+        ]
+    )
+
+    return PerformanceSweep(
+        aircraft_ids=list(range(1, aircrafts + 1)),
+        aircraft=aircraft,
+        fuel=np.linspace(10, 10_000, fuel).tolist(),
+        wind_speed=np.linspace(0, 100, wind).tolist(),
+        wind_direction=270.0,
+        heading_step=heading_step,
+        engine=engine,
+    )
+
+
+async def consume(stream) -> int:
+    """Reads the whole stream and returns its size in bytes."""
+    return sum([len(chunk) async for chunk in stream])
+
+
+def main(aircrafts: int, fuel: int, wind: int, heading_step: float, chunk_points: int, engine: str) -> None:
+    settings.sweep_max_points = 2**62
+    sweep = synthetic_sweep(aircrafts, fuel, wind, heading_step, PerformanceEngine(engine))
+    print(f"{sweep.points:,} points, {os.cpu_count()} CPUs")
+
+    baselines = {}
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            # Starts the workers before timing.
+            list(executor.map(abs, range(workers)))
+
+            for kind in ("frames", "ndjson_lines"):
+                start_time = time.perf_counter()
+                size = asyncio.run(consume(getattr(sweep, kind)(executor, chunk_points)))
+                duration = time.perf_counter() - start_time
+                baselines.setdefault(kind, duration)
+                print(
+                    f"{kind}: {workers} workers, {duration:.2f} s, {sweep.points / duration / 1e6:.1f} M points/s, "
+                    f"{size / 2**20:.0f} MiB, speedup {baselines[kind] / duration:.2f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--aircrafts", type=int, default=2000)
+    parser.add_argument("--fuel", type=int, default=50)
+    parser.add_argument("--wind", type=int, default=20)
+    parser.add_argument("--heading-step", type=float, default=5.0)
+    parser.add_argument("--chunk-points", type=int, default=settings.sweep_chunk_points)
+    parser.add_argument("--engine", choices=[engine.value for engine in PerformanceEngine], default="linear")
+    arguments = parser.parse_args()
+
+    main(
+        aircrafts=arguments.aircrafts,
+        fuel=arguments.fuel,
+        wind=arguments.wind,
+        heading_step=arguments.heading_step,
+        chunk_points=arguments.chunk_points,
+        engine=arguments.engine,
+    )
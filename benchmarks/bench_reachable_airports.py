@@ -0,0 +1,59 @@
+"""
+Benchmark of the great-circle radius queries of the in-memory airport index.
+
+Prints the time of building the index over synthetic airports spread uniformly over the globe and the mean
+latency of radius queries with the KD-tree and with a scan measuring every airport.
+
+Usage:
+    python -m benchmarks.bench_reachable_airports --airports 80000 --radius 500 2000 --repeat 200
+"""
+
+# Third party imports
+import argparse
+import time
+
+import numpy as np
+
+# Internal imports
+from src.utils.airports import EARTH_RADIUS, AirportIndex, unit_vectors
+
+
+def main(airports: int, radii: list[float], repeat: int) -> None:
+    rng = np.random.default_rng(0)
+    latitudes = np.degrees(np.arcsin(rng.uniform(-1, 1, airports)))
+    longitudes = rng.uniform(-180, 180, airports)
+
+    start_time = time.perf_counter()
+    index = AirportIndex([f"A{number}" for number in range(airports)], ["Airport"] * airports, latitudes, longitudes)
+    print(f"{airports} airports indexed in {(time.perf_counter() - start_time) * 1000:.0f} ms")
+
+    points = unit_vectors(latitudes, longitudes)
+    origins = [(float(rng.uniform(-60, 60)), float(rng.uniform(-180, 180))) for _ in range(repeat)]
+    for radius in radii:
+        found = 0
+        start_time = time.perf_counter()
+        for latitude, longitude in origins:
+            found += len(index.within(latitude, longitude, radius)[0])
+        tree_time = (time.perf_counter() - start_time) / repeat
+
+        start_time = time.perf_counter()
+        for latitude, longitude in origins:
+            chords = np.linalg.norm(points - unit_vectors([latitude], [longitude]), axis=1)
+            distances = 2 * EARTH_RADIUS * np.arcsin(np.clip(chords / 2, 0, 1))
+            np.argsort(distances[distances <= radius])
+        scan_time = (time.perf_counter() - start_time) / repeat
+
+        print(
+            f"radius {radius:.0f} km: {found / repeat:.0f} airports, KD-tree {tree_time * 1000:.3f} ms, "
+            f"scan {scan_time * 1000:.3f} ms per query"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--airports", type=int, default=80_000)
+    parser.add_argument("--radius", type=float, nargs="+", default=[500.0, 2000.0])
+    parser.add_argument("--repeat", type=int, default=200)
+    arguments = parser.parse_args()
+
+    main(airports=arguments.airports, radii=arguments.radius, repeat=arguments.repeat)
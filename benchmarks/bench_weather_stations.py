@@ -0,0 +1,116 @@
+"""
+Benchmark of fetching the weather of many stations at once through the weather cache.
+
+Starts a local stub of weatherapi.com answering after a fixed delay and prints, for every number of stations and
+fetch concurrency, the time of one batch, its throughput and the requests the stub received. Every station is
+queried twice in the batch, the repeated ones are fetched once.
+
+Usage:
+    python -m benchmarks.bench_weather_stations --stations 10 100 1000 --concurrency 1 20 --delay 0.01
+"""
+
+# Third party imports
+import argparse
+import asyncio
+import json
+import logging
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+# Internal imports
+from src.router.weather_api import WEATHERAPI_FIELDS, WeatherApi, WeatherProviders
+from src.use_cases.weather import WeatherCache
+from src.utils.resilience import TokenBucket
+
+
+class StubWeatherHandler(BaseHTTPRequestHandler):
+    """Answers like weatherapi.com after the delay of the server."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        params = {name: values[0] for name, values in parse_qs(urlparse(self.path).query).items()}
+        self.server.requests += 1
+        time.sleep(self.server.delay)
+
+        body = {
+            "location": {"name": params["q"]},
+            "current": {"last_updated": "2026-10-17 12:00", "wind_kph": 11.2, "wind_degree": 270, "temp_c": 9.0},
+        }
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class StubWeatherServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+async def fetch_batch(url: str, stations: int, concurrency: int, rate_limit: float) -> float:
+    """Fetches the stations, each queried twice, through a new cache and returns the seconds it took."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        api = WeatherApi(api_url=url, fields=WEATHERAPI_FIELDS, client=client)
+        providers = WeatherProviders([api], hedge_delay=0)
+        providers.health[api].limiter = TokenBucket(rate=rate_limit, burst=concurrency)
+        cache = WeatherCache(
+            fetch=providers.request_weather_data, ttl=300, stale_ttl=600, refresh_interval=60, concurrency=concurrency
+        )
+        locations = [f"station-{number}" for number in range(stations)] * 2
+
+        start_time = time.perf_counter()
+        observations = await cache.get_many(locations)
+        elapsed = time.perf_counter() - start_time
+
+    assert len(observations) == stations
+    return elapsed
+
+
+def main(stations: list[int], concurrencies: list[int], delay: float, rate_limit: float) -> None:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    server = StubWeatherServer(("127.0.0.1", 0), StubWeatherHandler)
+    server.delay = delay
+    url = f"http://127.0.0.1:{server.server_port}/weatherapi"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        for count in stations:
+            for concurrency in concurrencies:
+                server.requests = 0
+                elapsed = asyncio.run(fetch_batch(url, count, concurrency, rate_limit))
+                print(
+                    f"{count} stations, concurrency {concurrency}: {elapsed * 1000:.0f} ms, "
+                    f"{count / elapsed:.0f} stations/s, {server.requests} requests"
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stations", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 20])
+    parser.add_argument("--delay", type=float, default=0.01, help="Seconds the stub takes to answer.")
+    parser.add_argument("--rate-limit", type=float, default=math.inf, help="Requests per second to the stub.")
+    arguments = parser.parse_args()
+
+    main(
+        stations=arguments.stations,
+        concurrencies=arguments.concurrency,
+        delay=arguments.delay,
+        rate_limit=arguments.rate_limit,
+    )
@@ -0,0 +1,40 @@
+"""add fleet and aircraft versions
+
+The single row 'fleet_state' table holds the version of the whole fleet and 'aircrafts.version' the version of every
+aircraft, both are bumped by the application writes and serve as ETags of the API responses.
+
+Revision ID: 0b7c41d9e2a3
+Revises: af6e892c04f5
+Create Date: 2026-10-17 13:12:40.517204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b7c41d9e2a3"
+down_revision: Union[str, None] = "af6e892c04f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        table_name="aircrafts",
+        column=sa.Column(name="version", type_=sa.Integer, nullable=False, server_default=sa.text("1")),
+    )
+    fleet_state = op.create_table(
+        "fleet_state",
+        sa.Column(name="fleet_state_id", type_=sa.Integer, primary_key=True),
+        sa.Column(name="version", type_=sa.Integer, nullable=False),
+    )
+    op.bulk_insert(fleet_state, [{"fleet_state_id": 1, "version": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("fleet_state")
+    op.drop_column(table_name="aircrafts", column_name="version")
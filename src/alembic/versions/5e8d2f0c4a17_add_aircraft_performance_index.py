@@ -0,0 +1,32 @@
+"""add aircraft performance index
+
+The index covers the columns of the range and endurance expressions, so the fleet-wide performance query is answered
+from the index alone.
+
+Revision ID: 5e8d2f0c4a17
+Revises: 0b7c41d9e2a3
+Create Date: 2026-10-17 16:04:18.203941
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8d2f0c4a17"
+down_revision: Union[str, None] = "0b7c41d9e2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        index_name="ix_aircrafts_data_performance",
+        table_name="aircrafts_data",
+        columns=["cruise_speed", "fuel_consumption", "aircraft_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(index_name="ix_aircrafts_data_performance", table_name="aircrafts_data")
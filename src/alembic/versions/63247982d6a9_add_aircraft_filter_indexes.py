@@ -0,0 +1,34 @@
+"""add aircraft filter indexes
+
+Revision ID: 63247982d6a9
+Revises: 6d3d857e341e
+Create Date: 2026-10-17 09:12:41.527310
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "63247982d6a9"
+down_revision: Union[str, None] = "6d3d857e341e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "aircrafts": ["manufacturer", "aircraft_type"],
+    "aircrafts_data": ["ceiling", "max_speed", "cruise_speed"],
+}
+
+
+def upgrade() -> None:
+    for table_name, columns in INDEXES.items():
+        for column in columns:
+            op.create_index(index_name=f"ix_{table_name}_{column}", table_name=table_name, columns=[column])
+
+
+def downgrade() -> None:
+    for table_name, columns in INDEXES.items():
+        for column in columns:
+            op.drop_index(index_name=f"ix_{table_name}_{column}", table_name=table_name)
@@ -0,0 +1,45 @@
+"""add aircraft trigram indexes
+
+Trigram GIN indexes serve prefix (ILIKE) and fuzzy (%) search on aircraft names and manufacturers. They exist on
+PostgreSQL only, other databases use the in-memory n-gram index of the application.
+
+Revision ID: af6e892c04f5
+Revises: 63247982d6a9
+Create Date: 2026-10-17 11:03:18.204117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "af6e892c04f5"
+down_revision: Union[str, None] = "63247982d6a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ["name", "manufacturer"]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in COLUMNS:
+        op.create_index(
+            index_name=f"ix_aircrafts_{column}_trgm",
+            table_name="aircrafts",
+            columns=[column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in COLUMNS:
+        op.drop_index(index_name=f"ix_aircrafts_{column}_trgm", table_name="aircrafts")
@@ -1,22 +1,51 @@
 # Third party imports
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from src.settings import load_settings
 
+
+def configure_sqlite(async_engine: AsyncEngine) -> AsyncEngine:
+    """Lets SQLAlchemy emit BEGIN itself on SQLite connections, so SAVEPOINTs nest inside one transaction
+    instead of being committed by the driver's implicit transaction handling, and enforces foreign keys,
+    so ON DELETE CASCADE behaves as on PostgreSQL.
+
+    Arguments:
+        async_engine: Engine to configure, engines of other dialects are returned unchanged.
+
+    Returns:
+        AsyncEngine: The configured engine.
+    """
+    if async_engine.dialect.name != "sqlite":
+        return async_engine
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def configure_connection(dbapi_connection, _):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(async_engine.sync_engine, "begin")
+    def emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return async_engine
+
+
 settings = load_settings()
-engine = create_engine(settings.database_url)
+engine = configure_sqlite(create_async_engine(settings.database_url))
 
-SessionLocal = sessionmaker(autoflush=False, autocommit=False, bind=engine)
+SessionLocal = async_sessionmaker(autoflush=False, autocommit=False, expire_on_commit=False, bind=engine)
 
 
-def get_db():
-    """Create a database session.
+async def get_db():
+    """Create an asynchronous database session.
     Yields:
-        Session: The database session.
+        AsyncSession: The database session.
     """
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        await db.close()
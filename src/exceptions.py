@@ -31,3 +31,18 @@ class AircraftNotFoundError(AppError):
 class AircraftRepositoryError(AppError):
     status_code = 503
     message = "Aircraft repository service is currently unavailable. Please try again later."
+
+
+class AirportsUnavailableError(AppError):
+    status_code = 503
+    message = "Airports data set is currently unavailable."
+
+
+class WeatherProviderError(AppError):
+    status_code = 502
+    message = "Weather provider returned no usable data."
+
+
+class WeatherUnavailableError(AppError):
+    status_code = 503
+    message = "Live weather of the location is not available yet."
@@ -3,13 +3,19 @@ from contextlib import asynccontextmanager
 from logging import INFO, basicConfig, getLogger
 
 import uvicorn
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
+from sqlalchemy import text
 
 # Internal imports
 from src.config.database import engine, settings
-from src.exceptions import DatabaseConnectionError
+from src.exceptions import AppError, DatabaseConnectionError
 from src.router.api import router as router_aircraft
+from src.router.monitoring import router as router_monitoring
+from src.router.weather import router as router_weather
+from src.router.weather_api import close_http_client
+from src.use_cases.sweep import shutdown_sweep_executor
+from src.use_cases.weather import weather_cache
 from src.utils.init_db import create_tables
 
 basicConfig(level=INFO, format="[%(levelname)s] %(message)s")
@@ -20,9 +26,13 @@ logger = getLogger()
 async def lifespan(_: FastAPI):
     try:
         logger.info("Creating database tables...")
-        create_tables()
+        await create_tables()
+        weather_cache.start()
         yield
     finally:
+        shutdown_sweep_executor()
+        await weather_cache.stop()
+        await close_http_client()
         logger.info("Closing database connections...")
         try:
             await engine.dispose()
@@ -34,14 +44,18 @@ async def lifespan(_: FastAPI):
 app = FastAPI(lifespan=lifespan)
 
 
+@app.exception_handler(AppError)
+async def app_error_handler(_: Request, error: AppError) -> JSONResponse:
+    """Translates application errors into JSON responses with the status code of the error."""
+    return JSONResponse(content={"detail": error.message}, status_code=error.status_code)
+
+
 @app.get("/health")
 async def health_check() -> JSONResponse:
     """Returns dict IOT support FastAPI health checks."""
     try:
-        with engine.connect() as connection:
-            cursor = connection.connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.close()
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
         db_status = "OK"
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}.")
@@ -59,6 +73,8 @@ async def health_check() -> JSONResponse:
 
 
 app.include_router(router_aircraft)
+app.include_router(router_monitoring)
+app.include_router(router_weather)
 
 
 if __name__ == "__main__":
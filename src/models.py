@@ -1,7 +1,8 @@
 # Third party imports
 from enum import Enum, unique
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import DDL, Float, ForeignKey, Index, cast, event, text
+from sqlalchemy.ext.hybrid import hybrid_method
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -9,6 +10,9 @@ from sqlalchemy.orm import (
     relationship,
 )
 
+# Internal imports
+from src.utils.performance_table import flight_range
+
 
 @unique
 class AircraftType(int, Enum):
@@ -28,12 +32,30 @@ class Aircraft(Base):
     """Model of the 'parent' aircraft table, dedicated to store basic information about the aircraft."""
 
     __tablename__ = "aircrafts"
+    # Trigram GIN indexes serve prefix and fuzzy search on PostgreSQL, other databases use the in-memory n-gram
+    # index. Ids of deleted aircraft are never reused on SQLite either, so their ETags cannot match a new aircraft.
+    __table_args__ = (
+        Index(
+            "ix_aircrafts_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_aircrafts_manufacturer_trgm",
+            "manufacturer",
+            postgresql_using="gin",
+            postgresql_ops={"manufacturer": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        {"sqlite_autoincrement": True},
+    )
 
     aircraft_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, nullable=False, unique=True)
     name: Mapped[str] = mapped_column(nullable=False)
-    manufacturer: Mapped[str] = mapped_column(nullable=False)
-    aircraft_type: Mapped["AircraftType"] = mapped_column(nullable=False)
+    manufacturer: Mapped[str] = mapped_column(nullable=False, index=True)
+    aircraft_type: Mapped["AircraftType"] = mapped_column(nullable=False, index=True)
     first_flight: Mapped[str] = mapped_column(nullable=True)
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default=text("1"))
     aircraft_data: Mapped["AircraftData"] = relationship(
         argument="AircraftData",
         back_populates="aircraft",
@@ -48,12 +70,12 @@ class AircraftData(Base):
 
     aircraft_data_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, nullable=False, unique=True)
     fuel_consumption: Mapped[int] = mapped_column(nullable=True)
-    ceiling: Mapped[int] = mapped_column(nullable=True)
+    ceiling: Mapped[int] = mapped_column(nullable=True, index=True)
     weight: Mapped[int] = mapped_column(nullable=True)
     fuel: Mapped[int] = mapped_column(nullable=True)
     take_off_weight: Mapped[int] = mapped_column(nullable=True)
-    max_speed: Mapped[int] = mapped_column(nullable=True)
-    cruise_speed: Mapped[int] = mapped_column(nullable=True)
+    max_speed: Mapped[int] = mapped_column(nullable=True, index=True)
+    cruise_speed: Mapped[int] = mapped_column(nullable=True, index=True)
     aircraft_id: Mapped[int] = mapped_column(
         ForeignKey(column="aircrafts.aircraft_id", ondelete="CASCADE"),
         unique=True,
@@ -63,3 +85,40 @@ class AircraftData(Base):
         back_populates="aircraft_data",
         single_parent=True,
     )
+
+    # Covers the performance expressions, so fleet-wide performance queries read only the index.
+    __table_args__ = (Index("ix_aircrafts_data_performance", "cruise_speed", "fuel_consumption", "aircraft_id"),)
+
+    @hybrid_method
+    def flight_range(self, fuel: float, wind_speed: float = 0.0) -> float:
+        """Returns the range [km] with the given fuel and wind speed, the formula of 'Performance.calculate_range'."""
+        return flight_range(self.cruise_speed + wind_speed, fuel, self.fuel_consumption)
+
+    @flight_range.expression
+    def flight_range(cls, fuel: float, wind_speed: float = 0.0):
+        """Returns the SQL expression of the range, divided as floating point numbers."""
+        return flight_range(cls.cruise_speed + wind_speed, fuel, cast(cls.fuel_consumption, Float))
+
+    @hybrid_method
+    def endurance(self, fuel: float) -> float:
+        """Returns the endurance [h] with the given fuel, the formula of 'Performance.calculate_endurance'."""
+        return fuel / self.fuel_consumption
+
+    @endurance.expression
+    def endurance(cls, fuel: float):
+        """Returns the SQL expression of the endurance, divided as floating point numbers."""
+        return fuel / cast(cls.fuel_consumption, Float)
+
+
+class FleetState(Base):
+    """Model of the single row 'fleet_state' table, its version changes with every write to the aircraft tables."""
+
+    __tablename__ = "fleet_state"
+
+    fleet_state_id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(nullable=False, default=0)
+
+
+event.listen(
+    FleetState.__table__, "after_create", DDL("INSERT INTO fleet_state (fleet_state_id, version) VALUES (1, 0)")
+)
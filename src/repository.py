@@ -1,9 +1,13 @@
 # Third party imports
-from typing import Dict, List
+from collections import defaultdict
+from logging import getLogger
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Sequence, Tuple
 
-from sqlalchemy import exists, select
-from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.orm import Session, joinedload
+from pydantic import BaseModel
+from sqlalchemy import Row, and_, bindparam, case, delete, exists, func, insert, or_, select, text, update
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 
 from src.exceptions import (
     AircraftNotFoundError,
@@ -13,16 +17,33 @@ from src.exceptions import (
 )
 
 # Internal imports
-from src.models import Aircraft, AircraftData
+from src.models import Aircraft, AircraftData, Base, FleetState
 from src.schemas import (
+    AIRCRAFT_DATA_FIELDS,
+    AIRCRAFT_DISPLAY_COLUMNS,
+    AIRCRAFT_FIELDS,
     AircraftBaseSchema,
-    AircraftDataUpdateSchema,
+    AircraftBulkCreateSchema,
+    AircraftBulkDeleteSchema,
+    AircraftBulkErrorSchema,
+    AircraftBulkResultSchema,
+    AircraftBulkUpdateSchema,
+    AircraftDataBaseSchema,
     AircraftDisplaySchema,
+    AircraftFilterSchema,
     AircraftUpdateSchema,
+    BulkStatus,
+    aircraft_display_list,
+    aircraft_projection_schema,
 )
-from src.settings import SingletonLogger
+from src.utils.cache import CacheBackend, LRUCache, cache_backend
+from src.utils.codec import decode_model, encode_model, pack, unpack
+from src.utils.performance_table import flight_time_memo, performance_tables
+from src.utils.search_index import NgramIndex, aircraft_search_index
 
-logger = SingletonLogger()
+logger = getLogger()
+
+RANGE_FILTER_COLUMNS = ("fuel_consumption", "ceiling", "weight", "fuel", "max_speed", "cruise_speed")
 
 
 class AircraftRepository:
@@ -30,29 +51,72 @@ class AircraftRepository:
     Repository class to manage operations related to the Aircraft and AircraftData tables.
 
     Attributes:
-        session (Session): The SQLAlchemy session used for database transactions.
+        session (AsyncSession): The SQLAlchemy asynchronous session used for database transactions.
+        search_index (NgramIndex): In-memory search index used by databases without trigram support.
+        cache (CacheBackend): Read-through cache of single aircraft and listing pages.
+        performance_tables (LRUCache): Precomputed performance tables of the aircraft held by the process.
+        flight_time_memo (LRUCache): Memoized Breguet flight times of the aircraft held by the process.
 
     Methods:
         add_aircraft(aircraft: AircraftBaseSchema) -> AircraftDisplaySchema:
             Adds a new aircraft to the database.
-        display_aircrafts() -> List[AircraftDisplaySchema]:
-            Retrieves and returns all aircraft in the database.
-        update_aircraft(aircraft_id: int, **kwargs) -> AircraftUpdateSchema:
+        add_aircrafts(aircrafts: List[AircraftBaseSchema], chunk_size: int) -> AircraftBulkCreateSchema:
+            Adds many aircraft to the database in batched statements within one transaction.
+        get_aircraft(aircraft_id: int, fields: frozenset[str], version: int) -> BaseModel:
+            Retrieves and returns a single aircraft, optionally restricted to the requested fields, through the cache.
+        display_aircrafts(after_id: int, limit: int, filters: AircraftFilterSchema, fields: frozenset[str],
+                fleet_version: int) -> List[BaseModel]:
+            Retrieves and returns a keyset-paginated, filtered and sorted page of aircraft through the cache.
+        stream_aircrafts(after_id: int, batch_size: int, filters: AircraftFilterSchema, fields: frozenset[str])
+                -> AsyncIterator[BaseModel]:
+            Lazily yields aircraft fetched in batches from a server-side cursor.
+        approximate_count() -> int:
+            Returns a cheap estimate of the number of aircraft in the database.
+        performance_data(aircraft_ids: Sequence[int], after_id: int, limit: int) -> Dict[int, Row]:
+            Returns the performance data of many aircraft or of a page of the fleet read in one query.
+        capable_aircrafts(distance: float, fuel: float, wind_speed: float, limit: int) -> List[Mapping[str, Any]]:
+            Finds the aircraft able to fly the distance with one query, from the longest range.
+        fleet_version() -> int:
+            Returns the version of the fleet, bumped by every write.
+        aircraft_version(aircraft_id: int) -> int | None:
+            Returns the version of a single aircraft, bumped by every update of it.
+        search_aircrafts(query: str, limit: int, threshold: float) -> List[AircraftDisplaySchema]:
+            Finds aircraft by prefix or fuzzy match of the name and manufacturer.
+        update_aircraft(aircraft_id: int, aircraft: AircraftUpdateSchema) -> AircraftDisplaySchema:
             Updates an existing aircraft based on the provided aircraft_id and field values.
+        update_aircrafts(aircrafts: List[AircraftBulkUpdateSchema], chunk_size: int) -> AircraftBulkResultSchema:
+            Updates many aircraft with batched UPDATE statements within one transaction.
         delete_aircraft(aircraft_id: int) -> None:
             Deletes the aircraft with the given aircraft_id from the database.
+        delete_aircrafts(criteria: AircraftBulkDeleteSchema, chunk_size: int) -> AircraftBulkResultSchema:
+            Deletes all the aircraft matching the criteria within one transaction.
     """
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: AsyncSession,
+        search_index: NgramIndex = aircraft_search_index,
+        cache: CacheBackend = cache_backend,
+        performance_tables: LRUCache = performance_tables,
+        flight_time_memo: LRUCache = flight_time_memo,
+    ):
         """
         Initializes AircraftRepository class.
 
         Arguments:
-            session: SQLAlchemy session object.
+            session: SQLAlchemy asynchronous session object.
+            search_index: In-memory search index used by databases without trigram support.
+            cache: Read-through cache of single aircraft and listing pages, invalidated by the write methods.
+            performance_tables: Precomputed performance tables, invalidated by the update and delete methods.
+            flight_time_memo: Memoized Breguet flight times, invalidated by the update and delete methods.
         """
         self.session = session
+        self.search_index = search_index
+        self.cache = cache
+        self.performance_tables = performance_tables
+        self.flight_time_memo = flight_time_memo
 
-    def is_present(self, aircraft_id: int) -> bool:
+    async def is_present(self, aircraft_id: int) -> bool:
         """
         Checks if an aircraft with the given aircraft_id exists in the database.
 
@@ -63,11 +127,11 @@ class AircraftRepository:
             bool: True if the aircraft exists, otherwise False.
         """
         exist = select(exists().where(Aircraft.aircraft_id == aircraft_id))
-        result = self.session.execute(exist).scalar_one_or_none()
+        result = (await self.session.execute(exist)).scalar_one_or_none()
 
         return bool(result)
 
-    def add_aircraft(self, aircraft: AircraftBaseSchema) -> AircraftDisplaySchema:
+    async def add_aircraft(self, aircraft: AircraftBaseSchema) -> AircraftDisplaySchema:
         """
         Adds new Aircraft instance to the database.
 
@@ -78,100 +142,871 @@ class AircraftRepository:
             Instance of the Aircraft class displayed according to AircraftDisplaySchema.
         """
         try:
-            new_aircraft = Aircraft(**aircraft.model_dump(exclude={"aircraft_data"}))
-            new_aircraft_data = AircraftData(**aircraft.aircraft_data.model_dump(), aircraft=new_aircraft)
-            self.session.add_all([new_aircraft, new_aircraft_data])
-            self.session.commit()
+            (added_aircraft,) = await self._insert_aircrafts([(0, aircraft)])
+            fleet_version = await self._bump_fleet_version()
+            await self.session.commit()
+            await self._invalidate_cache()
+            self._index_aircrafts([added_aircraft])
+            self.search_index.advance(fleet_version)
+            logger.info(f"Aircraft with id {added_aircraft.aircraft_id} added successfully.")
+
+            return added_aircraft
 
-            logger.info("Aircraft added successfully.")
-            added_aircraft = (
-                self.session.query(Aircraft)
-                .options(joinedload(Aircraft.aircraft_data))
-                .order_by(Aircraft.aircraft_id.desc())
-                .first()
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.error(f"Integrity error adding aircraft: {str(e)}")
+            raise DatabaseIntegrityError
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Unexpected error adding aircraft: {str(e)}")
+            raise InvalidDataError(message=str(e))
+
+    async def _insert_aircrafts(
+        self, aircrafts: Sequence[Tuple[int, AircraftBaseSchema]]
+    ) -> List[AircraftDisplaySchema]:
+        """
+        Inserts the aircraft and their data with two multi-row INSERT ... RETURNING statements.
+
+        Arguments:
+            aircrafts: pairs of the position in the bulk request and the aircraft to be added.
+
+        Returns:
+            List of added aircraft displayed according to AircraftDisplaySchema, in the order of the input.
+        """
+        aircraft_rows = (
+            await self.session.execute(
+                insert(Aircraft).returning(*Aircraft.__table__.c, sort_by_parameter_order=True),
+                [aircraft.model_dump(exclude={"aircraft_data"}) for _, aircraft in aircrafts],
+            )
+        ).all()
+        aircraft_data_rows = (
+            await self.session.execute(
+                insert(AircraftData).returning(*AircraftData.__table__.c, sort_by_parameter_order=True),
+                [
+                    {**aircraft.aircraft_data.model_dump(), "aircraft_id": aircraft_row.aircraft_id}
+                    for (_, aircraft), aircraft_row in zip(aircrafts, aircraft_rows)
+                ],
             )
+        ).all()
 
-            return AircraftDisplaySchema.model_validate(added_aircraft)
+        return [
+            AircraftDisplaySchema.model_validate({**aircraft_row._mapping, "aircraft_data": aircraft_data_row._mapping})
+            for aircraft_row, aircraft_data_row in zip(aircraft_rows, aircraft_data_rows)
+        ]
+
+    async def add_aircrafts(
+        self, aircrafts: List[AircraftBaseSchema], chunk_size: int = 500
+    ) -> AircraftBulkCreateSchema:
+        """
+        Adds many Aircraft instances to the database in a single transaction. Every chunk of 'chunk_size' aircraft
+        is inserted with batched statements inside a savepoint; when a chunk fails, its aircraft are retried one by
+        one, so only the failing items are reported and skipped.
+
+        Arguments:
+            aircrafts: list of aircraft to be added using the AircraftBaseSchema.
+            chunk_size: number of aircraft inserted per batched statement.
+
+        Returns:
+            Added aircraft and per-item errors according to AircraftBulkCreateSchema.
+        """
+        created, errors = [], []
+        indexed_aircrafts = list(enumerate(aircrafts))
+
+        try:
+            for start in range(0, len(indexed_aircrafts), chunk_size):
+                chunk = indexed_aircrafts[start : start + chunk_size]
+                try:
+                    async with self.session.begin_nested():
+                        created.extend(await self._insert_aircrafts(chunk))
+
+                except (DataError, IntegrityError):
+                    for index, aircraft in chunk:
+                        try:
+                            async with self.session.begin_nested():
+                                created.extend(await self._insert_aircrafts([(index, aircraft)]))
+
+                        except (DataError, IntegrityError) as e:
+                            logger.warning(f"Database error adding aircraft at index {index}: {str(e.orig)}")
+                            errors.append(AircraftBulkErrorSchema(index=index, message=str(e.orig)))
+
+            fleet_version = await self._bump_fleet_version() if created else None
+            await self.session.commit()
+            await self._invalidate_cache()
+            self._index_aircrafts(created)
+            self.search_index.advance(fleet_version)
+            logger.info(f"{len(created)} aircraft added successfully, {len(errors)} rejected.")
+
+            return AircraftBulkCreateSchema(created=created, errors=errors)
 
         except IntegrityError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"Integrity error adding aircraft: {str(e)}")
             raise DatabaseIntegrityError
 
         except Exception as e:
+            await self.session.rollback()
             logger.error(f"Unexpected error adding aircraft: {str(e)}")
             raise InvalidDataError(message=str(e))
 
-    def display_aircrafts(self) -> List[AircraftDisplaySchema]:
+    @staticmethod
+    def _aircrafts_query(
+        after_id: int | None = None,
+        filters: AircraftFilterSchema | None = None,
+        fields: frozenset[str] | None = None,
+    ):
         """
-        Returns all the aircraft in the database as a list, contains
-        the Aircraft objects, using the AircraftDisplaySchema.
+        Builds the listing query with the filters pushed down into SQL. Rows are ordered by the sort column and
+        the primary key, which makes 'after_id' a stable keyset cursor for every sort order. NULL values of the
+        sort column are ordered as the largest ones. With 'fields' only
+        the requested columns are selected and 'aircrafts_data' is joined only when the fields, the filters
+        or the sort order need it.
+
+        Arguments:
+            after_id: 'id' of the last aircraft already seen by the client, None to start from the beginning.
+            filters: filters and sorting according to AircraftFilterSchema, None lists all aircraft by 'id'.
+            fields: names of the selected fields, None selects whole Aircraft objects.
+
+        Returns:
+            Select statement of Aircraft objects with eagerly loaded AircraftData, or of the requested columns.
         """
-        all_aircrafts = self.session.query(Aircraft).options(joinedload(Aircraft.aircraft_data)).all()
+        filters = filters or AircraftFilterSchema()
+        if fields is None:
+            query = select(Aircraft).outerjoin(Aircraft.aircraft_data).options(contains_eager(Aircraft.aircraft_data))
+        else:
+            query = select(
+                Aircraft.aircraft_id,
+                *(getattr(Aircraft, field) for field in AIRCRAFT_FIELDS if field in fields - {"aircraft_id"}),
+                *(getattr(AircraftData, field) for field in AIRCRAFT_DATA_FIELDS if field in fields),
+            )
+            query = query.select_from(Aircraft)
+            if (
+                fields.intersection(AIRCRAFT_DATA_FIELDS)
+                or filters.sort_by.value in AIRCRAFT_DATA_FIELDS
+                or any(
+                    getattr(filters, f"{column_name}_{bound}") is not None
+                    for column_name in RANGE_FILTER_COLUMNS
+                    for bound in ("gte", "lte")
+                )
+            ):
+                query = query.outerjoin(Aircraft.aircraft_data)
+
+        if filters.aircraft_type is not None:
+            query = query.where(Aircraft.aircraft_type == filters.aircraft_type)
+        if filters.manufacturer is not None:
+            query = query.where(Aircraft.manufacturer == filters.manufacturer)
+        for column_name in RANGE_FILTER_COLUMNS:
+            column = getattr(AircraftData, column_name)
+            if (lower_bound := getattr(filters, f"{column_name}_gte")) is not None:
+                query = query.where(column >= lower_bound)
+            if (upper_bound := getattr(filters, f"{column_name}_lte")) is not None:
+                query = query.where(column <= upper_bound)
+
+        sort_column = getattr(Aircraft, filters.sort_by.value, None) or getattr(AircraftData, filters.sort_by.value)
+        if sort_column is Aircraft.aircraft_id:
+            if after_id is not None:
+                query = query.where(
+                    Aircraft.aircraft_id < after_id if filters.descending else Aircraft.aircraft_id > after_id
+                )
+            return query.order_by(Aircraft.aircraft_id.desc() if filters.descending else Aircraft.aircraft_id.asc())
+
+        # NULLs (nullable columns and aircraft without data) sort as the largest values, last in ascending order
+        # and first in descending order, so the cursor has to handle the NULL group explicitly.
+        if after_id is not None:
+            cursor = select(sort_column).where(sort_column.table.c.aircraft_id == after_id).scalar_subquery()
+            if filters.descending:
+                query = query.where(
+                    or_(
+                        and_(
+                            cursor.is_not(None),
+                            or_(
+                                sort_column < cursor,
+                                and_(sort_column == cursor, Aircraft.aircraft_id < after_id),
+                            ),
+                        ),
+                        and_(
+                            cursor.is_(None),
+                            or_(sort_column.is_not(None), Aircraft.aircraft_id < after_id),
+                        ),
+                    )
+                )
+            else:
+                query = query.where(
+                    or_(
+                        and_(
+                            cursor.is_not(None),
+                            or_(
+                                sort_column > cursor,
+                                and_(sort_column == cursor, Aircraft.aircraft_id > after_id),
+                                sort_column.is_(None),
+                            ),
+                        ),
+                        and_(cursor.is_(None), sort_column.is_(None), Aircraft.aircraft_id > after_id),
+                    )
+                )
+
+        if filters.descending:
+            return query.order_by(sort_column.desc().nulls_first(), Aircraft.aircraft_id.desc())
+
+        return query.order_by(sort_column.asc().nulls_last(), Aircraft.aircraft_id.asc())
+
+    @staticmethod
+    def _nest(row: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Converts a row of the selected columns into a dictionary shaped like AircraftDisplaySchema,
+        with the columns of AircraftData nested in 'aircraft_data'.
+
+        Arguments:
+            row: selected columns of the aircraft by name.
+
+        Returns:
+            Dict[str, Any]: Nested values of the aircraft.
+        """
+        aircraft = {field: row[field] for field in AIRCRAFT_FIELDS if field in row}
+        aircraft_data = {field: row[field] for field in AIRCRAFT_DATA_FIELDS if field in row}
+        if aircraft_data:
+            aircraft["aircraft_data"] = aircraft_data
+
+        return aircraft
+
+    @staticmethod
+    def _project(row: Mapping[str, Any], fields: frozenset[str]) -> BaseModel:
+        """
+        Builds the projection of the aircraft from a row of the selected columns.
+
+        Arguments:
+            row: selected columns of the aircraft by name.
+            fields: names of the requested fields.
+
+        Returns:
+            Aircraft displayed according to the schema built for the requested fields.
+        """
+        return aircraft_projection_schema(fields | {"aircraft_id"}).model_validate(AircraftRepository._nest(row))
+
+    @staticmethod
+    def _display_schema(fields: frozenset[str] | None) -> type[BaseModel]:
+        """Returns AircraftDisplaySchema, or the schema built for the requested fields."""
+        return AircraftDisplaySchema if fields is None else aircraft_projection_schema(fields | {"aircraft_id"})
+
+    @staticmethod
+    def _fields_key(fields: frozenset[str] | None) -> str:
+        """Returns the cache key of the requested fields."""
+        return "*" if fields is None else ",".join(sorted(fields))
+
+    @staticmethod
+    def _aircraft_key(version: int, fields_key: str) -> str:
+        """Returns the cache key of a version of the aircraft restricted to the requested fields."""
+        return f"{version}|{fields_key}"
+
+    async def get_aircraft(
+        self, aircraft_id: int, fields: frozenset[str] | None = None, version: int | None = None
+    ) -> BaseModel:
+        """
+        Returns the aircraft with the given 'id'. Cached copies are keyed by the version of the aircraft, so a copy
+        left by a write of another process, whose invalidation this process never saw, is not served.
+
+        Arguments:
+            aircraft_id: 'id' of the aircraft.
+            fields: names of the requested fields, None returns the whole aircraft.
+            version: version of the aircraft already read by the caller, read from the database when None.
+
+        Returns:
+            Aircraft displayed according to AircraftDisplaySchema, or to the schema built for the requested fields.
+
+        Raises:
+            AircraftNotFoundError: If the aircraft with the given 'id' does not exist.
+        """
+        if version is None:
+            version = await self.aircraft_version(aircraft_id)
+            if version is None:
+                raise AircraftNotFoundError(f"Aircraft with id {aircraft_id} not found.")
+
+        namespace, key = f"aircraft:{aircraft_id}", self._aircraft_key(version, self._fields_key(fields))
+        (cached,) = await self.cache.get_many([(namespace, key)])
+        if cached is not None:
+            return decode_model(self._display_schema(fields), cached)
+
+        generation = await self.cache.generation()
+        aircraft = await self._load_aircraft(aircraft_id, fields)
+        await self.cache.set_many([(namespace, key, encode_model(aircraft))], generation=generation)
+
+        return aircraft
+
+    async def _load_aircraft(self, aircraft_id: int, fields: frozenset[str] | None) -> BaseModel:
+        """Reads the aircraft returned by 'get_aircraft' from the database."""
+        query = self._aircrafts_query(fields=fields).where(Aircraft.aircraft_id == aircraft_id)
+
+        if fields is None:
+            aircraft = await self.session.scalar(query)
+        else:
+            aircraft = (await self.session.execute(query)).mappings().first()
+        if aircraft is None:
+            raise AircraftNotFoundError(f"Aircraft with id {aircraft_id} not found.")
+
+        return AircraftDisplaySchema.model_validate(aircraft) if fields is None else self._project(aircraft, fields)
+
+    async def display_aircrafts(
+        self,
+        after_id: int | None = None,
+        limit: int | None = None,
+        filters: AircraftFilterSchema | None = None,
+        fields: frozenset[str] | None = None,
+        fleet_version: int | None = None,
+    ) -> List[BaseModel]:
+        """
+        Returns a page of the aircraft in the database as a list, contains
+        the Aircraft objects, using the AircraftDisplaySchema. A cached page holds only the ids and versions of its
+        aircraft, which are fetched with a single multi-get from the entries shared with 'get_aircraft'. Pages are
+        keyed by the version of the fleet, so a page left by a write of another process is not served.
+
+        Arguments:
+            after_id: keyset cursor, only aircraft following it in the sort order are returned.
+            limit: maximum number of aircraft on the page, None returns all remaining aircraft.
+            filters: filters and sorting according to AircraftFilterSchema.
+            fields: names of the requested fields, None returns whole aircraft.
+            fleet_version: version of the fleet already read by the caller, read from the database when None.
+        """
+        if fleet_version is None:
+            fleet_version = await self.fleet_version()
+        filters = filters or AircraftFilterSchema()
+        fields_key = self._fields_key(fields)
+        page_key = f"{fleet_version}|{after_id}|{limit}|{filters.model_dump_json()}|{fields_key}"
+
+        (cached_page,) = await self.cache.get_many([("aircrafts", page_key)])
+        if cached_page is not None:
+            cached = await self.cache.get_many(
+                [
+                    (f"aircraft:{aircraft_id}", self._aircraft_key(version, fields_key))
+                    for aircraft_id, version in unpack(cached_page)
+                ]
+            )
+            if all(value is not None for value in cached):
+                schema = self._display_schema(fields)
+                return [decode_model(schema, value) for value in cached]
+
+        generation = await self.cache.generation()
+        aircrafts, versions = await self._load_aircrafts(after_id, limit, filters, fields)
+        await self.cache.set_many(
+            [
+                (
+                    "aircrafts",
+                    page_key,
+                    pack(tuple((aircraft.aircraft_id, version) for aircraft, version in zip(aircrafts, versions))),
+                ),
+                *(
+                    (
+                        f"aircraft:{aircraft.aircraft_id}",
+                        self._aircraft_key(version, fields_key),
+                        encode_model(aircraft),
+                    )
+                    for aircraft, version in zip(aircrafts, versions)
+                ),
+            ],
+            generation=generation,
+        )
+
+        return aircrafts
+
+    async def _load_aircrafts(
+        self, after_id: int | None, limit: int | None, filters: AircraftFilterSchema, fields: frozenset[str] | None
+    ) -> Tuple[List[BaseModel], List[int]]:
+        """
+        Reads the page of aircraft returned by 'display_aircrafts' from the database with the versions of the
+        aircraft. Whole aircraft are read as plain rows of their columns, without ORM objects in the identity map,
+        and validated in one batch.
+        """
+        query = self._aircrafts_query(
+            after_id=after_id, filters=filters, fields=AIRCRAFT_DISPLAY_COLUMNS if fields is None else fields
+        ).add_columns(Aircraft.version)
+        if limit is not None:
+            query = query.limit(limit)
+
+        all_aircrafts = (await self.session.execute(query)).mappings().all()
         if not all_aircrafts:
             logger.warning("No aircraft found in the database.")
 
-        return [AircraftDisplaySchema.model_validate(aircraft) for aircraft in all_aircrafts]
+        versions = [row["version"] for row in all_aircrafts]
+        if fields is None:
+            return aircraft_display_list.validate_python([self._nest(row) for row in all_aircrafts]), versions
+        return [self._project(row, fields) for row in all_aircrafts], versions
+
+    async def stream_aircrafts(
+        self,
+        after_id: int | None = None,
+        batch_size: int = 500,
+        filters: AircraftFilterSchema | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Yields aircraft one by one while fetching them from the database in batches of 'batch_size' rows,
+        so memory usage does not depend on the size of the fleet.
+
+        Arguments:
+            after_id: keyset cursor, only aircraft following it in the sort order are returned.
+            batch_size: number of rows fetched from the cursor at once.
+            filters: filters and sorting according to AircraftFilterSchema.
+            fields: names of the requested fields, None yields whole aircraft.
+
+        Yields:
+            Aircraft objects displayed according to AircraftDisplaySchema or to the schema of the requested fields.
+        """
+        query = self._aircrafts_query(
+            after_id=after_id, filters=filters, fields=AIRCRAFT_DISPLAY_COLUMNS if fields is None else fields
+        ).execution_options(yield_per=batch_size)
+
+        async for rows in (await self.session.stream(query)).mappings().partitions():
+            if fields is None:
+                for aircraft in aircraft_display_list.validate_python([self._nest(row) for row in rows]):
+                    yield aircraft
+            else:
+                for row in rows:
+                    yield self._project(row, fields)
 
-    def update_aircraft(self, aircraft_id: int, **kwargs) -> AircraftUpdateSchema | None:
+    async def approximate_count(self) -> int:
         """
-        Finds the aircraft instance based on the given 'id',
-        and updates the elements given as a keywords arguments.
+        Returns an estimate of the number of aircraft without scanning the whole table. PostgreSQL planner
+        statistics are used when available, otherwise the highest 'id' read from the primary key index.
+
+        Returns:
+            int: Approximate number of aircraft in the database.
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            estimate = await self.session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+                {"table_name": Aircraft.__tablename__},
+            )
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        return await self.session.scalar(select(func.max(Aircraft.aircraft_id))) or 0
+
+    async def performance_data(
+        self, aircraft_ids: Sequence[int] | None = None, after_id: int | None = None, limit: int | None = None
+    ) -> Dict[int, Row]:
+        """
+        Reads the data needed by the performance calculations of many aircraft in one query. Aircraft without
+        a positive fuel consumption or a cruise speed are left out.
+
+        Arguments:
+            aircraft_ids: 'id' of every aircraft, None reads the fleet ordered by 'id'.
+            after_id: keyset cursor of the fleet, only aircraft with a greater 'id' are read.
+            limit: maximum number of aircraft read from the fleet.
+
+        Returns:
+            Dict[int, Row]: 'name', 'version', 'cruise_speed', 'fuel_consumption', 'weight' and 'fuel'
+                by aircraft 'id'.
+        """
+        query = (
+            select(
+                Aircraft.aircraft_id,
+                Aircraft.name,
+                Aircraft.version,
+                AircraftData.cruise_speed,
+                AircraftData.fuel_consumption,
+                AircraftData.weight,
+                AircraftData.fuel,
+            )
+            .join(Aircraft.aircraft_data)
+            .where(AircraftData.cruise_speed.is_not(None), AircraftData.fuel_consumption > 0)
+            .order_by(Aircraft.aircraft_id)
+        )
+        if aircraft_ids is not None:
+            query = query.where(Aircraft.aircraft_id.in_(aircraft_ids))
+        if after_id is not None:
+            query = query.where(Aircraft.aircraft_id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        rows = await self.session.execute(query)
+
+        return {row.aircraft_id: row for row in rows}
+
+    async def capable_aircrafts(
+        self, distance: float, fuel: float, wind_speed: float = 0.0, limit: int | None = None
+    ) -> List[Mapping[str, Any]]:
+        """
+        Finds the aircraft whose range with the given fuel and wind speed reaches the distance, from the longest
+        range. Filtering, sorting and limiting happen in one query on the range expression of AircraftData;
+        the condition on 'cruise_speed' is implied by it but lets the database seek the performance index.
+
+        Arguments:
+            distance: Distance [km] the aircraft has to reach.
+            fuel: Fuel on board.
+            wind_speed: Wind speed added to the cruise speed, negative for a headwind.
+            limit: Maximum number of returned aircraft, None returns all of them.
+
+        Returns:
+            List[Mapping[str, Any]]: 'aircraft_id', 'name', 'range' and 'endurance_hours' of every aircraft.
+        """
+        aircraft_range = AircraftData.flight_range(fuel, wind_speed)
+        query = (
+            select(
+                Aircraft.aircraft_id,
+                Aircraft.name,
+                aircraft_range.label("range"),
+                AircraftData.endurance(fuel).label("endurance_hours"),
+            )
+            .join(Aircraft.aircraft_data)
+            .where(
+                AircraftData.cruise_speed > -wind_speed,
+                AircraftData.fuel_consumption > 0,
+                aircraft_range >= distance,
+            )
+            .order_by(aircraft_range.desc(), Aircraft.aircraft_id)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+
+        return (await self.session.execute(query)).mappings().all()
+
+    async def fleet_version(self) -> int:
+        """
+        Returns the version of the fleet, which changes with every write to the aircraft tables.
+
+        Returns:
+            int: Version of the fleet.
+        """
+        return await self.session.scalar(select(FleetState.version)) or 0
+
+    async def aircraft_version(self, aircraft_id: int) -> int | None:
+        """
+        Returns the version of the aircraft, which changes with every update of the aircraft or its data.
+
+        Arguments:
+            aircraft_id: 'id' of the aircraft.
+
+        Returns:
+            int | None: Version of the aircraft, None if it does not exist.
+        """
+        return await self.session.scalar(select(Aircraft.version).where(Aircraft.aircraft_id == aircraft_id))
+
+    async def _bump_fleet_version(self) -> int | None:
+        """
+        Increments the version of the fleet within the current transaction.
+
+        Returns:
+            int | None: New version of the fleet, None when it is not tracked yet.
+        """
+        return await self.session.scalar(
+            update(FleetState)
+            .values(version=FleetState.version + 1)
+            .returning(FleetState.version)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def search_aircrafts(
+        self, query: str, limit: int = 20, threshold: float = 0.3
+    ) -> List[AircraftDisplaySchema]:
+        """
+        Finds aircraft whose name or manufacturer starts with the query, followed by the ones similar to it.
+        PostgreSQL matches with the 'pg_trgm' GIN indexes, other databases with the in-memory n-gram index,
+        which is loaded on the first search and reloaded once the fleet version shows writes of other processes.
+
+        Arguments:
+            query: searched text.
+            limit: maximum number of returned aircraft.
+            threshold: minimum trigram similarity of a fuzzy match, between 0 and 1.
+
+        Returns:
+            List of matching aircraft displayed according to AircraftDisplaySchema, best matches first.
+        """
+        aircrafts_query = (
+            select(Aircraft).outerjoin(Aircraft.aircraft_data).options(contains_eager(Aircraft.aircraft_data))
+        )
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            pattern = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            is_prefix = or_(
+                Aircraft.name.ilike(pattern, escape="\\"), Aircraft.manufacturer.ilike(pattern, escape="\\")
+            )
+            similarity = func.greatest(
+                func.similarity(Aircraft.name, query), func.similarity(Aircraft.manufacturer, query)
+            )
+            await self.session.execute(
+                text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+                {"threshold": str(threshold)},
+            )
+            aircrafts = await self.session.scalars(
+                aircrafts_query.where(
+                    or_(is_prefix, Aircraft.name.op("%")(query), Aircraft.manufacturer.op("%")(query))
+                )
+                .order_by(case((is_prefix, 0), else_=1), similarity.desc(), Aircraft.aircraft_id)
+                .limit(limit)
+            )
+
+            return [AircraftDisplaySchema.model_validate(aircraft) for aircraft in aircrafts]
+
+        fleet_version = await self.fleet_version()
+        if not self.search_index.loaded or self.search_index.version != fleet_version:
+            rows = await self.session.execute(select(Aircraft.aircraft_id, Aircraft.name, Aircraft.manufacturer))
+            self.search_index.load(rows, version=fleet_version)
+            logger.info(f"Aircraft search index loaded at fleet version {fleet_version}.")
+
+        aircraft_ids = self.search_index.search(query, limit=limit, threshold=threshold)
+        aircrafts = {
+            aircraft.aircraft_id: aircraft
+            for aircraft in await self.session.scalars(aircrafts_query.where(Aircraft.aircraft_id.in_(aircraft_ids)))
+        }
+
+        return [
+            AircraftDisplaySchema.model_validate(aircrafts[aircraft_id])
+            for aircraft_id in aircraft_ids
+            if aircraft_id in aircrafts
+        ]
+
+    def _index_aircrafts(self, aircrafts: List[AircraftDisplaySchema]) -> None:
+        """
+        Adds the aircraft to the in-memory search index once it is loaded.
+
+        Arguments:
+            aircrafts: added aircraft.
+        """
+        if self.search_index.loaded:
+            for aircraft in aircrafts:
+                self.search_index.add(aircraft.aircraft_id, aircraft.name, aircraft.manufacturer)
+
+    async def _invalidate_cache(self, aircraft_ids: Iterable[int] = ()) -> None:
+        """
+        Removes the cached listing pages, the cached copies, the performance tables and the memoized flight times
+        of the aircraft after a committed write.
+
+        Arguments:
+            aircraft_ids: ids of the updated or deleted aircraft.
+        """
+        await self.cache.invalidate(["aircrafts", *(f"aircraft:{aircraft_id}" for aircraft_id in aircraft_ids)])
+        self.performance_tables.invalidate(aircraft_ids)
+        self.flight_time_memo.invalidate(aircraft_ids)
+
+    async def update_aircraft(self, aircraft_id: int, aircraft: AircraftUpdateSchema) -> AircraftDisplaySchema:
+        """
+        Finds the aircraft instance based on the given 'id', and updates the fields populated in the already
+        validated AircraftUpdateSchema. Every table is read or written with a single statement which returns
+        the persisted row, so no separate existence check or re-read is needed.
 
         Arguments:
             aircraft_id: id of the Aircraft instance to be updated.
-            **kwargs: keyword arguments to be updated using the AircraftUpdateSchema.
+            aircraft: fields to be updated using the AircraftUpdateSchema.
 
         Returns:
-            Aircraft object based on the AircraftUpdateSchema.
+            Updated Aircraft object as stored in the database, based on the AircraftDisplaySchema.
         """
-        if self.is_present(aircraft_id=aircraft_id):
-            try:
-                ac_values = AircraftUpdateSchema(**kwargs).model_dump(exclude={"aircraft_data"}, exclude_none=True)
-                ac_data_values = AircraftDataUpdateSchema(**kwargs.get("aircraft_data", {})).model_dump(
-                    exclude_none=True
+        ac_values = aircraft.model_dump(exclude={"aircraft_data"}, exclude_none=True)
+        ac_data_values = (
+            aircraft.aircraft_data.model_dump(exclude={"take_off_weight"}, exclude_none=True)
+            if aircraft.aircraft_data
+            else {}
+        )
+
+        if not ac_values and not ac_data_values:
+            raise InvalidDataError(
+                "No valid aircraft update data provided. Ensure that at least one field is populated."
+            )
+
+        try:
+            aircraft_row = await self._write_returning(
+                Aircraft, {**ac_values, "version": Aircraft.version + 1}, where=Aircraft.aircraft_id == aircraft_id
+            )
+            if aircraft_row is None:
+                raise AircraftNotFoundError(f"Aircraft with id {aircraft_id} not found.")
+
+            if {"weight", "fuel"} & ac_data_values.keys():
+                ac_data_values["take_off_weight"] = self._take_off_weight(
+                    weight=ac_data_values.get("weight", AircraftData.weight),
+                    fuel=ac_data_values.get("fuel", AircraftData.fuel),
                 )
+            aircraft_data_row = await self._write_returning(
+                AircraftData, ac_data_values, where=AircraftData.aircraft_id == aircraft_id
+            )
+
+            fleet_version = await self._bump_fleet_version()
+            await self.session.commit()
+            await self._invalidate_cache([aircraft_id])
+            self.search_index.update(aircraft_id, name=aircraft_row["name"], manufacturer=aircraft_row["manufacturer"])
+            self.search_index.advance(fleet_version)
+            logger.info(f"Aircraft with id {aircraft_id} updated successfully.")
 
-                if not ac_values and not ac_data_values:
-                    raise InvalidDataError(
-                        "No valid aircraft update data provided. Ensure that at least one field is populated."
+            return AircraftDisplaySchema.model_validate({**aircraft_row, "aircraft_data": aircraft_data_row})
+
+        except AircraftNotFoundError:
+            await self.session.rollback()
+            logger.error(f"Aircraft with id {aircraft_id} not found.")
+            raise
+
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.error(f"Integrity error updating aircraft: {str(e)}")
+            raise DatabaseIntegrityError(str(e))
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Unexpected error updating aircraft: {str(e)}")
+            raise AircraftRepositoryError(str(e))
+
+    async def update_aircrafts(
+        self, aircrafts: List[AircraftBulkUpdateSchema], chunk_size: int = 500
+    ) -> AircraftBulkResultSchema:
+        """
+        Updates many aircraft in a single transaction. Existing aircraft are found with one IN-list query per chunk,
+        then rows setting the same fields are written together with one executemany UPDATE per table.
+
+        Arguments:
+            aircrafts: fields to be updated using the AircraftBulkUpdateSchema, identified by 'aircraft_id'.
+            chunk_size: maximum number of ids in a single IN-list.
+
+        Returns:
+            Status of every requested aircraft according to AircraftBulkResultSchema.
+        """
+        aircraft_ids = list(dict.fromkeys(aircraft.aircraft_id for aircraft in aircrafts))
+
+        try:
+            existing_ids = set()
+            for start in range(0, len(aircraft_ids), chunk_size):
+                existing_ids.update(
+                    await self.session.scalars(
+                        select(Aircraft.aircraft_id).where(
+                            Aircraft.aircraft_id.in_(aircraft_ids[start : start + chunk_size])
+                        )
                     )
+                )
+
+            ac_groups, ac_data_groups = defaultdict(list), defaultdict(list)
+            for aircraft in aircrafts:
+                if aircraft.aircraft_id not in existing_ids:
+                    continue
 
+                ac_values = aircraft.model_dump(exclude={"aircraft_id", "aircraft_data"}, exclude_none=True)
                 if ac_values:
-                    self.session.query(Aircraft).filter_by(aircraft_id=aircraft_id).update(values={**ac_values})
+                    ac_groups[frozenset(ac_values)].append(self._bulk_parameters(aircraft.aircraft_id, ac_values))
 
-                if ac_data_values:
-                    self.session.query(AircraftData).filter_by(aircraft_id=aircraft_id).update(
-                        values={**ac_data_values}
-                    )
+                if aircraft.aircraft_data:
+                    ac_data_values = aircraft.aircraft_data.model_dump(exclude={"take_off_weight"}, exclude_none=True)
+                    if ac_data_values:
+                        ac_data_groups[frozenset(ac_data_values)].append(
+                            self._bulk_parameters(aircraft.aircraft_id, ac_data_values)
+                        )
+
+            for columns, rows in ac_groups.items():
+                await self.session.execute(self._bulk_update_statement(Aircraft, columns), rows)
 
-                self.session.commit()
-                self.session.close()
+            for columns, rows in ac_data_groups.items():
+                await self.session.execute(self._bulk_update_statement(AircraftData, columns), rows)
 
-                updated_aircraft = {
-                    **ac_values,
-                    "aircraft_data": {**ac_data_values},
+            updated_ids = sorted(existing_ids)
+            for start in range(0, len(updated_ids), chunk_size):
+                await self.session.execute(
+                    update(Aircraft)
+                    .where(Aircraft.aircraft_id.in_(updated_ids[start : start + chunk_size]))
+                    .values(version=Aircraft.version + 1)
+                    .execution_options(synchronize_session=False)
+                )
+            fleet_version = await self._bump_fleet_version() if updated_ids else None
+            await self.session.commit()
+            await self._invalidate_cache(updated_ids)
+            for aircraft in aircrafts:
+                self.search_index.update(aircraft.aircraft_id, name=aircraft.name, manufacturer=aircraft.manufacturer)
+            self.search_index.advance(fleet_version)
+            logger.info(f"{len(existing_ids)} aircraft updated successfully.")
+
+            return AircraftBulkResultSchema(
+                results={
+                    aircraft_id: BulkStatus.updated if aircraft_id in existing_ids else BulkStatus.not_found
+                    for aircraft_id in aircraft_ids
                 }
-                logger.info(f"Aircraft with id {aircraft_id} updated successfully.")
+            )
+
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.error(f"Integrity error updating aircraft: {str(e)}")
+            raise DatabaseIntegrityError(str(e))
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Unexpected error updating aircraft: {str(e)}")
+            raise AircraftRepositoryError(str(e))
+
+    @staticmethod
+    def _bulk_parameters(aircraft_id: int, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prefixes the values of a bulk UPDATE parameter set, as bound parameters may not be named after columns.
+
+        Arguments:
+            aircraft_id: id of the updated aircraft.
+            values: column values to be written.
+
+        Returns:
+            Parameter set of the statement built by '_bulk_update_statement'.
+        """
+        return {"b_aircraft_id": aircraft_id, **{f"b_{column}": value for column, value in values.items()}}
+
+    def _bulk_update_statement(self, model: type[Base], columns: frozenset):
+        """
+        Builds an UPDATE statement of the given columns, executed with many parameter sets at once. The row is
+        matched by the 'b_aircraft_id' parameter and take off weight follows changes of weight or fuel.
+
+        Arguments:
+            model: mapped class of the table.
+            columns: names of the columns set by every parameter set.
+
+        Returns:
+            Update statement of the model's table.
+        """
+        values = {column: bindparam(f"b_{column}") for column in columns}
+        if model is AircraftData and {"weight", "fuel"} & columns:
+            values["take_off_weight"] = self._take_off_weight(
+                weight=values.get("weight", AircraftData.weight),
+                fuel=values.get("fuel", AircraftData.fuel),
+            )
+
+        return (
+            update(model.__table__).where(model.__table__.c.aircraft_id == bindparam("b_aircraft_id")).values(**values)
+        )
+
+    async def _write_returning(self, model: type[Base], values: Dict[str, Any], where) -> Dict[str, Any] | None:
+        """
+        Updates the row matching 'where' and returns it, or only selects it when there is nothing to update.
+
+        Arguments:
+            model: mapped class of the table.
+            values: column values to be written.
+            where: criteria matching a single row.
+
+        Returns:
+            Column values of the persisted row, None if no row matches the criteria.
+        """
+        if values:
+            statement = (
+                update(model)
+                .where(where)
+                .values(**values)
+                .returning(*model.__table__.c)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            statement = select(*model.__table__.c).where(where)
 
-                return AircraftUpdateSchema.model_validate(updated_aircraft)
+        row = (await self.session.execute(statement)).one_or_none()
 
-            except NoResultFound as e:
-                logger.error(f"Aircraft with id {aircraft_id} not found: {str(e)}")
-                raise AircraftNotFoundError
+        return dict(row._mapping) if row is not None else None
 
-            except IntegrityError as e:
-                self.session.rollback()
-                logger.error(f"Integrity error updating aircraft: {str(e)}")
-                raise DatabaseIntegrityError(str(e))
+    @staticmethod
+    def _take_off_weight(weight, fuel):
+        """
+        Builds the take off weight written along with 'weight' or 'fuel', following the formula of the
+        AircraftDataBaseSchema. Columns passed instead of values refer to the currently stored ones.
+
+        Arguments:
+            weight: new weight or the AircraftData.weight column.
+            fuel: new fuel amount or the AircraftData.fuel column.
 
-            except Exception as e:
-                logger.error(f"Unexpected error updating aircraft: {str(e)}")
-                raise AircraftRepositoryError(str(e))
+        Returns:
+            SQL expression of the take off weight.
+        """
+        return weight + func.coalesce(fuel, 0) * AircraftDataBaseSchema.fuel_mass_ratio
 
-    def delete_aircraft(self, aircraft_id: int) -> Dict[str, str] | None:
+    async def delete_aircraft(self, aircraft_id: int) -> Dict[str, str]:
         """
-        Deletes the aircraft instance of given 'id' from the database.
+        Deletes the aircraft instance of given 'id' from the database with a single DELETE ... RETURNING statement,
+        AircraftData is removed by the database with ON DELETE CASCADE.
 
         Arguments:
               aircraft_id (int): The 'id' of the Aircraft to delete.
@@ -180,23 +1015,102 @@ class AircraftRepository:
                 Dict[str, str]: A confirmation message.
         """
         try:
-            if self.is_present(aircraft_id=aircraft_id):
-                self.session.query(Aircraft).filter_by(aircraft_id=aircraft_id).delete()
-                self.session.commit()
-                self.session.close()
-                logger.info(f"Aircraft with id {aircraft_id} deleted successfully.")
+            deleted_id = await self.session.scalar(
+                delete(Aircraft)
+                .where(Aircraft.aircraft_id == aircraft_id)
+                .returning(Aircraft.aircraft_id)
+                .execution_options(synchronize_session=False)
+            )
+            if deleted_id is None:
+                raise AircraftNotFoundError(f"Aircraft with id {aircraft_id} not found.")
 
-                return {"message": f"Aircraft with id {aircraft_id} deleted successfully."}
+            fleet_version = await self._bump_fleet_version()
+            await self.session.commit()
+            await self._invalidate_cache([aircraft_id])
+            self.search_index.remove(aircraft_id)
+            self.search_index.advance(fleet_version)
+            logger.info(f"Aircraft with id {aircraft_id} deleted successfully.")
 
-        except NoResultFound:
-            logger.error("Aircraft not found.")
-            raise AircraftNotFoundError(f"Aircraft with id {aircraft_id} not found.")
+            return {"message": f"Aircraft with id {aircraft_id} deleted successfully."}
+
+        except AircraftNotFoundError:
+            await self.session.rollback()
+            logger.error(f"Aircraft with id {aircraft_id} not found.")
+            raise
+
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.error(f"Integrity error deleting aircraft: {str(e)}")
+            raise DatabaseIntegrityError(str(e))
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Unexpected error deleting aircraft: {str(e)}")
+            raise AircraftRepositoryError(str(e))
+
+    async def delete_aircrafts(
+        self, criteria: AircraftBulkDeleteSchema, chunk_size: int = 500
+    ) -> AircraftBulkResultSchema:
+        """
+        Deletes all the aircraft matching every given criterion in a single transaction with DELETE ... RETURNING
+        statements, long id lists are split into IN-lists of 'chunk_size' ids. AircraftData is removed by the
+        database with ON DELETE CASCADE.
+
+        Arguments:
+            criteria: ids, type and manufacturer of the aircraft to delete using the AircraftBulkDeleteSchema.
+            chunk_size: maximum number of ids in a single IN-list.
+
+        Returns:
+            Status of every requested or matched aircraft according to AircraftBulkResultSchema.
+        """
+        conditions = []
+        if criteria.aircraft_type is not None:
+            conditions.append(Aircraft.aircraft_type == criteria.aircraft_type)
+        if criteria.manufacturer is not None:
+            conditions.append(Aircraft.manufacturer == criteria.manufacturer)
+
+        if criteria.aircraft_ids is None and not conditions:
+            raise InvalidDataError("No delete criteria provided. Ensure that at least one criterion is populated.")
+
+        aircraft_ids = list(dict.fromkeys(criteria.aircraft_ids or []))
+        id_chunks = (
+            [aircraft_ids[start : start + chunk_size] for start in range(0, len(aircraft_ids), chunk_size)]
+            if criteria.aircraft_ids is not None
+            else [None]
+        )
+
+        try:
+            deleted_ids = []
+            for id_chunk in id_chunks:
+                statement = delete(Aircraft).where(*conditions)
+                if id_chunk is not None:
+                    statement = statement.where(Aircraft.aircraft_id.in_(id_chunk))
+
+                deleted_ids.extend(
+                    await self.session.scalars(
+                        statement.returning(Aircraft.aircraft_id).execution_options(synchronize_session=False)
+                    )
+                )
+
+            fleet_version = await self._bump_fleet_version() if deleted_ids else None
+            await self.session.commit()
+            await self._invalidate_cache(deleted_ids)
+            for deleted_id in deleted_ids:
+                self.search_index.remove(deleted_id)
+            self.search_index.advance(fleet_version)
+            logger.info(f"{len(deleted_ids)} aircraft deleted successfully.")
+
+            results = dict.fromkeys(aircraft_ids, BulkStatus.not_found)
+            results.update(dict.fromkeys(deleted_ids, BulkStatus.deleted))
+
+            return AircraftBulkResultSchema(results=results)
 
         except IntegrityError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"Integrity error deleting aircraft: {str(e)}")
             raise DatabaseIntegrityError(str(e))
 
         except Exception as e:
+            await self.session.rollback()
             logger.error(f"Unexpected error deleting aircraft: {str(e)}")
             raise AircraftRepositoryError(str(e))
@@ -1,42 +1,217 @@
 # Third party imports
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Internal imports
-from src.config.database import get_db
+from src.config.database import get_db, settings
+from src.exceptions import AircraftNotFoundError, InvalidDataError
 from src.repository import AircraftRepository
 from src.schemas import (
+    AIRCRAFT_DATA_FIELDS,
+    AIRCRAFT_FIELDS,
     AircraftBaseSchema,
+    AircraftBulkCreateSchema,
+    AircraftBulkDeleteSchema,
+    AircraftBulkResultSchema,
+    AircraftBulkUpdateSchema,
     AircraftDisplaySchema,
+    AircraftFilterSchema,
     AircraftUpdateSchema,
+    InputAircraftPerformanceBatchSchema,
     InputAircraftPerformanceEnduranceSchema,
     InputAircraftPerformanceRangeSchema,
+    InputPerformanceSweepSchema,
+    OutputAircraftPerformanceBatchSchema,
+    OutputAircraftPerformanceCapableSchema,
     OutputAircraftPerformanceEnduranceSchema,
+    OutputAircraftPerformancePolarSchema,
     OutputAircraftPerformanceRangeSchema,
+    OutputReachableAirportsSchema,
+    PerformanceEngine,
 )
 from src.use_cases.performance import Performance
+from src.use_cases.sweep import PerformanceSweep, get_sweep_executor
+from src.use_cases.weather import live_wind_speed
+from src.utils.http_cache import etag_matches, make_etag, revalidation_headers
+from src.utils.responses import json_response
 
 router = APIRouter(prefix="/aircrafts")
 
 
+def aircraft_fields(
+    fields: str | None = Query(
+        default=None,
+        description="Comma separated fields to return, 'aircraft_data' selects all the data fields. "
+        "'aircraft_id' is always returned.",
+    ),
+) -> frozenset[str] | None:
+    """Parses the sparse fieldset of the read endpoints.
+
+    Arguments:
+        fields {str} -- Comma separated names of Aircraft and AircraftData fields.
+
+    Returns:
+        frozenset[str] -- Names of the requested fields with 'aircraft_id', None when all the fields are requested.
+    """
+    if fields is None:
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    if "aircraft_data" in requested:
+        requested = (requested - {"aircraft_data"}) | set(AIRCRAFT_DATA_FIELDS)
+    if unknown := requested.difference(AIRCRAFT_FIELDS, AIRCRAFT_DATA_FIELDS):
+        raise InvalidDataError(message=f"Unknown fields: {', '.join(sorted(unknown))}.")
+
+    return frozenset(requested | {"aircraft_id"})
+
+
+async def ndjson_lines(aircrafts: AsyncIterator[BaseModel], session: AsyncSession) -> AsyncIterator[str]:
+    """Serializes aircraft into newline delimited JSON and closes the session once the stream is exhausted.
+
+    Arguments:
+        aircrafts {AsyncIterator[BaseModel]} -- Aircraft objects fetched lazily from the database,
+        session {AsyncSession} -- Database session the aircraft are fetched with.
+
+    Yields:
+        str -- One JSON document per line.
+    """
+    try:
+        async for aircraft in aircrafts:
+            yield aircraft.model_dump_json() + "\n"
+    finally:
+        await session.close()
+
+
 @router.get(
     path="/",
     response_model=list[AircraftDisplaySchema],
     status_code=status.HTTP_200_OK,
 )
 async def show_aircrafts(
-    session: Session = Depends(get_db),
+    response: Response,
+    after_id: int | None = Query(default=None, ge=0),
+    limit: int = Query(default=settings.page_size, ge=1, le=settings.max_page_size),
+    stream: bool = False,
+    approximate_total: bool = False,
+    filters: AircraftFilterSchema = Depends(),
+    fields: frozenset[str] | None = Depends(aircraft_fields),
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_db),
 ) -> list[AircraftDisplaySchema]:
-    """Shows all the Aircraft objects in the database.
+    """Shows the Aircraft objects in the database, filtered and sorted in the database, one keyset-paginated
+    page at a time. With 'fields' only the requested columns are read and returned. Responses are tagged with
+    the version of the fleet, a matching 'If-None-Match' header is answered with 304 without reading the aircraft.
+
+    Arguments:
+        response {Response} -- Response object used to set pagination headers,
+        after_id {int} -- 'id' of the last aircraft from the previous page,
+        limit {int} -- Maximum number of aircraft on the page,
+        stream {bool} -- Streams all the remaining aircraft as NDJSON instead of returning a single page,
+        approximate_total {bool} -- Adds an estimated number of aircraft in the 'X-Total-Count-Approximate' header,
+        filters {AircraftFilterSchema} -- Type, manufacturer and numeric range filters with the sort order,
+        fields {frozenset[str]} -- Requested fields, all fields when None,
+        if_none_match {str} -- Entity tags of the representations held by the client,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        list[AircraftDisplaySchema] -- List of Aircraft objects, restricted to the requested fields.
+    """
+    aircraft_repo = AircraftRepository(session)
+    fleet_version = await aircraft_repo.fleet_version()
+    headers = revalidation_headers(make_etag("fleet", fleet_version))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if approximate_total:
+        headers["X-Total-Count-Approximate"] = str(await aircraft_repo.approximate_count())
+
+    if stream:
+        return StreamingResponse(
+            content=ndjson_lines(
+                aircrafts=aircraft_repo.stream_aircrafts(
+                    after_id=after_id, batch_size=settings.stream_batch_size, filters=filters, fields=fields
+                ),
+                session=session,
+            ),
+            media_type="application/x-ndjson",
+            headers=headers,
+        )
+
+    aircrafts = await aircraft_repo.display_aircrafts(
+        after_id=after_id, limit=limit, filters=filters, fields=fields, fleet_version=fleet_version
+    )
+    if len(aircrafts) == limit:
+        headers["X-Next-After-Id"] = str(aircrafts[-1].aircraft_id)
+
+    return json_response(aircrafts, headers=headers, response=response, validate=fields is None)
+
+
+@router.get(
+    path="/search",
+    response_model=list[AircraftDisplaySchema],
+    status_code=status.HTTP_200_OK,
+)
+async def search_aircrafts(
+    q: str = Query(min_length=1),
+    limit: int = Query(default=settings.search_limit, ge=1, le=settings.max_page_size),
+    session: AsyncSession = Depends(get_db),
+) -> list[AircraftDisplaySchema]:
+    """Finds Aircraft objects by prefix or fuzzy match of their name and manufacturer.
+
+    Arguments:
+        q {str} -- Searched text,
+        limit {int} -- Maximum number of returned aircraft,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        list[AircraftDisplaySchema] -- Matching Aircraft objects, best matches first.
+    """
+    aircraft_repo = AircraftRepository(session)
+    return json_response(
+        await aircraft_repo.search_aircrafts(q, limit=limit, threshold=settings.search_similarity_threshold)
+    )
+
+
+@router.get(
+    path="/{aircraft_id:int}",
+    response_model=AircraftDisplaySchema,
+    status_code=status.HTTP_200_OK,
+)
+async def show_aircraft(
+    aircraft_id: int,
+    response: Response,
+    fields: frozenset[str] | None = Depends(aircraft_fields),
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_db),
+) -> AircraftDisplaySchema:
+    """Shows a single Aircraft object from the database. Responses are tagged with the version of the aircraft,
+    a matching 'If-None-Match' header is answered with 304 without reading the aircraft.
 
     Arguments:
-        session {Session} -- Database session.
+        aircraft_id {int} -- Aircraft ID,
+        response {Response} -- Response object used to set caching headers,
+        fields {frozenset[str]} -- Requested fields, all fields when None,
+        if_none_match {str} -- Entity tags of the representations held by the client,
+        session {AsyncSession} -- Database session.
 
     Returns:
-        list[AircraftDisplaySchema] -- List of Aircraft objects.
+        AircraftDisplaySchema -- Aircraft object, restricted to the requested fields.
     """
     aircraft_repo = AircraftRepository(session)
-    return aircraft_repo.display_aircrafts()
+    version = await aircraft_repo.aircraft_version(aircraft_id)
+    if version is None:
+        raise AircraftNotFoundError(f"Aircraft with id {aircraft_id} not found.")
+
+    headers = revalidation_headers(make_etag("aircraft", aircraft_id, version))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    aircraft = await aircraft_repo.get_aircraft(aircraft_id, fields=fields, version=version)
+    return json_response(aircraft, headers=headers, response=response, validate=fields is None)
 
 
 @router.post(
@@ -44,64 +219,137 @@ async def show_aircrafts(
     response_model=AircraftDisplaySchema,
     status_code=status.HTTP_201_CREATED,
 )
-def input_aircraft(aircraft: AircraftBaseSchema, session: Session = Depends(get_db)) -> AircraftDisplaySchema:
+async def input_aircraft(
+    aircraft: AircraftBaseSchema, session: AsyncSession = Depends(get_db)
+) -> AircraftDisplaySchema:
     """Adds an Aircraft object to the database.
 
     Arguments:
         aircraft {AircraftDataBaseSchema} -- Aircraft object,
-        session {Session} -- Database session.
+        session {AsyncSession} -- Database session.
 
     Returns:
         AircraftBaseSchema -- added Aircraft object.
     """
     aircraft_repo = AircraftRepository(session)
-    return aircraft_repo.add_aircraft(aircraft)
+    return json_response(await aircraft_repo.add_aircraft(aircraft), status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    path="/bulk",
+    response_model=AircraftBulkCreateSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def input_aircrafts(
+    aircrafts: list[AircraftBaseSchema],
+    chunk_size: int = Query(default=settings.bulk_chunk_size, ge=1, le=settings.max_bulk_chunk_size),
+    session: AsyncSession = Depends(get_db),
+) -> AircraftBulkCreateSchema:
+    """Adds many Aircraft objects to the database in one transaction.
+
+    Arguments:
+        aircrafts {list[AircraftBaseSchema]} -- Aircraft objects,
+        chunk_size {int} -- Number of aircraft inserted per batched statement,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        AircraftBulkCreateSchema -- added Aircraft objects and errors of the rejected ones.
+    """
+    aircraft_repo = AircraftRepository(session)
+    return json_response(
+        await aircraft_repo.add_aircrafts(aircrafts, chunk_size=chunk_size), status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.patch(
+    path="/bulk",
+    response_model=AircraftBulkResultSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def modify_aircrafts(
+    aircrafts: list[AircraftBulkUpdateSchema],
+    chunk_size: int = Query(default=settings.bulk_chunk_size, ge=1, le=settings.max_bulk_chunk_size),
+    session: AsyncSession = Depends(get_db),
+) -> AircraftBulkResultSchema:
+    """Updates many Aircraft objects in the database in one transaction.
+
+    Arguments:
+        aircrafts {list[AircraftBulkUpdateSchema]} -- Aircraft ids with the fields to update,
+        chunk_size {int} -- Maximum number of ids in a single IN-list,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        AircraftBulkResultSchema -- Status of every requested Aircraft object.
+    """
+    aircraft_repo = AircraftRepository(session)
+    return json_response(await aircraft_repo.update_aircrafts(aircrafts, chunk_size=chunk_size))
+
+
+@router.delete(
+    path="/bulk",
+    response_model=AircraftBulkResultSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def remove_aircrafts(
+    criteria: AircraftBulkDeleteSchema,
+    chunk_size: int = Query(default=settings.bulk_chunk_size, ge=1, le=settings.max_bulk_chunk_size),
+    session: AsyncSession = Depends(get_db),
+) -> AircraftBulkResultSchema:
+    """Deletes all the Aircraft objects matching the criteria in one transaction.
+
+    Arguments:
+        criteria {AircraftBulkDeleteSchema} -- Ids, type and manufacturer of the Aircraft objects to delete,
+        chunk_size {int} -- Maximum number of ids in a single IN-list,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        AircraftBulkResultSchema -- Status of every requested or matched Aircraft object.
+    """
+    aircraft_repo = AircraftRepository(session)
+    return json_response(await aircraft_repo.delete_aircrafts(criteria, chunk_size=chunk_size))
 
 
 @router.patch(
     path="/update_aircraft/{aircraft_id}",
-    response_model=AircraftUpdateSchema,
+    response_model=AircraftDisplaySchema,
     status_code=status.HTTP_200_OK,
 )
-def modify_aircraft(
+async def modify_aircraft(
     aircraft_id: int,
     aircraft: AircraftUpdateSchema,
-    session: Session = Depends(get_db),
-) -> AircraftUpdateSchema:
+    session: AsyncSession = Depends(get_db),
+) -> AircraftDisplaySchema:
     """Updates an Aircraft object in the database.
 
     Arguments:
         aircraft_id {int} -- Aircraft ID,
         aircraft {AircraftUpdateSchema} -- Aircraft object in the shape of AircraftUpdateSchema,
-        session {Session} -- Database session.
+        session {AsyncSession} -- Database session.
 
     Returns:
-        AircraftUpdateSchema -- Updated Aircraft object.
+        AircraftDisplaySchema -- Updated Aircraft object as stored in the database.
     """
     aircraft_repo = AircraftRepository(session)
-    return aircraft_repo.update_aircraft(aircraft_id, **aircraft.model_dump(exclude_none=True))
+    return json_response(await aircraft_repo.update_aircraft(aircraft_id, aircraft))
 
 
 @router.delete(
     path="/delete_aircraft/{aircraft_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def remove_aircraft(aircraft_id: int, session: Session = Depends(get_db)):
+async def remove_aircraft(aircraft_id: int, session: AsyncSession = Depends(get_db)):
     """Deletes an Aircraft object from the database.
 
     Arguments:
         aircraft_id {int} -- Aircraft ID,
-        session {Session} -- Database session.
+        session {AsyncSession} -- Database session.
 
     Returns:
         dict -- confirmation message that Aircraft object was deleted.
     """
-    try:
-        aircraft_repo = AircraftRepository(session)
-        aircraft_repo.delete_aircraft(aircraft_id)
-        return {"message": "Aircraft deleted."}
-    except ValueError as err:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err))
+    aircraft_repo = AircraftRepository(session)
+    await aircraft_repo.delete_aircraft(aircraft_id)
+    return {"message": "Aircraft deleted."}
 
 
 @router.get(
@@ -111,21 +359,50 @@ def remove_aircraft(aircraft_id: int, session: Session = Depends(get_db)):
     response_model=OutputAircraftPerformanceRangeSchema,
     status_code=status.HTTP_200_OK,
 )
-def get_range(
+async def get_range(
+    response: Response,
     aircraft: InputAircraftPerformanceRangeSchema = Depends(),
-    session: Session = Depends(get_db),
+    location: str | None = Query(default=None, description="Location of the live wind, when no 'wind_speed' is given."),
+    heading: float | None = Query(default=None, ge=0, lt=360, description="Track of the aircraft for the live wind."),
+    lookup_table: bool = Query(default=False),
+    engine: PerformanceEngine = PerformanceEngine.linear,
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_db),
 ) -> OutputAircraftPerformanceRangeSchema:
     """Gets range of the aircraft based on the data given according to InputAircraftPerformanceSchema.
+    Without 'wind_speed' the live wind of the location is read from the weather cache, as its component on the
+    heading. The result depends only on the input, the wind and the stored aircraft, so it is tagged with the version
+    of the aircraft and the wind.
 
     Arguments:
+        response {Response} -- Response object used to set caching headers,
         aircraft {InputAircraftPerformanceRangeSchema} -- Aircraft object,
-        session {Session} -- Database session.
+        location {str} -- Location of the live wind,
+        heading {float} -- Track of the aircraft [deg], the live wind is a headwind when not given,
+        lookup_table {bool} -- Whether to interpolate in the precomputed performance table of the aircraft,
+        engine {PerformanceEngine} -- Linear or Breguet performance model,
+        if_none_match {str} -- Entity tags of the representations held by the client,
+        session {AsyncSession} -- Database session.
 
     Returns:
         OutputAircraftPerformanceRangeSchema -- Name and range of the aircraft.
     """
+    if aircraft.wind_speed is None:
+        aircraft = aircraft.model_copy(update={"wind_speed": live_wind_speed(location, heading)})
+        response.headers["X-Wind-Speed"] = str(aircraft.wind_speed)
+
+    version = await AircraftRepository(session).aircraft_version(aircraft.aircraft_id)
+    if version is not None:
+        headers = revalidation_headers(make_etag("range", aircraft.aircraft_id, version, aircraft.wind_speed))
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
     performance = Performance(session)
-    return performance.calculate_range(aircraft)
+    return json_response(
+        await performance.calculate_range(aircraft, lookup_table=lookup_table, engine=engine),
+        headers=dict(response.headers),
+    )
 
 
 @router.get(
@@ -135,18 +412,243 @@ def get_range(
     response_model=OutputAircraftPerformanceEnduranceSchema,
     status_code=status.HTTP_200_OK,
 )
-def get_endurance(
+async def get_endurance(
+    response: Response,
     aircraft: InputAircraftPerformanceEnduranceSchema = Depends(),
-    session: Session = Depends(get_db),
+    lookup_table: bool = Query(default=False),
+    engine: PerformanceEngine = PerformanceEngine.linear,
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_db),
 ) -> OutputAircraftPerformanceEnduranceSchema:
     """Gets endurance of the aircraft based on the data given according to InputAircraftPerformanceEnduranceSchema.
+    The result depends only on the input and the stored aircraft, so it is tagged with the version of the aircraft.
 
     Arguments:
+        response {Response} -- Response object used to set caching headers,
         aircraft {InputAircraftPerformanceEnduranceSchema} -- Aircraft object,
-        session {Session} -- Database session.
+        lookup_table {bool} -- Whether to interpolate in the precomputed performance table of the aircraft,
+        engine {PerformanceEngine} -- Linear or Breguet performance model,
+        if_none_match {str} -- Entity tags of the representations held by the client,
+        session {AsyncSession} -- Database session.
 
     Returns:
         OutputAircraftPerformanceEnduranceSchema -- Name and endurance of the aircraft.
     """
+    version = await AircraftRepository(session).aircraft_version(aircraft.aircraft_id)
+    if version is not None:
+        headers = revalidation_headers(make_etag("endurance", aircraft.aircraft_id, version))
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    performance = Performance(session)
+    return json_response(
+        await performance.calculate_endurance(aircraft, lookup_table=lookup_table, engine=engine),
+        headers=dict(response.headers),
+    )
+
+
+@router.post(
+    path="/performance/batch",
+    response_model=OutputAircraftPerformanceBatchSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_performance_batch(
+    batch: InputAircraftPerformanceBatchSchema,
+    session: AsyncSession = Depends(get_db),
+) -> OutputAircraftPerformanceBatchSchema:
+    """Gets range and endurance of many aircraft for every combination of the given fuel amounts and wind speeds.
+
+    Arguments:
+        batch {InputAircraftPerformanceBatchSchema} -- Aircraft IDs, fuel amounts and wind speeds,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        OutputAircraftPerformanceBatchSchema -- Range and endurance grids of the aircraft and IDs of the missing ones.
+    """
+    performance = Performance(session)
+    return json_response(await performance.calculate_batch(batch))
+
+
+@router.get(
+    path="/performance/capable",
+    response_model=list[OutputAircraftPerformanceCapableSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_capable_aircrafts(
+    response: Response,
+    distance: float = Query(gt=0),
+    fuel: float = Query(gt=0),
+    wind: float = 0.0,
+    limit: int = Query(default=settings.page_size, ge=1, le=settings.max_page_size),
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_db),
+) -> list[OutputAircraftPerformanceCapableSchema]:
+    """Gets the aircraft able to fly the distance with the given fuel and wind, from the longest range.
+    The result depends on the whole fleet, so it is tagged with the version of the fleet.
+
+    Arguments:
+        response {Response} -- Response object used to set caching headers,
+        distance {float} -- Distance [km] the aircraft has to reach,
+        fuel {float} -- Fuel on board,
+        wind {float} -- Wind speed added to the cruise speed, negative for a headwind,
+        limit {int} -- Maximum number of returned aircraft,
+        if_none_match {str} -- Entity tags of the representations held by the client,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        list[OutputAircraftPerformanceCapableSchema] -- Aircraft with their range and endurance.
+    """
+    headers = revalidation_headers(make_etag("fleet", await AircraftRepository(session).fleet_version()))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     performance = Performance(session)
-    return performance.calculate_endurance(aircraft)
+    return json_response(
+        await performance.find_capable(distance, fuel, wind_speed=wind, limit=limit), headers=headers, response=response
+    )
+
+
+@router.get(
+    path="/performance/polar",
+    response_model=OutputAircraftPerformancePolarSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_range_polar(
+    response: Response,
+    fuel: float = Query(gt=0),
+    wind_speed: float = Query(default=0.0, ge=0),
+    wind_direction: float = 0.0,
+    heading_step: float = Query(default=1.0, gt=0, le=90),
+    aircraft_ids: list[int] | None = Query(default=None),
+    after_id: int | None = Query(default=None, ge=0),
+    limit: int = Query(default=settings.page_size, ge=1, le=settings.max_page_size),
+    binary: bool = False,
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_db),
+) -> OutputAircraftPerformancePolarSchema:
+    """Gets the range of the aircraft on every heading with the head, tail and crosswind components of the wind,
+    for the given aircraft or for a page of the fleet. With 'binary' the ranges are returned as a little-endian
+    float32 matrix of shape (aircraft, headings), with the aircraft IDs in the 'X-Aircraft-Ids' header.
+
+    Arguments:
+        response {Response} -- Response object used to set caching headers,
+        fuel {float} -- Fuel on board,
+        wind_speed {float} -- Wind speed,
+        wind_direction {float} -- Direction the wind blows from [deg],
+        heading_step {float} -- Step between the headings [deg],
+        aircraft_ids {list[int]} -- Aircraft IDs, a page of the fleet when None,
+        after_id {int} -- 'id' of the last aircraft from the previous fleet page,
+        limit {int} -- Maximum number of aircraft on the fleet page,
+        binary {bool} -- Returns the ranges as a binary float32 matrix,
+        if_none_match {str} -- Entity tags of the representations held by the client,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        OutputAircraftPerformancePolarSchema -- Ranges of the aircraft on every heading.
+    """
+    headers = revalidation_headers(make_etag("fleet", await AircraftRepository(session).fleet_version()))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    performance = Performance(session)
+    if binary:
+        performance_data, headings, ranges = await performance.range_polar(
+            fuel, wind_speed, wind_direction, heading_step, aircraft_ids=aircraft_ids, after_id=after_id, limit=limit
+        )
+        headers["X-Aircraft-Ids"] = ",".join(map(str, performance_data))
+        headers["X-Heading-Step"] = str(heading_step)
+        return Response(content=ranges.astype("<f4").tobytes(), media_type="application/octet-stream", headers=headers)
+
+    return json_response(
+        await performance.calculate_polar(
+            fuel, wind_speed, wind_direction, heading_step, aircraft_ids=aircraft_ids, after_id=after_id, limit=limit
+        ),
+        headers=headers,
+        response=response,
+    )
+
+
+@router.get(
+    path="/performance/reachable",
+    response_model=OutputReachableAirportsSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_reachable_airports(
+    response: Response,
+    latitude: float = Query(ge=-90, le=90),
+    longitude: float = Query(ge=-180, le=180),
+    fuel: float = Query(gt=0),
+    wind_speed: float = Query(default=0.0, ge=0),
+    wind_direction: float = 0.0,
+    aircraft_ids: list[int] = Query(min_length=1, max_length=settings.max_reachable_aircraft),
+    limit: int = Query(default=settings.page_size, ge=1, le=settings.max_page_size),
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_db),
+) -> OutputReachableAirportsSchema:
+    """Gets the airports every aircraft can reach from the origin with the fuel on board in the wind, found with
+    a radius query of the in-memory airport index.
+
+    Arguments:
+        response {Response} -- Response object used to set caching headers,
+        latitude {float} -- Latitude of the origin [deg],
+        longitude {float} -- Longitude of the origin [deg],
+        fuel {float} -- Fuel on board,
+        wind_speed {float} -- Wind speed,
+        wind_direction {float} -- Direction the wind blows from [deg],
+        aircraft_ids {list[int]} -- Aircraft IDs,
+        limit {int} -- Maximum number of airports per aircraft, from the nearest,
+        if_none_match {str} -- Entity tags of the representations held by the client,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        OutputReachableAirportsSchema -- Reachable airports of every aircraft.
+    """
+    headers = revalidation_headers(make_etag("fleet", await AircraftRepository(session).fleet_version()))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return json_response(
+        await Performance(session).reachable_airports(
+            latitude, longitude, fuel, wind_speed, wind_direction, aircraft_ids=aircraft_ids, limit=limit
+        ),
+        headers=headers,
+        response=response,
+    )
+
+
+@router.post(
+    path="/performance/sweep",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def sweep_performance(
+    sweep: InputPerformanceSweepSchema,
+    binary: bool = False,
+    session: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Sweeps the range of the aircraft, of the whole fleet when no IDs are given, over every combination of fuel,
+    wind speed and heading. Chunks of aircraft are evaluated on a process pool and streamed as they complete, as
+    newline delimited JSON or, with 'binary', as frames of a length-prefixed JSON header and float32 ranges.
+
+    Arguments:
+        sweep {InputPerformanceSweepSchema} -- Aircraft IDs and grid of the sweep,
+        binary {bool} -- Streams binary frames instead of JSON lines,
+        session {AsyncSession} -- Database session.
+
+    Returns:
+        StreamingResponse -- Grid of the sweep followed by the ranges of every chunk with the progress.
+    """
+    performance_sweep = PerformanceSweep.from_performance_data(
+        await AircraftRepository(session).performance_data(sweep.aircraft_ids), sweep
+    )
+    if binary:
+        return StreamingResponse(
+            performance_sweep.frames(get_sweep_executor(), settings.sweep_chunk_points),
+            media_type="application/octet-stream",
+        )
+
+    return StreamingResponse(
+        performance_sweep.ndjson_lines(get_sweep_executor(), settings.sweep_chunk_points),
+        media_type="application/x-ndjson",
+    )
@@ -0,0 +1,102 @@
+# Third party imports
+import math
+
+from fastapi import APIRouter, status
+
+# Internal imports
+from src.router.weather_api import WeatherProviders
+from src.schemas import (
+    CacheStatsSchema,
+    WeatherCacheStatsSchema,
+    WeatherProvidersStatsSchema,
+    WeatherProviderStatsSchema,
+)
+from src.use_cases.weather import weather_cache, weather_providers
+from src.utils.cache import CacheBackend, cache_backend
+
+router = APIRouter(prefix="/monitoring")
+
+CACHES = {"shared": cache_backend}
+
+
+def cache_stats(cache: CacheBackend) -> CacheStatsSchema:
+    """Collects the counters, occupancy and limits of the cache.
+
+    Arguments:
+        cache {CacheBackend} -- Monitored cache.
+
+    Returns:
+        CacheStatsSchema -- Statistics of the cache.
+    """
+    return CacheStatsSchema(**vars(cache.stats), **cache.occupancy())
+
+
+@router.get(
+    path="/caches",
+    response_model=dict[str, CacheStatsSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def show_caches() -> dict[str, CacheStatsSchema]:
+    """Shows the statistics of the caches.
+
+    Returns:
+        dict[str, CacheStatsSchema] -- Statistics of every cache by its name.
+    """
+    return {name: cache_stats(cache) for name, cache in CACHES.items()}
+
+
+@router.get(
+    path="/weather",
+    response_model=WeatherCacheStatsSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def show_weather_cache() -> WeatherCacheStatsSchema:
+    """Shows the statistics of the weather cache.
+
+    Returns:
+        WeatherCacheStatsSchema -- Counters and occupancy of the weather cache.
+    """
+    return WeatherCacheStatsSchema(**vars(weather_cache.stats), **weather_cache.occupancy())
+
+
+def providers_stats(providers: WeatherProviders) -> WeatherProvidersStatsSchema:
+    """Collects the circuit breaker states and latencies of the weather providers.
+
+    Arguments:
+        providers {WeatherProviders} -- Monitored weather providers.
+
+    Returns:
+        WeatherProvidersStatsSchema -- Health of the providers, in the order they are tried.
+    """
+    stats = []
+    for provider in providers.ranked():
+        health = providers.health[provider]
+        p50, p95 = health.latency.percentile(50), health.latency.percentile(95)
+        stats.append(
+            WeatherProviderStatsSchema(
+                api_url=provider.api_url,
+                state=health.breaker.state.value,
+                failures=health.breaker.failures,
+                opened=health.breaker.opened,
+                samples=len(health.latency),
+                p50_ms=None if p50 is None else p50 * 1000,
+                p95_ms=None if p95 is None else p95 * 1000,
+                rate_tokens=None if math.isinf(health.limiter.rate) else health.limiter.tokens,
+            )
+        )
+
+    return WeatherProvidersStatsSchema(retry_tokens=providers.retry_budget.tokens, providers=stats)
+
+
+@router.get(
+    path="/weather/providers",
+    response_model=WeatherProvidersStatsSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def show_weather_providers() -> WeatherProvidersStatsSchema:
+    """Shows the circuit breakers, latencies and retry budget of the weather providers.
+
+    Returns:
+        WeatherProvidersStatsSchema -- Health of the weather providers.
+    """
+    return providers_stats(weather_providers)
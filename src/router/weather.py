@@ -0,0 +1,28 @@
+# Third party imports
+from fastapi import APIRouter, status
+
+# Internal imports
+from src.schemas import InputWeatherStationsSchema, OutputWeatherStationsSchema
+from src.use_cases.weather import weather_stations
+from src.utils.responses import json_response
+
+router = APIRouter(prefix="/weather")
+
+
+@router.post(
+    path="/stations",
+    response_model=OutputWeatherStationsSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_weather_stations(stations: InputWeatherStationsSchema) -> OutputWeatherStationsSchema:
+    """Gets the observations of many locations at once. Cached observations are served at once, the missing ones
+    are fetched concurrently within the 'WEATHER_FETCH_CONCURRENCY' and the rate limits of the providers, every
+    distinct location once.
+
+    Arguments:
+        stations {InputWeatherStationsSchema} -- Queried locations.
+
+    Returns:
+        OutputWeatherStationsSchema -- Observations in numbers, in the order of the locations.
+    """
+    return json_response(await weather_stations(stations.locations))
@@ -1,13 +1,29 @@
 # Third party imports
+import asyncio
 import datetime
+import hashlib
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import astuple, dataclass, fields
+from enum import Enum
 from logging import INFO, basicConfig, getLogger
+from typing import Awaitable, Callable, Dict, List, Sequence
 
-import requests
+import httpx
 
 # Internal imports
 from src.config.database import settings
+from src.exceptions import WeatherProviderError
+from src.utils.cache import CacheBackend, cache_backend
+from src.utils.codec import pack, unpack
+from src.utils.resilience import (
+    BreakerState,
+    CircuitBreaker,
+    LatencyTracker,
+    RetryBudget,
+    TokenBucket,
+    backoff_delay,
+)
 
 basicConfig(level=INFO, format="[%(levelname)s] %(message)s")
 logger = getLogger()
@@ -53,6 +69,7 @@ class FieldsMapper:
         current_wind_speed: Key for wind speed.
         current_wind_direction: Key for wind direction.
         current_temperature: Key for temperature.
+        query_param: Request parameter of the queried location.
     """
 
     location: str = None
@@ -62,6 +79,7 @@ class FieldsMapper:
     current_wind_speed: str = None
     current_wind_direction: str = None
     current_temperature: str = None
+    query_param: str = None
 
 
 @dataclass
@@ -84,6 +102,44 @@ class WeatherData:
     current_temperature: str = None
 
 
+def unknown_weather_data() -> WeatherData:
+    """Returns the weather data reported when no provider answered."""
+    return WeatherData(*(["Unknown"] * len(fields(WeatherData))))
+
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the HTTP client shared by the weather providers, created on the first use. Its connection pool keeps
+    the connections to the providers alive between requests, and every request is bounded by the connect timeout
+    'WEATHER_CONNECT_TIMEOUT' and the read, write and pool timeout 'WEATHER_READ_TIMEOUT'.
+
+    Returns:
+        The shared httpx.AsyncClient.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.weather_read_timeout, connect=settings.weather_connect_timeout),
+            limits=httpx.Limits(
+                max_connections=settings.weather_max_connections,
+                max_keepalive_connections=settings.weather_max_connections,
+            ),
+        )
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Closes the connections of the shared HTTP client, if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class WeatherApi:
     """
     A class to interact with a weather API and fetch weather data.
@@ -92,6 +148,7 @@ class WeatherApi:
         api_url: Base URL of the weather API.
         api_key: API key for authentication.
         fields: An instance of FieldsMapper for mapping API response fields.
+        client: HTTP client of the requests, the shared pooled client when not given.
         api_params: Additional parameters to pass to the API request.
     """
 
@@ -100,60 +157,81 @@ class WeatherApi:
         api_url: str = None,
         api_key: str = None,
         fields: FieldsMapper = None,
+        client: httpx.AsyncClient = None,
         **api_params: str,
     ):
         self.api_url = api_url
         self.api_key = api_key or os.getenv("API_KEY")
         self.api_params = api_params or {}
         self.fields = fields
-        self.location = {}
-        self.current = {}
+        self.client = client
 
-    def get_weather_data(self) -> WeatherData:
+    async def request_weather_data(self, location: str | None = None) -> WeatherData:
         """
         Fetches weather data from the API and structures it into a WeatherData object.
 
+        Args:
+            location: Queried location, the one of the API parameters when not given.
+
         Returns:
             A WeatherData object containing structured weather information.
 
         Raises:
-             ValueError: If the API response contains an error or missing data.
+            WeatherProviderError: If the request fails or times out, or the response contains an error or misses data.
         """
+        params = self.api_params if location is None else {**self.api_params, self.fields.query_param: location}
         try:
-            response = requests.get(url=self.api_url, params=self.api_params)
+            response = await (self.client or get_http_client()).get(url=self.api_url, params=params)
             response.raise_for_status()
 
             data = response.json()
 
-            # Check if API returned an error
-            if "error" in data:
-                error_message = data["error"].get("message", "Unknown error")
-                logger.error(f"API Error: {error_message}")
-                raise ValueError(f"API Error: {error_message}.")
+        except httpx.HTTPError as err:
+            raise WeatherProviderError(f"Error fetching weather data: {err!r}.") from err
 
-            # Extract data safely
-            self.location = data.get(self.fields.location, {})
-            self.current = data.get(self.fields.current, {})
+        except ValueError as err:
+            raise WeatherProviderError(f"API Error: {err}.") from err
 
-            # Ensure valid location and current data
-            if not self.location or not self.current:
-                logger.error("Weather data is incomplete or missing.")
-                raise ValueError("Weather data is incomplete or missing.")
+        # Check if API returned an error
+        if "error" in data:
+            error = data["error"]
+            error_message = error.get("message", error.get("info", "Unknown error"))
+            raise WeatherProviderError(f"API Error: {error_message}.")
 
-        except requests.exceptions.RequestException as err:
-            logger.error(f"Error fetching weather data: {err}.")
+        # Extract data safely
+        location_data = data.get(self.fields.location, {})
+        current_data = data.get(self.fields.current, {})
 
-        except ValueError as err:
-            logger.error(f"API Error: {err}.")
+        # Ensure valid location and current data
+        if not location_data or not current_data:
+            raise WeatherProviderError("Weather data is incomplete or missing.")
 
         return WeatherData(
-            name=self.location.get(self.fields.name, "Unknown"),
-            last_updated=self.current.get(self.fields.last_updated, "Unknown"),
-            current_wind_speed=self.current.get(self.fields.current_wind_speed, "Unknown"),
-            current_wind_direction=self.current.get(self.fields.current_wind_direction, "Unknown"),
-            current_temperature=self.current.get(self.fields.current_temperature, "Unknown"),
+            name=location_data.get(self.fields.name, "Unknown"),
+            last_updated=current_data.get(self.fields.last_updated, "Unknown"),
+            current_wind_speed=current_data.get(self.fields.current_wind_speed, "Unknown"),
+            current_wind_direction=current_data.get(self.fields.current_wind_direction, "Unknown"),
+            current_temperature=current_data.get(self.fields.current_temperature, "Unknown"),
         )
 
+    async def get_weather_data(self, location: str | None = None) -> WeatherData:
+        """
+        Fetches weather data like 'request_weather_data', errors are logged and reported as "Unknown" data.
+
+        Args:
+            location: Queried location, the one of the API parameters when not given.
+
+        Returns:
+            A WeatherData object containing structured weather information.
+        """
+        try:
+            return await self.request_weather_data(location)
+
+        except WeatherProviderError as err:
+            logger.error(err.message)
+
+        return unknown_weather_data()
+
     @staticmethod
     def show_weather_data(wx_data: WeatherData):
         """
@@ -173,41 +251,331 @@ class WeatherApi:
         print()
 
 
-if __name__ == "__main__":
+class ProviderStrategy(str, Enum):
+    """How the answers of several weather providers are combined."""
+
+    first = "first"
+    merge = "merge"
+
+
+@dataclass
+class ProviderHealth:
+    """
+    Data class of the health of a weather provider.
+
+    Attributes:
+        breaker: Circuit breaker refusing calls while the provider keeps failing.
+        latency: Rolling latencies of the calls.
+        limiter: Rate limit of the calls.
+    """
+
+    breaker: CircuitBreaker
+    latency: LatencyTracker
+    limiter: TokenBucket
+
+
+class WeatherProviders:
+    """
+    Several weather APIs queried concurrently for the same location.
+
+    With the 'first' strategy the request is hedged: the providers are started from the fastest healthy one, by the
+    rolling p95 latency, the next one when the previous ones failed or did not answer within 'hedge_delay' seconds,
+    and the first good answer wins, the requests still running are cancelled. With the 'merge' strategy all the
+    providers are queried at once and every field is taken from the first provider, in order, which knows it.
+
+    Every provider has a circuit breaker, so a provider which keeps failing is skipped at once instead of after
+    its timeout, and a token bucket holding back the calls beyond its rate limit. When no provider answered, the
+    request is retried with jittered exponential backoff, as long as the retry budget shared by the requests
+    allows it.
+
+    Attributes:
+        providers: Weather APIs, from the preferred one.
+        strategy: How the answers are combined.
+        hedge_delay: Seconds to wait for an answer before starting the next provider, 0 starts them all at once.
+        health: Circuit breaker, latencies and rate limit of every provider.
+        retry_budget: Retries allowed as a share of the requests.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[WeatherApi],
+        strategy: ProviderStrategy = ProviderStrategy.first,
+        hedge_delay: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.providers = list(providers)
+        self.strategy = strategy
+        self.hedge_delay = settings.weather_hedge_delay if hedge_delay is None else hedge_delay
+        self.clock = clock
+        self.health: Dict[WeatherApi, ProviderHealth] = {
+            provider: ProviderHealth(
+                breaker=CircuitBreaker(
+                    failure_threshold=settings.weather_breaker_failures,
+                    reset_timeout=settings.weather_breaker_reset_timeout,
+                    clock=clock,
+                ),
+                latency=LatencyTracker(
+                    window=settings.weather_latency_window, max_samples=settings.weather_latency_samples, clock=clock
+                ),
+                limiter=TokenBucket(rate=settings.weather_rate_limit, burst=settings.weather_rate_burst, clock=clock),
+            )
+            for provider in self.providers
+        }
+        self.retry_budget = RetryBudget(
+            ratio=settings.weather_retry_ratio, max_tokens=settings.weather_retry_max_tokens
+        )
+
+    def ranked(self) -> List[WeatherApi]:
+        """
+        Orders the providers from the fastest healthy one: providers with a closed or half open circuit first, then
+        by their p95 latency. Providers without recent latencies come first, so they are measured again, and ties
+        keep the configured order.
+
+        Returns:
+            List[WeatherApi]: The providers in the order they are tried.
+        """
+
+        def rank(provider: WeatherApi) -> tuple:
+            health = self.health[provider]
+            return health.breaker.state == BreakerState.open, health.latency.percentile(95) or 0.0
+
+        return sorted(self.providers, key=rank)
+
+    async def _call(self, provider: WeatherApi, location: str | None) -> WeatherData:
+        """
+        Fetches weather data from a single provider through its circuit breaker and rate limit, recording the
+        latency.
+
+        Raises:
+            WeatherProviderError: If the circuit is open or the provider failed.
+        """
+        health = self.health[provider]
+        trial = health.breaker.state is BreakerState.half_open
+        if not health.breaker.allow():
+            raise WeatherProviderError(f"Circuit of {provider.api_url} is open.")
+
+        start_time = None
+        try:
+            await health.limiter.acquire()
+            start_time = self.clock()
+            weather_data = await provider.request_weather_data(location)
+        except asyncio.CancelledError:
+            # A hedged request overtaken by another provider took at least this long.
+            health.breaker.release(trial)
+            if start_time is not None:
+                health.latency.record(self.clock() - start_time)
+            raise
+        except Exception:
+            # Unexpected errors, e.g. a malformed answer, count as failures too, so a trial call always ends.
+            health.breaker.record_failure()
+            raise
+
+        health.breaker.record_success()
+        health.latency.record(self.clock() - start_time)
+
+        return weather_data
+
+    async def request_weather_data(self, location: str | None = None) -> WeatherData:
+        """
+        Fetches weather data from the providers according to the strategy, errors of single providers are logged.
+
+        Args:
+            location: Queried location, the one of the API parameters of every provider when not given.
+
+        Returns:
+            A WeatherData object, with "Unknown" values the providers could not tell.
+
+        Raises:
+            WeatherProviderError: If no provider answered, also after the retries.
+        """
+        self.retry_budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                if self.strategy is ProviderStrategy.merge:
+                    return await self._merge(location)
+
+                return await self._first(location)
+
+            except WeatherProviderError:
+                if attempt >= settings.weather_max_retries or not self.retry_budget.withdraw():
+                    raise
+
+            await asyncio.sleep(
+                backoff_delay(attempt, base=settings.weather_backoff_base, cap=settings.weather_backoff_cap)
+            )
+            attempt += 1
+
+    async def get_weather_data(self, location: str | None = None) -> WeatherData:
+        """
+        Fetches weather data like 'request_weather_data', reports "Unknown" data when no provider answered.
+
+        Args:
+            location: Queried location, the one of the API parameters of every provider when not given.
+
+        Returns:
+            A WeatherData object containing structured weather information.
+        """
+        try:
+            return await self.request_weather_data(location)
+
+        except WeatherProviderError as err:
+            logger.error(err.message)
+
+        return unknown_weather_data()
+
+    async def _first(self, location: str | None) -> WeatherData:
+        """Returns the first good answer of the hedged requests."""
+        waiting = self.ranked()
+        pending: set[asyncio.Task] = set()
+        try:
+            while waiting or pending:
+                if waiting:
+                    pending.add(asyncio.create_task(self._call(waiting.pop(0), location)))
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=self.hedge_delay if waiting else None, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if not isinstance(task.exception(), WeatherProviderError):
+                        return task.result()
+                    logger.error(task.exception().message)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise WeatherProviderError("No weather provider answered.")
+
+    async def _merge(self, location: str | None) -> WeatherData:
+        """Returns the answers of all the providers merged field by field."""
+        answers = await asyncio.gather(
+            *(self._call(provider, location) for provider in self.providers), return_exceptions=True
+        )
+
+        merged, answered = unknown_weather_data(), False
+        for answer in answers:
+            if isinstance(answer, WeatherProviderError):
+                logger.error(answer.message)
+                continue
+            if isinstance(answer, BaseException):
+                raise answer
+
+            answered = True
+            for field in fields(WeatherData):
+                if getattr(merged, field.name) == "Unknown":
+                    setattr(merged, field.name, getattr(answer, field.name))
+
+        if not answered:
+            raise WeatherProviderError("No weather provider answered.")
+
+        return merged
+
+
+async def fetch_weather_data(
+    location: str,
+    fetch: Callable[[str], Awaitable[WeatherData]],
+    cache: CacheBackend = cache_backend,
+) -> WeatherData:
+    """
+    Returns the weather data of the location from the cache shared by the workers, or fetches and caches it, so
+    the workers refreshing the same location query the providers once. Entries live 'WEATHER_REFRESH_INTERVAL'
+    seconds, which bounds how much older an observation read from the shared cache is than a fetched one.
+    Incomplete data is not cached.
+
+    Args:
+        location: Queried location.
+        fetch: Coroutine function fetching the weather data of a location from the providers.
+        cache: Cache backend shared by the workers.
+
+    Returns:
+        A WeatherData object containing structured weather information.
+
+    Raises:
+        WeatherProviderError: If no provider answered.
+    """
+    (cached,) = await cache.get_many([("weather", location)])
+    if cached is not None:
+        return WeatherData(*unpack(cached))
+
+    weather_data = await fetch(location)
+    if "Unknown" not in (weather_data.name, weather_data.last_updated):
+        await cache.set_many(
+            [("weather", location, pack(astuple(weather_data)))], ttl=settings.weather_refresh_interval
+        )
+
+    return weather_data
+
+
+WEATHERAPI_FIELDS = FieldsMapper(
+    location="location",
+    current="current",
+    name="name",
+    last_updated="last_updated",
+    current_wind_speed="wind_kph",
+    current_wind_direction="wind_degree",
+    current_temperature="temp_c",
+    query_param="q",
+)
+
+WEATHERSTACK_FIELDS = FieldsMapper(
+    location="location",
+    current="current",
+    name="name",
+    last_updated="observation_time",
+    current_wind_speed="wind_speed",
+    current_wind_direction="wind_degree",
+    current_temperature="temperature",
+    query_param="query",
+)
+
+
+def default_weather_providers() -> WeatherProviders:
+    """
+    Returns weatherapi.com and weatherstack, queried with the 'API_KEY' and 'NEW_API_KEY' of the settings.
+
+    Returns:
+        WeatherProviders preferring weatherapi.com.
+    """
+    return WeatherProviders(
+        [
+            WeatherApi(
+                api_url="http://api.weatherapi.com/v1/current.json",
+                fields=WEATHERAPI_FIELDS,
+                key=settings.api_key,
+            ),
+            WeatherApi(
+                api_url="http://api.weatherstack.com/current",
+                fields=WEATHERSTACK_FIELDS,
+                access_key=settings.new_api_key,
+            ),
+        ]
+    )
+
+
+async def main() -> None:
+    """Queries both weather services at once and shows their answers."""
     # First API service
     weather_api = WeatherApi(
         api_url="http://api.weatherapi.com/v1/current.json",
-        fields=FieldsMapper(
-            location="location",
-            current="current",
-            name="name",
-            last_updated="last_updated",
-            current_wind_speed="wind_kph",
-            current_wind_direction="wind_degree",
-            current_temperature="temp_c",
-        ),
+        fields=WEATHERAPI_FIELDS,
         key=os.getenv("API_KEY"),
         q="waw",
     )
 
-    weather_data = weather_api.get_weather_data()
-    weather_api.show_weather_data(wx_data=weather_data)
-
     # Second API service
     new_weather_api = WeatherApi(
         api_url="http://api.weatherstack.com/current",
-        fields=FieldsMapper(
-            location="location",
-            current="current",
-            name="name",
-            last_updated="observation_time",
-            current_wind_speed="wind_speed",
-            current_wind_direction="wind_degree",
-            current_temperature="temperature",
-        ),
+        fields=WEATHERSTACK_FIELDS,
         access_key=os.getenv("NEW_API_KEY"),
         query="krk",
     )
 
-    new_weather_data = new_weather_api.get_weather_data()
-    new_weather_api.show_weather_data(wx_data=new_weather_data)
+    try:
+        for weather_data in await asyncio.gather(weather_api.get_weather_data(), new_weather_api.get_weather_data()):
+            WeatherApi.show_weather_data(wx_data=weather_data)
+    finally:
+        await close_http_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
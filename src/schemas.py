@@ -1,11 +1,12 @@
 # Third party imports
-from typing import Optional
+from enum import Enum, unique
+from functools import lru_cache
+from typing import ClassVar, List, Optional
 
-from pydantic import BaseModel, ConfigDict, computed_field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, create_model
 
 # Internal imports
 from src.models import AircraftType
-from src.router.weather_api import WeatherData
 
 
 # Aircraft Data class schemas
@@ -14,6 +15,8 @@ class AircraftDataBaseSchema(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    fuel_mass_ratio: ClassVar[float] = 0.7
+
     fuel_consumption: float
     ceiling: float
     weight: float
@@ -25,9 +28,8 @@ class AircraftDataBaseSchema(BaseModel):
     @property
     def take_off_weight(self) -> float | None:
         """Returns take off weight if both parameters (weight and armament) are given."""
-        fuel_mass_ratio = 0.7
         if self.fuel:
-            fuel_weight = self.fuel * fuel_mass_ratio
+            fuel_weight = self.fuel * self.fuel_mass_ratio
         else:
             fuel_weight = 0
         return self.weight + fuel_weight if all([self.fuel, self.weight]) else self.weight
@@ -73,6 +75,182 @@ class AircraftDisplaySchema(AircraftBaseSchema):
     aircraft_id: int
 
 
+AIRCRAFT_FIELDS = ("aircraft_id", "name", "manufacturer", "aircraft_type", "first_flight")
+AIRCRAFT_DATA_FIELDS = (*AircraftDataBaseSchema.model_fields, "take_off_weight")
+AIRCRAFT_DISPLAY_COLUMNS = frozenset((*AIRCRAFT_FIELDS, *AircraftDataBaseSchema.model_fields))
+aircraft_display_list = TypeAdapter(List[AircraftDisplaySchema])
+
+
+@lru_cache(maxsize=128)
+def aircraft_projection_schema(fields: frozenset[str]) -> type[BaseModel]:
+    """Builds the display schema restricted to the requested fields of Aircraft and AircraftData, data fields
+    are nested in 'aircraft_data' like in AircraftDisplaySchema. Schemas are cached per set of fields."""
+    aircraft_fields = {
+        field: (AircraftDisplaySchema.model_fields[field].annotation, ...)
+        for field in AIRCRAFT_FIELDS
+        if field in fields
+    }
+    data_fields = {field: (Optional[float], None) for field in AIRCRAFT_DATA_FIELDS if field in fields}
+    if data_fields:
+        data_schema = create_model("AircraftDataProjectionSchema", **data_fields)
+        aircraft_fields["aircraft_data"] = (Optional[data_schema], None)
+
+    return create_model("AircraftProjectionSchema", **aircraft_fields)
+
+
+class AircraftBulkErrorSchema(BaseModel):
+    """Describes an item of the bulk request which could not be stored, 'index' points to its position in the
+    request."""
+
+    index: int
+    message: str
+
+
+class AircraftBulkCreateSchema(BaseModel):
+    """Result of the bulk aircraft creation with stored aircraft and errors reported per item."""
+
+    created: list[AircraftDisplaySchema]
+    errors: list[AircraftBulkErrorSchema]
+
+
+class AircraftBulkUpdateSchema(AircraftUpdateSchema):
+    """Adds 'aircraft_id' field to the 'AircraftUpdateSchema' IOT point the aircraft updated in bulk."""
+
+    aircraft_id: int
+
+
+class AircraftBulkDeleteSchema(BaseModel):
+    """Criteria of the bulk delete, aircraft matching all the given criteria are deleted."""
+
+    aircraft_ids: Optional[list[int]] = None
+    aircraft_type: Optional[AircraftType] = None
+    manufacturer: Optional[str] = None
+
+
+@unique
+class BulkStatus(str, Enum):
+    updated: str = "updated"
+    deleted: str = "deleted"
+    not_found: str = "not_found"
+
+
+class AircraftBulkResultSchema(BaseModel):
+    """Result of the bulk update or delete mapping every 'aircraft_id' to its status."""
+
+    results: dict[int, BulkStatus]
+
+
+@unique
+class AircraftSortKey(str, Enum):
+    aircraft_id: str = "aircraft_id"
+    name: str = "name"
+    manufacturer: str = "manufacturer"
+    first_flight: str = "first_flight"
+    fuel_consumption: str = "fuel_consumption"
+    ceiling: str = "ceiling"
+    weight: str = "weight"
+    fuel: str = "fuel"
+    max_speed: str = "max_speed"
+    cruise_speed: str = "cruise_speed"
+
+
+class AircraftFilterSchema(BaseModel):
+    """Aircraft list filters and sorting, numeric ranges are inclusive ('_gte' lower and '_lte' upper bound)."""
+
+    aircraft_type: Optional[AircraftType] = None
+    manufacturer: Optional[str] = None
+    fuel_consumption_gte: Optional[float] = None
+    fuel_consumption_lte: Optional[float] = None
+    ceiling_gte: Optional[float] = None
+    ceiling_lte: Optional[float] = None
+    weight_gte: Optional[float] = None
+    weight_lte: Optional[float] = None
+    fuel_gte: Optional[float] = None
+    fuel_lte: Optional[float] = None
+    max_speed_gte: Optional[float] = None
+    max_speed_lte: Optional[float] = None
+    cruise_speed_gte: Optional[float] = None
+    cruise_speed_lte: Optional[float] = None
+    sort_by: AircraftSortKey = AircraftSortKey.aircraft_id
+    descending: bool = False
+
+
+class CacheStatsSchema(BaseModel):
+    """Counters of a cache in this process, with occupancy and limits when the cache is held in the process."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: Optional[int] = None
+    size_bytes: Optional[int] = None
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+
+
+class WeatherCacheStatsSchema(BaseModel):
+    """Counters of the weather cache in this process, with the number of observations, tracked locations, locations
+    backing off after a failure and fetches in flight."""
+
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    failures: int
+    entries: int
+    tracked: int
+    backing_off: int
+    in_flight: int
+
+
+class WeatherProviderStatsSchema(BaseModel):
+    """Health of a weather provider: state of its circuit breaker, consecutive failures, number of times the circuit
+    opened and rolling latencies in milliseconds."""
+
+    api_url: str
+    state: str
+    failures: int
+    opened: int
+    samples: int
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    rate_tokens: Optional[float] = None
+
+
+class WeatherProvidersStatsSchema(BaseModel):
+    """Health of the weather providers, from the first one tried, and the retry tokens left."""
+
+    retry_tokens: float
+    providers: List[WeatherProviderStatsSchema]
+
+
+class InputWeatherStationsSchema(BaseModel):
+    """Input Weather Stations schema provides the locations whose observations are fetched at once."""
+
+    locations: list[str] = Field(min_length=1)
+
+
+class OutputWeatherStationSchema(BaseModel):
+    """Output Weather Station schema presents the observation of a location in numbers: wind speed in kph, the
+    direction the wind blows from in degrees and the temperature in Celsius, None for the values the providers could
+    not tell, and the error when no provider answered."""
+
+    location: str
+    name: Optional[str] = None
+    last_updated: Optional[str] = None
+    wind_speed: Optional[float] = None
+    wind_direction: Optional[float] = None
+    temperature: Optional[float] = None
+    error: Optional[str] = None
+
+
+class OutputWeatherStationsSchema(BaseModel):
+    """Output Weather Stations schema presents the observations in the order of the requested locations."""
+
+    stations: list[OutputWeatherStationSchema]
+
+
 class InputAircraftPerformanceRangeSchema(BaseModel):
     """Input Performance Range schema provides necessary data for maximum range calculation
     with cruise speed."""
@@ -80,7 +258,7 @@ class InputAircraftPerformanceRangeSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     aircraft_id: int
-    wind_speed: float = WeatherData.current_wind_speed
+    wind_speed: Optional[float] = None
     fuel: float
 
 
@@ -111,3 +289,107 @@ class OutputAircraftPerformanceEnduranceSchema(BaseModel):
 
     name: str
     endurance: str
+
+
+@unique
+class PerformanceEngine(str, Enum):
+    linear: str = "linear"
+    breguet: str = "breguet"
+
+
+class InputAircraftPerformanceBatchSchema(BaseModel):
+    """Input Performance Batch schema provides the aircraft and the grid of fuel amounts and wind speeds for which
+    range and endurance of every aircraft are calculated."""
+
+    aircraft_ids: list[int] = Field(min_length=1, max_length=1000)
+    fuel: list[float] = Field(min_length=1, max_length=20)
+    wind_speed: list[float] = Field(default=[0.0], min_length=1, max_length=20)
+    engine: PerformanceEngine = PerformanceEngine.linear
+
+
+class OutputAircraftPerformanceBatchItemSchema(BaseModel):
+    """Range and endurance of a single aircraft, 'range[i][j]' is the range with 'fuel[i]' and 'wind_speed[j]'
+    and 'endurance_hours[i]' the endurance with 'fuel[i]' of the batch."""
+
+    aircraft_id: int
+    name: str
+    range: list[list[float]]
+    endurance_hours: list[float]
+    endurance: list[str]
+
+
+class OutputAircraftPerformanceBatchSchema(BaseModel):
+    """Output Performance Batch schema presents the grid of the calculation, results per aircraft in the order of
+    the request and ids of the aircraft not found or without performance data."""
+
+    fuel: list[float]
+    wind_speed: list[float]
+    aircraft: list[OutputAircraftPerformanceBatchItemSchema]
+    missing_ids: list[int]
+
+
+class OutputAircraftPerformanceCapableSchema(BaseModel):
+    """Output Performance Capable schema presents an aircraft able to fly the requested distance with its range
+    and endurance."""
+
+    aircraft_id: int
+    name: str
+    range: float
+    endurance_hours: float
+    endurance: str
+
+
+class OutputReachableAirportSchema(BaseModel):
+    """Airport reachable from the origin, with its great-circle distance [km] and initial true course [deg]."""
+
+    ident: str
+    name: str
+    distance: float
+    course: float
+
+
+class OutputReachableAirportsItemSchema(BaseModel):
+    """Airports reachable by a single aircraft, from the nearest, 'reachable_count' counts all of them."""
+
+    aircraft_id: int
+    name: str
+    reachable_count: int
+    airports: list[OutputReachableAirportSchema]
+
+
+class OutputReachableAirportsSchema(BaseModel):
+    """Output Reachable Airports schema presents the origin, the airports every aircraft can reach from it and ids
+    of the aircraft not found or without performance data."""
+
+    latitude: float
+    longitude: float
+    aircraft: list[OutputReachableAirportsItemSchema]
+    missing_ids: list[int]
+
+
+class InputPerformanceSweepSchema(BaseModel):
+    """Input Performance Sweep schema provides the grid of fuel amounts, wind speeds and headings over which the
+    range of the aircraft, of the whole fleet when no ids are given, is swept."""
+
+    aircraft_ids: list[int] | None = Field(default=None, min_length=1)
+    fuel: list[float] = Field(min_length=1, max_length=1000)
+    wind_speed: list[float] = Field(default=[0.0], min_length=1, max_length=1000)
+    wind_direction: float = 0.0
+    heading_step: float = Field(default=15.0, gt=0.0, le=360.0)
+    engine: PerformanceEngine = PerformanceEngine.linear
+
+
+class OutputAircraftPerformancePolarItemSchema(BaseModel):
+    """Range of a single aircraft on every heading, 'range[i]' is the range on the heading 'i * heading_step'."""
+
+    aircraft_id: int
+    name: str
+    range: list[float]
+
+
+class OutputAircraftPerformancePolarSchema(BaseModel):
+    """Output Performance Polar schema presents the range of every aircraft on headings spaced by 'heading_step'
+    degrees from north."""
+
+    heading_step: float
+    aircraft: list[OutputAircraftPerformancePolarItemSchema]
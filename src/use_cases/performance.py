@@ -1,75 +1,522 @@
 # Third party imports
-from time import gmtime, strftime
+import math
 
-from sqlalchemy.orm import Session
+import numpy as np
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Internal imports
-from src.models import Aircraft, AircraftData
+from src.config.database import settings
+from src.exceptions import AircraftNotFoundError
+from src.repository import AircraftRepository
 from src.schemas import (
+    AircraftDataBaseSchema,
+    InputAircraftPerformanceBatchSchema,
     InputAircraftPerformanceEnduranceSchema,
     InputAircraftPerformanceRangeSchema,
+    OutputAircraftPerformanceBatchItemSchema,
+    OutputAircraftPerformanceBatchSchema,
+    OutputAircraftPerformanceCapableSchema,
     OutputAircraftPerformanceEnduranceSchema,
+    OutputAircraftPerformancePolarItemSchema,
+    OutputAircraftPerformancePolarSchema,
     OutputAircraftPerformanceRangeSchema,
+    OutputReachableAirportSchema,
+    OutputReachableAirportsItemSchema,
+    OutputReachableAirportsSchema,
+    PerformanceEngine,
 )
+from src.utils.airports import get_airport_index
+from src.utils.cache import LRUCache
+from src.utils.performance_table import PerformanceTable, flight_range, flight_time_memo
+
+
+def format_hours(hours: float) -> str:
+    """Formats the duration as HH:MM with whole minutes, rounded to the second first so the floating point error
+    of the calculation does not drop a minute. Hours are not wrapped at 24.
+
+    Arguments:
+        hours: Duration in hours.
+
+    Returns:
+        Duration formatted as HH:MM, e.g. '27:30'.
+    """
+    hours_part, minutes = divmod(round(hours * 3600) // 60, 60)
+    return f"{hours_part:02d}:{minutes:02d}"
+
+
+def wind_ground_speed(
+    airspeed: np.ndarray, wind_speed: float, wind_direction: float, headings: np.ndarray
+) -> np.ndarray:
+    """Calculates the ground speed of every airspeed on every heading in the wind. The crosswind component
+    is corrected by crabbing into the wind, the along-track component is added to the result. Headings on which
+    the crosswind exceeds the airspeed give a ground speed of 0.
+
+    Arguments:
+        airspeed: Airspeeds of the aircraft, shape (aircraft,).
+        wind_speed: Wind speed, in the unit of the airspeeds.
+        wind_direction: Direction the wind blows from [deg], clockwise from north.
+        headings: Tracks of the aircraft [deg], clockwise from north, shape (headings,).
+
+    Returns:
+        Ground speeds, shape (aircraft, headings).
+    """
+    relative_wind = np.radians(wind_direction - headings)
+    tailwind = -wind_speed * np.cos(relative_wind)
+    crosswind = wind_speed * np.sin(relative_wind)
+
+    along_track_airspeed = np.sqrt(np.clip(airspeed[:, None] ** 2 - crosswind[None, :] ** 2, 0.0, None))
+
+    return np.clip(along_track_airspeed + tailwind[None, :], 0.0, None)
+
+
+def breguet_flight_time(
+    fuel_consumption: np.ndarray, weight: np.ndarray, fuel_capacity: np.ndarray, fuel: np.ndarray, steps: int
+) -> np.ndarray:
+    """Integrates the flight time [h] of burning the fuel in equal steps, with the burn rate proportional to
+    the gross weight, which falls as the fuel is burnt. 'fuel_consumption' is the burn rate at the take-off weight
+    with full tanks, every step burns at the weight of its midpoint. Aircraft without a known weight or fuel capacity
+    burn at the constant rate, like in the linear model.
+
+    Arguments:
+        fuel_consumption: Burn rates at the take-off weight, shape (aircraft,).
+        weight: Empty weights, NaN when unknown, shape (aircraft,).
+        fuel_capacity: Fuel capacities, NaN when unknown, shape (aircraft,).
+        fuel: Fuel amounts on board, shape (fuel,).
+        steps: Number of integration steps.
+
+    Returns:
+        Flight times, shape (aircraft, fuel).
+    """
+    fuel_mass_ratio = AircraftDataBaseSchema.fuel_mass_ratio
+    reference_weight = weight + fuel_capacity * fuel_mass_ratio
+    remaining_fuel = fuel[:, None] * (1.0 - (np.arange(steps) + 0.5) / steps)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        burn_factor = (weight[:, None, None] + remaining_fuel[None] * fuel_mass_ratio) / reference_weight[:, None, None]
+    burn_factor = np.where(np.isfinite(burn_factor) & (burn_factor > 0), burn_factor, 1.0)
+
+    step_time = (fuel / steps)[None, :, None] / (fuel_consumption[:, None, None] * burn_factor)
+
+    return step_time.sum(axis=-1)
+
+
+def memoized_flight_times(performance_data: dict[int, Row], fuel: list[float]) -> np.ndarray:
+    """Returns the Breguet flight times [h] of the aircraft for every fuel amount. Times are memoized per
+    aircraft version and fuel amount, the aircraft missing any of them are integrated together in one pass.
+
+    Arguments:
+        performance_data: Performance data of the aircraft by ID, as read by the repository.
+        fuel: Fuel amounts on board.
+
+    Returns:
+        Flight times, shape (aircraft, fuel).
+    """
+    aircraft_ids = list(performance_data)
+    flight_times = np.empty((len(aircraft_ids), len(fuel)))
+
+    missing = []
+    for index, aircraft_id in enumerate(aircraft_ids):
+        version = performance_data[aircraft_id].version
+        memoized = [flight_time_memo.get(aircraft_id, (version, amount)) for amount in fuel]
+        if None in memoized:
+            missing.append(index)
+        else:
+            flight_times[index] = memoized
+
+    if missing:
+        rows = [performance_data[aircraft_ids[index]] for index in missing]
+        flight_times[missing] = breguet_flight_time(
+            fuel_consumption=np.array([row.fuel_consumption for row in rows], dtype=float),
+            weight=np.array([row.weight for row in rows], dtype=float),
+            fuel_capacity=np.array([row.fuel for row in rows], dtype=float),
+            fuel=np.array(fuel, dtype=float),
+            steps=settings.breguet_steps,
+        )
+        for index, row in zip(missing, rows):
+            for amount, flight_time in zip(fuel, flight_times[index].tolist()):
+                flight_time_memo.set(aircraft_ids[index], (row.version, amount), flight_time, size=64)
+
+    return flight_times
 
 
 class Performance:
     """Performance class to manage all methods related to aircraft technical data.
 
     Attributes:
-        session: SQLAlchemy session object.
+        session: SQLAlchemy asynchronous session object.
+        aircraft_repo: Repository the aircraft are read from, through its cache.
 
     Methods:
         calculate_endurance(aircraft_id: int): calculates aircraft endurance
         based on weight and speed.
+        calculate_batch(input_data: InputAircraftPerformanceBatchSchema): calculates range and endurance of many
+        aircraft over a grid of fuel amounts and wind speeds.
+        performance_table(aircraft_id: int): returns the precomputed performance table of the aircraft.
+        find_capable(distance: float, fuel: float, wind_speed: float, limit: int): finds the aircraft able to fly
+        the distance.
+        calculate_polar(fuel: float, wind_speed: float, wind_direction: float, heading_step: float, ...): calculates
+        the range of many aircraft on every heading in the wind.
+        reachable_airports(latitude: float, longitude: float, fuel: float, ...): finds the airports the aircraft
+        can reach from the origin in the wind.
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         """Initializes Performance class.
 
         Arguments:
-            session: SQLAlchemy session object.
+            session: SQLAlchemy asynchronous session object.
         """
         self.session = session
+        self.aircraft_repo = AircraftRepository(session)
+
+    async def performance_table(self, aircraft_id: int) -> PerformanceTable:
+        """Returns the performance table of the current version of the aircraft, building it on the first use.
+
+        Arguments:
+            aircraft_id: ID of the aircraft.
+
+        Returns:
+            Range and endurance of the aircraft precomputed on the fuel and wind grid.
+
+        Raises:
+            AircraftNotFoundError: If the aircraft with the given 'id' does not exist.
+        """
+        version = await self.aircraft_repo.aircraft_version(aircraft_id)
+        if version is None:
+            raise AircraftNotFoundError(f"Aircraft with id {aircraft_id} not found.")
+
+        table = self.aircraft_repo.performance_tables.get(aircraft_id, version)
+        if table is None:
+            aircraft = await self.aircraft_repo.get_aircraft(aircraft_id, version=version)
+            aircraft_data = aircraft.aircraft_data
+            table = PerformanceTable(
+                name=str(aircraft.name),
+                cruise_speed=aircraft_data.cruise_speed,
+                fuel_consumption=aircraft_data.fuel_consumption,
+                max_fuel=aircraft_data.fuel,
+                max_wind=settings.performance_table_max_wind,
+                size=settings.performance_table_size,
+            )
+            self.aircraft_repo.performance_tables.set(aircraft_id, version, table, size=table.nbytes)
 
-    def calculate_range(self, input_data: InputAircraftPerformanceRangeSchema) -> OutputAircraftPerformanceRangeSchema:
+        return table
+
+    async def _breguet_data(self, aircraft_id: int) -> dict[int, Row]:
+        """Reads the performance data of a single aircraft for the Breguet engine.
+
+        Raises:
+            AircraftNotFoundError: If the aircraft does not exist or has no performance data.
+        """
+        performance_data = await self.aircraft_repo.performance_data([aircraft_id])
+        if not performance_data:
+            raise AircraftNotFoundError(f"Aircraft with id {aircraft_id} not found.")
+
+        return performance_data
+
+    async def calculate_range(
+        self,
+        input_data: InputAircraftPerformanceRangeSchema,
+        lookup_table: bool = False,
+        engine: PerformanceEngine = PerformanceEngine.linear,
+    ) -> OutputAircraftPerformanceRangeSchema:
         """Calculates maximum range [km] based on the given fuel and wind speed in reference to cruise_speed saved in
         the database.
 
         Arguments:
-            input_data: Input data provided in accordance with InputAircraftPerformanceRangeSchema.
+            input_data: Input data provided in accordance with InputAircraftPerformanceRangeSchema,
+            lookup_table: Whether to interpolate in the precomputed performance table, fuel and wind outside
+                of the table are calculated. The table applies to the linear engine,
+            engine: Linear model with a constant burn rate, or Breguet model with the burn rate falling
+                with the gross weight.
 
         Returns:
             Data formatted according to the OutputAircraftPerformanceSchema.
         """
-        aircraft = self.session.query(Aircraft).filter_by(aircraft_id=input_data.aircraft_id).first()
-        aircraft_data = self.session.query(AircraftData).filter_by(aircraft_id=input_data.aircraft_id).first()
+        if engine is PerformanceEngine.breguet:
+            performance_data = await self._breguet_data(input_data.aircraft_id)
+            aircraft_data = performance_data[input_data.aircraft_id]
+            flight_time = memoized_flight_times(performance_data, [input_data.fuel])[0, 0]
+
+            return OutputAircraftPerformanceRangeSchema(
+                name=str(aircraft_data.name), range=(aircraft_data.cruise_speed + input_data.wind_speed) * flight_time
+            )
 
-        calculated_range = (
-            (aircraft_data.cruise_speed + input_data.wind_speed) * input_data.fuel / aircraft_data.fuel_consumption
+        if lookup_table:
+            table = await self.performance_table(input_data.aircraft_id)
+            calculated_range = table.lookup_range(input_data.fuel, input_data.wind_speed)
+            if calculated_range is not None:
+                return OutputAircraftPerformanceRangeSchema(name=table.name, range=calculated_range)
+
+        aircraft = await self.aircraft_repo.get_aircraft(input_data.aircraft_id)
+        aircraft_data = aircraft.aircraft_data
+
+        calculated_range = flight_range(
+            aircraft_data.cruise_speed + input_data.wind_speed, input_data.fuel, aircraft_data.fuel_consumption
         )
 
         return OutputAircraftPerformanceRangeSchema(name=str(aircraft.name), range=calculated_range)
 
-    def calculate_endurance(
-        self, input_data: InputAircraftPerformanceEnduranceSchema
+    async def calculate_endurance(
+        self,
+        input_data: InputAircraftPerformanceEnduranceSchema,
+        lookup_table: bool = False,
+        engine: PerformanceEngine = PerformanceEngine.linear,
     ) -> OutputAircraftPerformanceEnduranceSchema:
         """Calculates maximum aircraft endurance [h] based on the given fuel in reference to fuel_consumption saved in
         the database.
 
         Arguments:
-            input_data: Input data provided in accordance with InputAircraftPerformanceEnduranceSchema.
+            input_data: Input data provided in accordance with InputAircraftPerformanceEnduranceSchema,
+            lookup_table: Whether to interpolate in the precomputed performance table, fuel outside of the table
+                is calculated. The table applies to the linear engine,
+            engine: Linear model with a constant burn rate, or Breguet model with the burn rate falling
+                with the gross weight.
 
         Returns:
             Data formatted according to the OutputAircraftPerformanceEnduranceSchema.
         """
-        hours_to_seconds = 3600
+        if engine is PerformanceEngine.breguet:
+            performance_data = await self._breguet_data(input_data.aircraft_id)
+            flight_time = memoized_flight_times(performance_data, [input_data.fuel])[0, 0]
+
+            return OutputAircraftPerformanceEnduranceSchema(
+                name=str(performance_data[input_data.aircraft_id].name), endurance=format_hours(flight_time)
+            )
 
-        aircraft = self.session.query(Aircraft).filter_by(aircraft_id=input_data.aircraft_id).first()
-        aircraft_data = self.session.query(AircraftData).filter_by(aircraft_id=input_data.aircraft_id).first()
+        if lookup_table:
+            table = await self.performance_table(input_data.aircraft_id)
+            calculated_endurance = table.lookup_endurance(input_data.fuel)
+            if calculated_endurance is not None:
+                return OutputAircraftPerformanceEnduranceSchema(
+                    name=table.name, endurance=format_hours(calculated_endurance)
+                )
 
-        calculated_endurance_in_seconds = input_data.fuel / (aircraft_data.fuel_consumption / hours_to_seconds)
+        aircraft = await self.aircraft_repo.get_aircraft(input_data.aircraft_id)
+        aircraft_data = aircraft.aircraft_data
 
-        endurance_hours_minutes = strftime("%H:%M", gmtime(calculated_endurance_in_seconds))
+        calculated_endurance = input_data.fuel / aircraft_data.fuel_consumption
+
+        endurance_hours_minutes = format_hours(calculated_endurance)
 
         return OutputAircraftPerformanceEnduranceSchema(name=str(aircraft.name), endurance=endurance_hours_minutes)
+
+    async def calculate_batch(
+        self, input_data: InputAircraftPerformanceBatchSchema
+    ) -> OutputAircraftPerformanceBatchSchema:
+        """Calculates range [km] and endurance [h] of many aircraft for every fuel amount and wind speed of the grid.
+        The data of all the aircraft is read in one query and the results are calculated as arrays at once,
+        with the formulas of 'calculate_range' and 'calculate_endurance' and the engine chosen in the input.
+
+        Arguments:
+            input_data: Input data provided in accordance with InputAircraftPerformanceBatchSchema.
+
+        Returns:
+            Data formatted according to the OutputAircraftPerformanceBatchSchema.
+        """
+        aircraft_ids = list(dict.fromkeys(input_data.aircraft_ids))
+        performance_data = await self.aircraft_repo.performance_data(aircraft_ids)
+        found_ids = [aircraft_id for aircraft_id in aircraft_ids if aircraft_id in performance_data]
+
+        cruise_speed = np.array([performance_data[aircraft_id].cruise_speed for aircraft_id in found_ids], dtype=float)
+        fuel_consumption = np.array(
+            [performance_data[aircraft_id].fuel_consumption for aircraft_id in found_ids], dtype=float
+        )
+        fuel = np.array(input_data.fuel, dtype=float)
+        wind_speed = np.array(input_data.wind_speed, dtype=float)
+
+        # Shapes: aircraft x fuel x wind for the range, aircraft x fuel for the endurance.
+        calculated_range = flight_range(
+            cruise_speed[:, None, None] + wind_speed[None, None, :],
+            fuel[None, :, None],
+            fuel_consumption[:, None, None],
+        )
+        calculated_endurance = fuel[None, :] / fuel_consumption[:, None]
+
+        if input_data.engine is PerformanceEngine.breguet:
+            calculated_endurance = memoized_flight_times(
+                {aircraft_id: performance_data[aircraft_id] for aircraft_id in found_ids}, input_data.fuel
+            )
+            calculated_range = (cruise_speed[:, None, None] + wind_speed[None, None, :]) * calculated_endurance[
+                :, :, None
+            ]
+
+        return OutputAircraftPerformanceBatchSchema(
+            fuel=input_data.fuel,
+            wind_speed=input_data.wind_speed,
+            aircraft=[
+                OutputAircraftPerformanceBatchItemSchema(
+                    aircraft_id=aircraft_id,
+                    name=performance_data[aircraft_id].name,
+                    range=aircraft_range,
+                    endurance_hours=endurance,
+                    endurance=[format_hours(hours) for hours in endurance],
+                )
+                for aircraft_id, aircraft_range, endurance in zip(
+                    found_ids, calculated_range.tolist(), calculated_endurance.tolist()
+                )
+            ],
+            missing_ids=[aircraft_id for aircraft_id in aircraft_ids if aircraft_id not in performance_data],
+        )
+
+    async def find_capable(
+        self, distance: float, fuel: float, wind_speed: float = 0.0, limit: int | None = None
+    ) -> list[OutputAircraftPerformanceCapableSchema]:
+        """Finds the aircraft whose range [km] with the given fuel and wind speed reaches the distance, the range
+        is calculated, filtered and sorted in the database.
+
+        Arguments:
+            distance: Distance [km] the aircraft has to reach.
+            fuel: Fuel on board.
+            wind_speed: Wind speed added to the cruise speed, negative for a headwind.
+            limit: Maximum number of returned aircraft.
+
+        Returns:
+            Aircraft formatted according to the OutputAircraftPerformanceCapableSchema, from the longest range.
+        """
+        aircrafts = await self.aircraft_repo.capable_aircrafts(distance, fuel, wind_speed=wind_speed, limit=limit)
+
+        return [
+            OutputAircraftPerformanceCapableSchema(**aircraft, endurance=format_hours(aircraft["endurance_hours"]))
+            for aircraft in aircrafts
+        ]
+
+    async def range_polar(
+        self,
+        fuel: float,
+        wind_speed: float,
+        wind_direction: float,
+        heading_step: float = 1.0,
+        aircraft_ids: list[int] | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> tuple[dict[int, Row], np.ndarray, np.ndarray]:
+        """Calculates the range [km] of many aircraft on every heading of the compass rose in one pass over arrays.
+
+        Arguments:
+            fuel: Fuel on board.
+            wind_speed: Wind speed.
+            wind_direction: Direction the wind blows from [deg].
+            heading_step: Step between the headings [deg], starting from 0.
+            aircraft_ids: IDs of the aircraft, None takes a page of the fleet.
+            after_id: Keyset cursor of the fleet page.
+            limit: Size of the fleet page.
+
+        Returns:
+            Performance data of the aircraft by ID, the headings and the ranges of shape (aircraft, headings).
+        """
+        performance_data = await self.aircraft_repo.performance_data(aircraft_ids, after_id=after_id, limit=limit)
+
+        cruise_speed = np.array([data.cruise_speed for data in performance_data.values()], dtype=float)
+        fuel_consumption = np.array([data.fuel_consumption for data in performance_data.values()], dtype=float)
+        headings = np.arange(0.0, 360.0, heading_step)
+
+        ground_speed = wind_ground_speed(cruise_speed, wind_speed, wind_direction, headings)
+        ranges = flight_range(ground_speed, fuel, fuel_consumption[:, None])
+
+        return performance_data, headings, ranges
+
+    async def calculate_polar(
+        self,
+        fuel: float,
+        wind_speed: float,
+        wind_direction: float,
+        heading_step: float = 1.0,
+        aircraft_ids: list[int] | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> OutputAircraftPerformancePolarSchema:
+        """Calculates the range [km] of many aircraft on every heading, see 'range_polar'. Ranges are rounded
+        to 0.1 km to keep the payload compact.
+
+        Arguments:
+            fuel: Fuel on board.
+            wind_speed: Wind speed.
+            wind_direction: Direction the wind blows from [deg].
+            heading_step: Step between the headings [deg], starting from 0.
+            aircraft_ids: IDs of the aircraft, None takes a page of the fleet.
+            after_id: Keyset cursor of the fleet page.
+            limit: Size of the fleet page.
+
+        Returns:
+            Data formatted according to the OutputAircraftPerformancePolarSchema.
+        """
+        performance_data, _, ranges = await self.range_polar(
+            fuel, wind_speed, wind_direction, heading_step, aircraft_ids=aircraft_ids, after_id=after_id, limit=limit
+        )
+
+        return OutputAircraftPerformancePolarSchema(
+            heading_step=heading_step,
+            aircraft=[
+                OutputAircraftPerformancePolarItemSchema(aircraft_id=aircraft_id, name=data.name, range=aircraft_ranges)
+                for (aircraft_id, data), aircraft_ranges in zip(performance_data.items(), np.round(ranges, 1).tolist())
+            ],
+        )
+
+    async def reachable_airports(
+        self,
+        latitude: float,
+        longitude: float,
+        fuel: float,
+        wind_speed: float,
+        wind_direction: float,
+        aircraft_ids: list[int],
+        limit: int | None = None,
+    ) -> OutputReachableAirportsSchema:
+        """Finds the airports every aircraft can reach from the origin. The airport index is queried once with the
+        greatest range of the aircraft, with the whole wind as tailwind, and the candidates are then compared with
+        the range of every aircraft on the initial course to the airport, the wind being uniform along the route.
+        Aircraft not found or without performance data are reported in 'missing_ids'.
+
+        Arguments:
+            latitude: Latitude of the origin [deg].
+            longitude: Longitude of the origin [deg].
+            fuel: Fuel on board.
+            wind_speed: Wind speed.
+            wind_direction: Direction the wind blows from [deg].
+            aircraft_ids: IDs of the aircraft.
+            limit: Maximum number of airports returned per aircraft, from the nearest.
+
+        Returns:
+            Data formatted according to the OutputReachableAirportsSchema.
+        """
+        airports = get_airport_index()
+        performance_data = await self.aircraft_repo.performance_data(aircraft_ids)
+
+        cruise_speed = np.array([data.cruise_speed for data in performance_data.values()], dtype=float)
+        fuel_consumption = np.array([data.fuel_consumption for data in performance_data.values()], dtype=float)
+        max_range = float(np.max(flight_range(cruise_speed + wind_speed, fuel, fuel_consumption), initial=0.0))
+
+        positions, distances, courses = airports.within(latitude, longitude, max_range)
+        ranges = flight_range(
+            wind_ground_speed(cruise_speed, wind_speed, wind_direction, courses), fuel, fuel_consumption[:, None]
+        )
+        reachable = distances[None, :] <= ranges
+
+        items = []
+        for (aircraft_id, data), aircraft_reachable in zip(performance_data.items(), reachable):
+            indices = np.flatnonzero(aircraft_reachable)
+            nearest = indices[:limit]
+            items.append(
+                OutputReachableAirportsItemSchema(
+                    aircraft_id=aircraft_id,
+                    name=data.name,
+                    reachable_count=len(indices),
+                    airports=[
+                        OutputReachableAirportSchema(ident=ident, name=name, distance=distance, course=course)
+                        for ident, name, distance, course in zip(
+                            airports.idents[positions[nearest]].tolist(),
+                            airports.names[positions[nearest]].tolist(),
+                            np.round(distances[nearest], 1).tolist(),
+                            np.round(courses[nearest], 1).tolist(),
+                        )
+                    ],
+                )
+            )
+
+        return OutputReachableAirportsSchema(
+            latitude=latitude,
+            longitude=longitude,
+            aircraft=items,
+            missing_ids=[aircraft_id for aircraft_id in aircraft_ids if aircraft_id not in performance_data],
+        )
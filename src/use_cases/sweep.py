@@ -0,0 +1,361 @@
+# Third party imports
+import asyncio
+import multiprocessing
+import os
+import struct
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import suppress
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import AsyncIterator, Dict
+
+import numpy as np
+from pydantic_core import to_json
+from sqlalchemy import Row
+
+# Internal imports
+from src.config.database import settings
+from src.exceptions import InvalidDataError
+from src.schemas import InputPerformanceSweepSchema, PerformanceEngine
+from src.use_cases.performance import breguet_flight_time, wind_ground_speed
+
+# Columns of the aircraft matrix shared with the workers.
+AIRCRAFT_COLUMNS = ("cruise_speed", "fuel_consumption", "weight", "fuel")
+_FRAME_HEADER = struct.Struct("<I")
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_sweep_executor() -> ProcessPoolExecutor:
+    """
+    Returns the process pool of the sweeps, started on the first use. Workers are spawned rather than forked,
+    so they do not inherit the event loop and the connections of the application.
+
+    Returns:
+        ProcessPoolExecutor: Process pool with 'SWEEP_WORKERS' workers, one per CPU by default.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.sweep_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    return _executor
+
+
+def shutdown_sweep_executor() -> None:
+    """Stops the workers of the sweep process pool, if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+def evaluate_ranges(
+    aircraft: np.ndarray,
+    fuel: np.ndarray,
+    wind_speed: np.ndarray,
+    wind_direction: float,
+    headings: np.ndarray,
+    engine: PerformanceEngine,
+    steps: int,
+) -> np.ndarray:
+    """
+    Calculates the range [km] of the aircraft for every fuel amount, wind speed and heading.
+
+    Arguments:
+        aircraft: Aircraft matrix with the AIRCRAFT_COLUMNS, NaN for unknown values, shape (aircraft, 4).
+        fuel: Fuel amounts, shape (fuel,).
+        wind_speed: Wind speeds, shape (wind,).
+        wind_direction: Direction the wind blows from [deg].
+        headings: Headings [deg], shape (headings,).
+        engine: Performance model of the flight time.
+        steps: Number of integration steps of the Breguet engine.
+
+    Returns:
+        np.ndarray: Ranges, shape (aircraft, fuel, wind, headings).
+    """
+    cruise_speed, fuel_consumption, weight, fuel_capacity = aircraft.T
+    if engine is PerformanceEngine.breguet:
+        flight_time = breguet_flight_time(fuel_consumption, weight, fuel_capacity, fuel, steps)
+    else:
+        flight_time = fuel[None, :] / fuel_consumption[:, None]
+
+    ground_speed = np.stack(
+        [wind_ground_speed(cruise_speed, speed, wind_direction, headings) for speed in wind_speed], axis=1
+    )
+
+    return flight_time[:, :, None, None] * ground_speed[:, None, :, :]
+
+
+def evaluate_chunk(
+    input_name: str,
+    output_name: str | None,
+    aircraft_count: int,
+    start: int,
+    stop: int,
+    fuel: np.ndarray,
+    wind_speed: np.ndarray,
+    wind_direction: float,
+    headings: np.ndarray,
+    engine: PerformanceEngine,
+    steps: int,
+) -> bytes | None:
+    """
+    Runs in a worker process: reads the aircraft 'start:stop' from the shared input matrix and calculates their
+    ranges, written as float32 at the start of the shared output block, or returned encoded as JSON without one.
+
+    Arguments:
+        input_name: Name of the shared memory block of the aircraft matrix.
+        output_name: Name of the shared memory block of the chunk's ranges, None to return them as JSON.
+        aircraft_count: Number of rows of the aircraft matrix.
+        start: Index of the first aircraft of the chunk.
+        stop: Index after the last aircraft of the chunk.
+        fuel, wind_speed, wind_direction, headings, engine, steps: Grid and model, see 'evaluate_ranges'.
+
+    Returns:
+        bytes | None: JSON array of the ranges rounded to 0.1 km, when no output block is given.
+    """
+    # Spawned workers share the resource tracker of the parent, which unlinks the blocks once the sweep ends.
+    input_memory = SharedMemory(name=input_name)
+    try:
+        aircraft = np.ndarray((aircraft_count, len(AIRCRAFT_COLUMNS)), dtype=np.float64, buffer=input_memory.buf)
+        ranges = evaluate_ranges(aircraft[start:stop], fuel, wind_speed, wind_direction, headings, engine, steps)
+        del aircraft
+    finally:
+        with suppress(BufferError):
+            input_memory.close()
+
+    if output_name is None:
+        return to_json(np.round(ranges, 1).tolist())
+
+    output_memory = SharedMemory(name=output_name)
+    try:
+        np.ndarray(ranges.shape, dtype=np.float32, buffer=output_memory.buf)[:] = ranges
+    finally:
+        with suppress(BufferError):
+            output_memory.close()
+
+    return None
+
+
+class PerformanceSweep:
+    """
+    Range of many aircraft over a grid of fuel amounts, wind speeds and headings, evaluated in chunks of aircraft
+    on a process pool and streamed back as they complete. The aircraft matrix lives in shared memory, so the
+    workers do not receive it through pickling. Float32 ranges are written into shared memory blocks of a chunk,
+    reused by the next chunks, while JSON chunks are encoded by the workers and returned through pickling. At
+    most 'SWEEP_PENDING_CHUNKS' chunks are evaluated or waiting to be sent at once, so the memory taken by a sweep
+    does not grow with its size.
+
+    Attributes:
+        aircraft_ids: IDs of the aircraft, in the order of the rows of the matrix.
+        aircraft: Aircraft matrix with the AIRCRAFT_COLUMNS, shape (aircraft, 4).
+        fuel: Fuel amounts of the grid.
+        wind_speed: Wind speeds of the grid.
+        wind_direction: Direction the wind blows from [deg].
+        heading_step: Step between the headings of the grid [deg].
+        engine: Performance model of the flight time.
+    """
+
+    def __init__(
+        self,
+        aircraft_ids: list[int],
+        aircraft: np.ndarray,
+        fuel: list[float],
+        wind_speed: list[float],
+        wind_direction: float,
+        heading_step: float,
+        engine: PerformanceEngine,
+    ) -> None:
+        self.aircraft_ids = aircraft_ids
+        self.aircraft = aircraft
+        self.fuel = np.array(fuel, dtype=float)
+        self.wind_speed = np.array(wind_speed, dtype=float)
+        self.wind_direction = wind_direction
+        self.heading_step = heading_step
+        self.headings = np.arange(0.0, 360.0, heading_step)
+        self.engine = engine
+
+        if self.points > settings.sweep_max_points:
+            raise InvalidDataError(f"The sweep has {self.points} points, at most {settings.sweep_max_points} allowed.")
+
+    @classmethod
+    def from_performance_data(
+        cls, performance_data: Dict[int, Row], sweep: InputPerformanceSweepSchema
+    ) -> "PerformanceSweep":
+        """
+        Creates the sweep of the aircraft read by 'AircraftRepository.performance_data'.
+
+        Arguments:
+            performance_data: Performance data of the aircraft by ID.
+            sweep: Grid and model of the sweep.
+
+        Returns:
+            PerformanceSweep: Sweep ready to run.
+        """
+        aircraft = np.array(
+            [[getattr(row, column) for column in AIRCRAFT_COLUMNS] for row in performance_data.values()],
+            dtype=float,
+        ).reshape(-1, len(AIRCRAFT_COLUMNS))
+
+        return cls(
+            aircraft_ids=list(performance_data),
+            aircraft=aircraft,
+            fuel=sweep.fuel,
+            wind_speed=sweep.wind_speed,
+            wind_direction=sweep.wind_direction,
+            heading_step=sweep.heading_step,
+            engine=sweep.engine,
+        )
+
+    @property
+    def shape(self) -> tuple[int, int, int, int]:
+        """Returns the shape of the ranges, (aircraft, fuel, wind, headings)."""
+        return len(self.aircraft_ids), len(self.fuel), len(self.wind_speed), len(self.headings)
+
+    @property
+    def points(self) -> int:
+        """Returns the number of points of the grid."""
+        return int(np.prod(self.shape))
+
+    async def chunks(
+        self, executor: Executor, chunk_points: int, encode: bool = False
+    ) -> AsyncIterator[tuple[int, int, bytes]]:
+        """
+        Evaluates the sweep in chunks of whole aircraft of about 'chunk_points' points and yields every chunk
+        as soon as it completes. A new chunk is submitted for every yielded one, and the shared output blocks
+        of the yielded chunks are reused. Pending chunks are cancelled and the shared memory is released when
+        the caller stops iterating.
+
+        Arguments:
+            executor: Process pool evaluating the chunks.
+            chunk_points: Approximate number of points of a chunk.
+            encode: Whether the workers encode the ranges as JSON instead of the float32 bytes being returned.
+
+        Yields:
+            tuple[int, int, bytes]: Index of the first aircraft, index after the last one and the ranges.
+        """
+        aircraft_count, *grid_shape = self.shape
+        grid_points = int(np.prod(grid_shape))
+        aircraft_per_chunk = max(1, chunk_points // max(1, grid_points))
+        block_size = max(1, aircraft_per_chunk * grid_points * np.dtype(np.float32).itemsize)
+        pending_chunks = settings.sweep_pending_chunks or 2 * (settings.sweep_workers or os.cpu_count() or 1)
+        starts = iter(range(0, aircraft_count, aircraft_per_chunk))
+
+        input_memory = SharedMemory(create=True, size=max(1, self.aircraft.nbytes))
+        blocks: list[SharedMemory] = []
+        free_blocks: list[SharedMemory] = []
+        tasks: Dict[asyncio.Future, tuple[int, int, SharedMemory | None]] = {}
+        loop = asyncio.get_running_loop()
+
+        def submit(start: int) -> None:
+            """Submits the chunk of the aircraft from 'start' with a free output block, a new one if none."""
+            stop = min(start + aircraft_per_chunk, aircraft_count)
+            block = None
+            if not encode:
+                if not free_blocks:
+                    blocks.append(SharedMemory(create=True, size=block_size))
+                    free_blocks.append(blocks[-1])
+                block = free_blocks.pop()
+            task = loop.run_in_executor(
+                executor,
+                evaluate_chunk,
+                input_memory.name,
+                None if block is None else block.name,
+                aircraft_count,
+                start,
+                stop,
+                self.fuel,
+                self.wind_speed,
+                self.wind_direction,
+                self.headings,
+                self.engine,
+                settings.breguet_steps,
+            )
+            tasks[task] = (start, stop, block)
+
+        try:
+            np.ndarray(self.aircraft.shape, dtype=np.float64, buffer=input_memory.buf)[:] = self.aircraft
+
+            for start in islice(starts, pending_chunks):
+                submit(start)
+
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    start, stop, block = tasks.pop(task)
+                    encoded = task.result()
+                    if block is not None:
+                        encoded = bytes(block.buf[: (stop - start) * grid_points * np.dtype(np.float32).itemsize])
+                        free_blocks.append(block)
+                    if (next_start := next(starts, None)) is not None:
+                        submit(next_start)
+                    yield start, stop, encoded
+        finally:
+            for task in tasks:
+                task.cancel()
+            for memory in (input_memory, *blocks):
+                memory.close()
+                memory.unlink()
+
+    def _header(self) -> Dict[str, object]:
+        """Returns the description of the grid sent before the chunks."""
+        return {
+            "shape": self.shape,
+            "fuel": self.fuel.tolist(),
+            "wind_speed": self.wind_speed.tolist(),
+            "wind_direction": self.wind_direction,
+            "heading_step": self.heading_step,
+            "engine": self.engine,
+        }
+
+    async def ndjson_lines(self, executor: Executor, chunk_points: int) -> AsyncIterator[bytes]:
+        """
+        Streams the sweep as newline delimited JSON: the grid first, then a line per chunk with the progress,
+        the IDs of its aircraft and 'range[aircraft][fuel][wind][heading]' rounded to 0.1 km.
+
+        Arguments:
+            executor: Process pool evaluating the chunks.
+            chunk_points: Approximate number of points of a chunk.
+
+        Yields:
+            bytes: One JSON document per line.
+        """
+        yield to_json(self._header()) + b"\n"
+
+        evaluated = 0
+        async for start, stop, encoded in self.chunks(executor, chunk_points, encode=True):
+            evaluated += stop - start
+            chunk = {
+                "progress": round(evaluated / len(self.aircraft_ids), 4),
+                "aircraft_ids": self.aircraft_ids[start:stop],
+            }
+            yield to_json(chunk)[:-1] + b',"range":' + encoded + b"}\n"
+
+    async def frames(self, executor: Executor, chunk_points: int) -> AsyncIterator[bytes]:
+        """
+        Streams the sweep as binary frames: a little-endian uint32 length and a JSON header, followed for every
+        chunk by the float32 ranges of shape (aircraft, fuel, wind, headings) the header describes.
+
+        Arguments:
+            executor: Process pool evaluating the chunks.
+            chunk_points: Approximate number of points of a chunk.
+
+        Yields:
+            bytes: One frame per chunk, after the frame of the grid.
+        """
+        header = to_json(self._header())
+        yield _FRAME_HEADER.pack(len(header)) + header
+
+        evaluated = 0
+        async for start, stop, ranges in self.chunks(executor, chunk_points):
+            evaluated += stop - start
+            header = to_json(
+                {
+                    "progress": round(evaluated / len(self.aircraft_ids), 4),
+                    "aircraft_ids": self.aircraft_ids[start:stop],
+                    "shape": (stop - start, *self.shape[1:]),
+                }
+            )
+            yield _FRAME_HEADER.pack(len(header)) + header + ranges
@@ -0,0 +1,458 @@
+# Third party imports
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Dict, Iterable, NamedTuple, Sequence, Tuple
+
+# Internal imports
+from src.config.database import settings
+from src.exceptions import InvalidDataError, WeatherProviderError, WeatherUnavailableError
+from src.router.weather_api import WeatherData, default_weather_providers, fetch_weather_data
+from src.schemas import OutputWeatherStationSchema, OutputWeatherStationsSchema
+
+logger = getLogger()
+
+
+def to_number(value: Any) -> float | None:
+    """
+    Converts a value reported by a weather provider into a number.
+
+    Arguments:
+        value: Number, numeric string, "Unknown" or None.
+
+    Returns:
+        float | None: The number, None when the value is unknown.
+    """
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+
+    return number if math.isfinite(number) else None
+
+
+class WindObservation(NamedTuple):
+    """
+    Wind of an observation in numbers.
+
+    Attributes:
+        speed: Wind speed [kph], both providers report kph.
+        direction: Direction the wind blows from [deg], None when unknown.
+    """
+
+    speed: float
+    direction: float | None
+
+    @classmethod
+    def from_weather_data(cls, weather_data: WeatherData) -> "WindObservation | None":
+        """
+        Normalizes the wind of the weather data.
+
+        Arguments:
+            weather_data: Observation of a provider.
+
+        Returns:
+            WindObservation | None: The wind, None when the speed is unknown.
+        """
+        speed = to_number(weather_data.current_wind_speed)
+        if speed is None:
+            return None
+
+        return cls(speed=speed, direction=to_number(weather_data.current_wind_direction))
+
+    def tailwind(self, heading: float | None = None) -> float:
+        """
+        Returns the along-track component of the wind on the heading, positive with the wind from behind.
+        Without a heading, or when the direction is unknown, the whole wind is taken as a headwind.
+
+        Arguments:
+            heading: Track of the aircraft [deg], clockwise from north.
+
+        Returns:
+            float: Wind component [kph] added to the cruise speed.
+        """
+        if heading is None or self.direction is None:
+            return -self.speed
+
+        return -self.speed * math.cos(math.radians(self.direction - heading))
+
+
+@dataclass
+class WeatherCacheStats:
+    """
+    Data class of the weather cache counters.
+
+    Attributes:
+        hits: Reads answered with a fresh observation.
+        stale_hits: Reads answered with a stale observation while it is refreshed.
+        misses: Reads of locations without a servable observation.
+        refreshes: Observations fetched from the providers.
+        failures: Fetches no provider answered.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    failures: int = 0
+
+
+class WeatherCache:
+    """
+    Weather observations by location, served without waiting for the providers. An observation is fresh for 'ttl'
+    seconds, then it is still served for 'stale_ttl' seconds while a refresh runs in the background
+    (stale-while-revalidate). A background task started with the application refreshes the read locations before
+    they go stale and forgets the ones nobody read for 'ttl + stale_ttl' seconds. At most 'max_locations' read
+    locations are tracked, the least recently read ones are forgotten first. At most one fetch per location
+    is in flight, concurrent reads and refreshes share it, and at most 'concurrency' fetches run at once, the
+    others wait for their turn.
+
+    A location whose fetch failed is not fetched again for 'refresh_interval' seconds, doubled with every
+    consecutive failure up to 'ttl', and only the locations which returned an observation, or are configured,
+    are refreshed in the background, so unknown locations cannot keep the providers busy.
+
+    Attributes:
+        fetch: Coroutine function fetching the observation of a location, raising WeatherProviderError.
+        ttl: Seconds an observation is fresh.
+        stale_ttl: Seconds a stale observation is still served.
+        refresh_interval: Seconds between the passes of the background refresh.
+        locations: Locations kept fresh even when nobody reads them.
+        concurrency: Maximum number of fetches running at once.
+        max_locations: Maximum number of read locations tracked.
+        stats: Hit, stale hit, miss, refresh and failure counters.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[WeatherData]],
+        ttl: float,
+        stale_ttl: float,
+        refresh_interval: float,
+        locations: Iterable[str] = (),
+        concurrency: int | None = None,
+        max_locations: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.fetch = fetch
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_interval = refresh_interval
+        self.locations = set(locations)
+        self.concurrency = settings.weather_fetch_concurrency if concurrency is None else concurrency
+        self.max_locations = settings.weather_max_locations if max_locations is None else max_locations
+        self.clock = clock
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.stats = WeatherCacheStats()
+        self._entries: Dict[str, Tuple[WeatherData, float]] = {}
+        self._winds: Dict[str, WindObservation | None] = {}
+        self._last_read: OrderedDict[str, float] = OrderedDict()
+        self._failures: Dict[str, Tuple[int, float]] = {}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _age(self, location: str) -> float:
+        """Returns the seconds since the observation of the location was fetched, infinity when there is none."""
+        entry = self._entries.get(location)
+        return math.inf if entry is None else self.clock() - entry[1]
+
+    def _backing_off(self, location: str) -> bool:
+        """Returns whether the location failed recently and is not fetched again yet."""
+        failure = self._failures.get(location)
+        return failure is not None and self.clock() < failure[1]
+
+    def _track(self, location: str) -> None:
+        """Marks the location as read, forgetting the least recently read ones beyond 'max_locations'."""
+        self._last_read[location] = self.clock()
+        self._last_read.move_to_end(location)
+        while len(self._last_read) > self.max_locations:
+            self._forget(next(iter(self._last_read)))
+
+    def _forget(self, location: str) -> None:
+        """Removes the observation, the read time and the failures of the location."""
+        self._last_read.pop(location, None)
+        self._entries.pop(location, None)
+        self._winds.pop(location, None)
+        self._failures.pop(location, None)
+
+    def peek(self, location: str) -> WeatherData | None:
+        """
+        Returns the cached observation without waiting, a stale or missing one is refreshed in the background.
+
+        Arguments:
+            location: Queried location.
+
+        Returns:
+            WeatherData | None: Fresh or stale observation, None when there is no servable one yet.
+        """
+        self._track(location)
+        age = self._age(location)
+        if age < self.ttl:
+            self.stats.hits += 1
+            return self._entries[location][0]
+
+        if not self._backing_off(location):
+            self.refresh(location)
+        if age < self.ttl + self.stale_ttl:
+            self.stats.stale_hits += 1
+            return self._entries[location][0]
+
+        self.stats.misses += 1
+        return None
+
+    def wind(self, location: str) -> WindObservation | None:
+        """
+        Returns the wind of the cached observation like 'peek', normalized when the observation was fetched.
+
+        Arguments:
+            location: Queried location.
+
+        Returns:
+            WindObservation | None: The wind, None when there is no servable observation or its wind is unknown.
+        """
+        if self.peek(location) is None:
+            return None
+
+        return self._winds[location]
+
+    async def get(self, location: str) -> WeatherData:
+        """
+        Returns the cached observation like 'peek', waits for the fetch only when there is no servable one.
+
+        Arguments:
+            location: Queried location.
+
+        Returns:
+            WeatherData: Observation of the location.
+
+        Raises:
+            WeatherProviderError: If no provider answered, now or recently.
+        """
+        weather_data = self.peek(location)
+        if weather_data is None and self._backing_off(location):
+            raise WeatherProviderError(f"Weather of {location} is unavailable, it failed recently.")
+        if weather_data is None:
+            # Shielded, so a cancelled request does not cancel the fetch shared with the other readers.
+            weather_data = await asyncio.shield(self.refresh(location))
+
+        return weather_data
+
+    async def get_many(self, locations: Iterable[str]) -> Dict[str, WeatherData | WeatherProviderError]:
+        """
+        Returns the observations of many locations like 'get', fetching the missing ones concurrently. Repeated
+        locations are fetched once, as are the locations already in flight for other readers.
+
+        Arguments:
+            locations: Queried locations.
+
+        Returns:
+            Dict[str, WeatherData | WeatherProviderError]: Observation of every distinct location, in the order of
+            the locations, or the error when no provider answered.
+        """
+        unique = list(dict.fromkeys(locations))
+        results = await asyncio.gather(*(self.get(location) for location in unique), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, WeatherProviderError):
+                raise result
+
+        return dict(zip(unique, results))
+
+    def refresh(self, location: str) -> asyncio.Task:
+        """
+        Starts fetching the observation of the location, unless a fetch is already in flight.
+
+        Arguments:
+            location: Refreshed location.
+
+        Returns:
+            asyncio.Task: Fetch of the location, resolving to its observation.
+        """
+        task = self._in_flight.get(location)
+        if task is None:
+            task = asyncio.create_task(self._refresh(location))
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._in_flight[location] = task
+
+        return task
+
+    async def _refresh(self, location: str) -> WeatherData:
+        """
+        Fetches and stores the observation of a tracked location, failures keep the previous one and back off
+        the location.
+        """
+        try:
+            async with self._semaphore:
+                weather_data = await self.fetch(location)
+        except WeatherProviderError as err:
+            self.stats.failures += 1
+            failures = self._failures.get(location, (0, 0.0))[0] + 1
+            backoff = min(self.ttl, self.refresh_interval * 2 ** (failures - 1))
+            if location in self._last_read or location in self.locations:
+                self._failures[location] = (failures, self.clock() + backoff)
+            logger.error(f"Failed to refresh the weather of {location}, next attempt in {backoff:.0f} s: {err.message}")
+            raise
+        finally:
+            self._in_flight.pop(location, None)
+
+        self.stats.refreshes += 1
+        self._failures.pop(location, None)
+        if location not in self._last_read and location not in self.locations:
+            return weather_data
+
+        self._entries[location] = (weather_data, self.clock())
+        self._winds[location] = WindObservation.from_weather_data(weather_data)
+
+        return weather_data
+
+    async def refresh_due(self) -> None:
+        """
+        Refreshes the observations which would expire before the next pass, of the configured locations and of
+        the read ones which returned an observation, except the locations backing off after a failure. Forgets the
+        locations nobody read for 'ttl + stale_ttl' seconds.
+        """
+        now = self.clock()
+        for location, last_read in list(self._last_read.items()):
+            if location not in self.locations and now - last_read > self.ttl + self.stale_ttl:
+                self._forget(location)
+
+        due = [
+            location
+            for location in self.locations | self._entries.keys()
+            if self._age(location) >= self.ttl - self.refresh_interval and not self._backing_off(location)
+        ]
+        await asyncio.gather(*(self.refresh(location) for location in due), return_exceptions=True)
+
+    async def run(self) -> None:
+        """Refreshes the due locations every 'refresh_interval' seconds until cancelled."""
+        while True:
+            await self.refresh_due()
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        """Starts the background refresh."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stops the background refresh and cancels the fetches in flight."""
+        tasks = [*self._in_flight.values(), *([self._task] if self._task is not None else [])]
+        self._task = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError, WeatherProviderError):
+                await task
+
+    def clear(self) -> None:
+        """Removes all the observations and resets the counters."""
+        self._entries.clear()
+        self._winds.clear()
+        self._last_read.clear()
+        self._failures.clear()
+        self.stats = WeatherCacheStats()
+
+    def occupancy(self) -> Dict[str, int]:
+        """
+        Returns the number of cached observations, of tracked locations, of locations backing off after a failure
+        and of fetches in flight, running or waiting for their turn.
+        """
+        return {
+            "entries": len(self._entries),
+            "tracked": len(self._last_read),
+            "backing_off": sum(self._backing_off(location) for location in self._failures),
+            "in_flight": len(self._in_flight),
+        }
+
+
+weather_providers = default_weather_providers()
+
+
+async def fetch_shared_weather_data(location: str) -> WeatherData:
+    """Fetches the weather data of the location from the providers through the cache shared by the workers."""
+    return await fetch_weather_data(location, weather_providers.request_weather_data)
+
+
+weather_cache = WeatherCache(
+    fetch=fetch_shared_weather_data,
+    ttl=settings.weather_cache_ttl,
+    stale_ttl=settings.weather_stale_ttl,
+    refresh_interval=settings.weather_refresh_interval,
+    locations=settings.weather_locations,
+)
+
+
+def live_wind_speed(location: str | None, heading: float | None = None, cache: WeatherCache = weather_cache) -> float:
+    """
+    Returns the live wind component on the heading at the location, read from the cache without waiting for
+    the providers.
+
+    Arguments:
+        location: Location of the wind.
+        heading: Track of the aircraft [deg], the whole wind is a headwind when not given.
+        cache: Weather cache holding the observations.
+
+    Returns:
+        float: Wind component [kph] added to the cruise speed.
+
+    Raises:
+        InvalidDataError: If no location is given.
+        WeatherUnavailableError: If the wind of the location is not known yet, it is being fetched.
+    """
+    if location is None:
+        raise InvalidDataError("Provide the 'wind_speed' or the 'location' of the live wind.")
+
+    wind = cache.wind(location)
+    if wind is None:
+        raise WeatherUnavailableError(f"Live wind of {location} is not available yet, retry shortly.")
+
+    return wind.tailwind(heading)
+
+
+async def weather_stations(
+    locations: Sequence[str], cache: WeatherCache = weather_cache
+) -> OutputWeatherStationsSchema:
+    """
+    Returns the observations of many locations in numbers, fetched at once through the cache: repeated locations
+    and the ones already in flight are fetched once, and the providers are queried within the concurrency and rate
+    limits.
+
+    Arguments:
+        locations: Queried locations.
+        cache: Weather cache holding the observations.
+
+    Returns:
+        OutputWeatherStationsSchema: Observation of every location, in the order of the locations.
+
+    Raises:
+        InvalidDataError: If more than 'WEATHER_MAX_STATIONS' distinct locations are queried.
+    """
+    if len(set(locations)) > settings.weather_max_stations:
+        raise InvalidDataError(f"Query at most {settings.weather_max_stations} distinct locations at once.")
+
+    observations = await cache.get_many(locations)
+
+    stations = []
+    for location in locations:
+        weather_data = observations[location]
+        if isinstance(weather_data, WeatherProviderError):
+            stations.append(OutputWeatherStationSchema(location=location, error=weather_data.message))
+            continue
+
+        stations.append(
+            OutputWeatherStationSchema(
+                location=location,
+                name=None if weather_data.name in (None, "Unknown") else weather_data.name,
+                last_updated=None if weather_data.last_updated in (None, "Unknown") else weather_data.last_updated,
+                wind_speed=to_number(weather_data.current_wind_speed),
+                wind_direction=to_number(weather_data.current_wind_direction),
+                temperature=to_number(weather_data.current_temperature),
+            )
+        )
+
+    return OutputWeatherStationsSchema(stations=stations)
@@ -0,0 +1,229 @@
+# Third party imports
+import csv
+from logging import getLogger
+from typing import List, Tuple
+
+import numpy as np
+
+# Internal imports
+from src.config.database import settings
+from src.exceptions import AirportsUnavailableError
+
+logger = getLogger()
+
+EARTH_RADIUS = 6371.0
+
+
+def unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Converts geographic coordinates into points on the unit sphere.
+
+    Arguments:
+        latitudes: Latitudes [deg].
+        longitudes: Longitudes [deg].
+
+    Returns:
+        np.ndarray: Cartesian coordinates, shape (points, 3).
+    """
+    latitudes, longitudes = np.radians(latitudes), np.radians(longitudes)
+
+    return np.column_stack(
+        [np.cos(latitudes) * np.cos(longitudes), np.cos(latitudes) * np.sin(longitudes), np.sin(latitudes)]
+    )
+
+
+class AirportIndex:
+    """
+    In-memory spatial index of airports answering great-circle radius queries. Airports are stored as points on
+    the unit sphere in a KD-tree, as the straight-line (chord) distance between two points grows with their
+    great-circle distance, boxes of the tree farther than the chord of the radius are skipped and only the
+    airports of the remaining leaves are measured exactly.
+
+    Attributes:
+        idents: ICAO or local identifiers of the airports, in the order of the tree.
+        names: Names of the airports.
+        latitudes: Latitudes of the airports [deg].
+        longitudes: Longitudes of the airports [deg].
+        leaf_size: Maximum number of airports in a leaf of the tree.
+    """
+
+    def __init__(
+        self,
+        idents: List[str],
+        names: List[str],
+        latitudes: List[float],
+        longitudes: List[float],
+        leaf_size: int = 128,
+    ) -> None:
+        self.leaf_size = leaf_size
+        self._points = unit_vectors(np.asarray(latitudes, dtype=float), np.asarray(longitudes, dtype=float))
+        self._start: List[int] = []
+        self._stop: List[int] = []
+        self._lower: List[np.ndarray] = []
+        self._upper: List[np.ndarray] = []
+        self._children: List[Tuple[int, int]] = []
+
+        order = np.arange(len(self._points))
+        if len(order):
+            self._build(order, 0, len(order))
+
+        # Airports of a node are contiguous in the tree order, so a leaf is a slice of the arrays.
+        self._points = self._points[order]
+        self.idents = np.asarray(idents, dtype=object)[order]
+        self.names = np.asarray(names, dtype=object)[order]
+        self.latitudes = np.asarray(latitudes, dtype=float)[order]
+        self.longitudes = np.asarray(longitudes, dtype=float)[order]
+        self._bounds = [(*lower.tolist(), *upper.tolist()) for lower, upper in zip(self._lower, self._upper)]
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _build(self, order: np.ndarray, start: int, stop: int) -> int:
+        """
+        Adds the node of the airports 'order[start:stop]' and its subtree, splitting at the median of the widest
+        axis until the leaves hold at most 'leaf_size' airports.
+
+        Returns:
+            int: Index of the node.
+        """
+        node = len(self._start)
+        points = self._points[order[start:stop]]
+        self._start.append(start)
+        self._stop.append(stop)
+        self._lower.append(points.min(axis=0))
+        self._upper.append(points.max(axis=0))
+        self._children.append((-1, -1))
+
+        if stop - start > self.leaf_size:
+            axis = int(np.argmax(self._upper[node] - self._lower[node]))
+            middle = (start + stop) // 2
+            segment = order[start:stop]
+            order[start:stop] = segment[np.argpartition(points[:, axis], middle - start)]
+            self._children[node] = (self._build(order, start, middle), self._build(order, middle, stop))
+
+        return node
+
+    def within(self, latitude: float, longitude: float, radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the airports within the great-circle distance of the origin.
+
+        Arguments:
+            latitude: Latitude of the origin [deg].
+            longitude: Longitude of the origin [deg].
+            radius: Great-circle distance [km].
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Positions of the airports in the index, their distances [km]
+            and initial true courses from the origin [deg], ordered from the nearest.
+        """
+        origin = unit_vectors(np.array([latitude]), np.array([longitude]))[0]
+        chord = 2.0 * np.sin(min(radius / EARTH_RADIUS, np.pi) / 2.0)
+
+        # Boxes are tested on Python floats, small NumPy operations would cost more than the arithmetic.
+        x, y, z = origin.tolist()
+        squared_chord = chord * chord
+        leaves = []
+        stack = [0] if len(self) else []
+        while stack:
+            node = stack.pop()
+            lower_x, lower_y, lower_z, upper_x, upper_y, upper_z = self._bounds[node]
+            gap_x = max(lower_x - x, 0.0, x - upper_x)
+            gap_y = max(lower_y - y, 0.0, y - upper_y)
+            gap_z = max(lower_z - z, 0.0, z - upper_z)
+            if gap_x * gap_x + gap_y * gap_y + gap_z * gap_z > squared_chord:
+                continue
+
+            # A box whose farthest corner is within the radius is taken whole without visiting its subtree.
+            reach_x = max(x - lower_x, upper_x - x)
+            reach_y = max(y - lower_y, upper_y - y)
+            reach_z = max(z - lower_z, upper_z - z)
+            left, right = self._children[node]
+            if left < 0 or reach_x * reach_x + reach_y * reach_y + reach_z * reach_z <= squared_chord:
+                leaves.append(np.arange(self._start[node], self._stop[node]))
+            else:
+                stack.extend((left, right))
+
+        positions = np.concatenate(leaves) if leaves else np.empty(0, dtype=int)
+        chords = np.linalg.norm(self._points[positions] - origin, axis=1)
+        distances = 2.0 * EARTH_RADIUS * np.arcsin(np.clip(chords / 2.0, 0.0, 1.0))
+
+        inside = distances <= radius
+        positions, distances = positions[inside], distances[inside]
+        nearest = np.argsort(distances, kind="stable")
+        positions, distances = positions[nearest], distances[nearest]
+
+        return positions, distances, self.courses(latitude, longitude, positions)
+
+    def courses(self, latitude: float, longitude: float, positions: np.ndarray) -> np.ndarray:
+        """
+        Calculates the initial true course of the great circle from the origin to the airports.
+
+        Arguments:
+            latitude: Latitude of the origin [deg].
+            longitude: Longitude of the origin [deg].
+            positions: Positions of the airports in the index.
+
+        Returns:
+            np.ndarray: Courses [deg], clockwise from north.
+        """
+        origin_latitude = np.radians(latitude)
+        latitudes = np.radians(self.latitudes[positions])
+        delta_longitude = np.radians(self.longitudes[positions] - longitude)
+
+        course = np.arctan2(
+            np.sin(delta_longitude) * np.cos(latitudes),
+            np.cos(origin_latitude) * np.sin(latitudes)
+            - np.sin(origin_latitude) * np.cos(latitudes) * np.cos(delta_longitude),
+        )
+
+        return np.degrees(course) % 360.0
+
+
+def load_airports(path: str) -> AirportIndex:
+    """
+    Builds the airport index from a CSV file with 'ident', 'name', 'latitude_deg' and 'longitude_deg' columns,
+    like the OurAirports data set. Closed airports and rows without coordinates are skipped.
+
+    Arguments:
+        path: Path of the CSV file.
+
+    Returns:
+        AirportIndex: Index of the airports.
+    """
+    idents, names, latitudes, longitudes = [], [], [], []
+    with open(path, newline="", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            if row.get("type") == "closed" or not row.get("latitude_deg") or not row.get("longitude_deg"):
+                continue
+            idents.append(row["ident"])
+            names.append(row["name"])
+            latitudes.append(float(row["latitude_deg"]))
+            longitudes.append(float(row["longitude_deg"]))
+
+    logger.info(f"Loaded {len(idents)} airports from {path}.")
+
+    return AirportIndex(idents, names, latitudes, longitudes)
+
+
+_airport_index: AirportIndex | None = None
+
+
+def get_airport_index() -> AirportIndex:
+    """
+    Returns the index of the airports of 'AIRPORTS_CSV', loaded on the first use.
+
+    Returns:
+        AirportIndex: Index of the airports.
+
+    Raises:
+        AirportsUnavailableError: If the CSV file cannot be read.
+    """
+    global _airport_index
+    if _airport_index is None:
+        try:
+            _airport_index = load_airports(settings.airports_csv)
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"Failed to load airports: {e}.")
+            raise AirportsUnavailableError() from e
+
+    return _airport_index
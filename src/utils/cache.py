@@ -0,0 +1,384 @@
+# Third party imports
+import math
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Protocol, Sequence, Tuple
+
+from pydantic import BaseModel
+
+# Internal imports
+from src.config.database import settings
+
+logger = getLogger()
+
+
+@dataclass
+class CacheStats:
+    """
+    Data class of the cache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups of absent or expired entries.
+        evictions: Entries removed to respect the entry or byte limit.
+        expirations: Entries removed because their time to live passed.
+        invalidations: Entries removed by invalidation of their namespace.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimates the memory taken by a cached value, pydantic models are measured by the length of their JSON.
+
+    Arguments:
+        value: Cached value.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    if isinstance(value, BaseModel):
+        return len(value.__pydantic_serializer__.to_json(value))
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    In-process cache evicting the least recently used entries once the number of entries or their total size
+    exceeds the limits, entries also expire after a time to live. Keys are grouped in namespaces, so all the
+    entries derived from a record can be invalidated at once. The cache is meant to be used from the event loop
+    and is not thread-safe.
+
+    Attributes:
+        max_entries: Maximum number of entries.
+        max_bytes: Maximum estimated size of all the entries.
+        ttl: Time to live of an entry in seconds.
+        stats: Hit, miss, eviction, expiration and invalidation counters.
+    """
+
+    def __init__(
+        self, max_entries: int, max_bytes: int, ttl: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self.size_bytes = 0
+        self._entries: OrderedDict[Tuple[Hashable, Hashable], Tuple[Any, int, float]] = OrderedDict()
+        self._namespaces: Dict[Hashable, set] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, namespace: Hashable, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value and marks it as the most recently used.
+
+        Arguments:
+            namespace: Namespace of the entry.
+            key: Key of the entry within the namespace.
+            default: Value returned when the entry is absent or expired.
+
+        Returns:
+            Any: Cached value or the default.
+        """
+        entry = self._entries.get((namespace, key))
+        if entry is not None and entry[2] <= self.clock():
+            self._remove((namespace, key))
+            self.stats.expirations += 1
+            entry = None
+
+        if entry is None:
+            self.stats.misses += 1
+            return default
+
+        self._entries.move_to_end((namespace, key))
+        self.stats.hits += 1
+
+        return entry[0]
+
+    def set(
+        self, namespace: Hashable, key: Hashable, value: Any, size: int | None = None, ttl: float | None = None
+    ) -> None:
+        """
+        Stores the value and evicts the least recently used entries exceeding the limits. Values larger than
+        the byte limit are not stored.
+
+        Arguments:
+            namespace: Namespace of the entry.
+            key: Key of the entry within the namespace.
+            value: Value to store.
+            size: Size of the value in bytes, estimated when not given.
+            ttl: Time to live of the entry in seconds, the cache's one when not given.
+        """
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            return
+
+        if (namespace, key) in self._entries:
+            self._remove((namespace, key))
+        self._entries[(namespace, key)] = (value, size, self.clock() + (self.ttl if ttl is None else ttl))
+        self._namespaces.setdefault(namespace, set()).add(key)
+        self.size_bytes += size
+
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def invalidate(self, namespaces: Iterable[Hashable]) -> None:
+        """
+        Removes all the entries of the namespaces.
+
+        Arguments:
+            namespaces: Namespaces to invalidate.
+        """
+        for namespace in namespaces:
+            for key in self._namespaces.get(namespace, set()).copy():
+                self._remove((namespace, key))
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Removes all the entries and resets the counters."""
+        self._entries.clear()
+        self._namespaces.clear()
+        self.size_bytes = 0
+        self.stats = CacheStats()
+
+    def _remove(self, entry_key: Tuple[Hashable, Hashable]) -> None:
+        """Removes a single entry and its key from the namespace."""
+        namespace, key = entry_key
+        _, size, _ = self._entries.pop(entry_key)
+        self.size_bytes -= size
+
+        keys = self._namespaces[namespace]
+        keys.discard(key)
+        if not keys:
+            del self._namespaces[namespace]
+
+
+class CacheBackend(Protocol):
+    """
+    Asynchronous cache of encoded values grouped in namespaces, shared by the application and its workers.
+    A value loaded from the database is stored only if no namespace was invalidated since 'generation'
+    was read before loading it, so a read racing a write does not cache data older than the write.
+
+    Attributes:
+        stats: Hit, miss, eviction, expiration and invalidation counters of this process.
+    """
+
+    stats: CacheStats
+
+    async def get_many(self, keys: Sequence[Tuple[str, str]]) -> List[bytes | None]:
+        """Returns the values of the (namespace, key) pairs, None for the missing ones."""
+        ...
+
+    async def set_many(
+        self, items: Sequence[Tuple[str, str, bytes]], ttl: float | None = None, generation: int | None = None
+    ) -> None:
+        """Stores the (namespace, key, value) items unless the cache was invalidated after 'generation'."""
+        ...
+
+    async def generation(self) -> int:
+        """Returns the counter of invalidations."""
+        ...
+
+    async def invalidate(self, namespaces: Iterable[str]) -> None:
+        """Removes all the entries of the namespaces."""
+        ...
+
+    async def clear(self) -> None:
+        """Removes all the entries."""
+        ...
+
+    def occupancy(self) -> Dict[str, int]:
+        """Returns the number of entries, their size and the limits, when known to the process."""
+        ...
+
+
+class InMemoryCacheBackend:
+    """
+    Cache backend keeping the values in the LRUCache of the process, every worker holds its own copy.
+
+    Attributes:
+        cache: LRUCache holding the values.
+    """
+
+    def __init__(self, cache: LRUCache) -> None:
+        self.cache = cache
+        self._generation = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    async def get_many(self, keys: Sequence[Tuple[str, str]]) -> List[bytes | None]:
+        return [self.cache.get(namespace, key) for namespace, key in keys]
+
+    async def set_many(
+        self, items: Sequence[Tuple[str, str, bytes]], ttl: float | None = None, generation: int | None = None
+    ) -> None:
+        if generation is not None and generation != self._generation:
+            return
+
+        for namespace, key, value in items:
+            self.cache.set(namespace, key, value, size=len(value), ttl=ttl)
+
+    async def generation(self) -> int:
+        return self._generation
+
+    async def invalidate(self, namespaces: Iterable[str]) -> None:
+        self._generation += 1
+        self.cache.invalidate(namespaces)
+
+    async def clear(self) -> None:
+        self._generation += 1
+        self.cache.clear()
+
+    def occupancy(self) -> Dict[str, int]:
+        return {
+            "entries": len(self.cache),
+            "size_bytes": self.cache.size_bytes,
+            "max_entries": self.cache.max_entries,
+            "max_bytes": self.cache.max_bytes,
+        }
+
+
+class RedisCacheBackend:
+    """
+    Cache backend keeping the values in Redis (or any server speaking its protocol), so all the workers share
+    the entries. Every entry is its own key expiring 'ttl' seconds after it was written. The key holds the version
+    of its namespace, so invalidation only moves the namespace to a new version, taken from the global
+    invalidation counter so it is never reused, and the entries of the old version are no longer read until they
+    expire. Lookups and writes of many keys are sent in pipelines.
+
+    Attributes:
+        client: redis.asyncio client.
+        ttl: Default time to live of an entry in seconds.
+        prefix: Prefix of the Redis keys.
+        stats: Hit, miss and invalidation counters of this process, invalidations count the namespaces.
+    """
+
+    def __init__(self, client: Any, ttl: float, prefix: str = "aircraft_manager:") -> None:
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.stats = CacheStats()
+
+    @classmethod
+    def from_url(cls, url: str, ttl: float) -> "RedisCacheBackend":
+        """
+        Creates the backend with a client connected to the URL, requires the optional 'redis' package.
+
+        Arguments:
+            url: Redis URL, e.g. 'redis://localhost:6379/0'.
+            ttl: Default time to live of an entry in seconds.
+
+        Returns:
+            RedisCacheBackend: Backend using the new client.
+        """
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ImportError("Install the 'redis' extra to use a Redis cache backend.") from e
+
+        return cls(client=Redis.from_url(url), ttl=ttl)
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}{name}"
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.prefix}version:{namespace}"
+
+    def _entry_key(self, namespace: str, version: bytes | int | None, key: str) -> str:
+        return f"{self.prefix}{namespace}:{int(version or 0)}:{key}"
+
+    async def get_many(self, keys: Sequence[Tuple[str, str]]) -> List[bytes | None]:
+        if not keys:
+            return []
+
+        namespaces = list(dict.fromkeys(namespace for namespace, _ in keys))
+        versions = dict(zip(namespaces, await self.client.mget([self._version_key(name) for name in namespaces])))
+        values = await self.client.mget(
+            [self._entry_key(namespace, versions[namespace], key) for namespace, key in keys]
+        )
+
+        hits = sum(value is not None for value in values)
+        self.stats.hits += hits
+        self.stats.misses += len(values) - hits
+
+        return values
+
+    async def set_many(
+        self, items: Sequence[Tuple[str, str, bytes]], ttl: float | None = None, generation: int | None = None
+    ) -> None:
+        if not items:
+            return
+
+        namespaces = list(dict.fromkeys(namespace for namespace, _, _ in items))
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.get(self._key("generation"))
+        pipeline.mget([self._version_key(name) for name in namespaces])
+        current_generation, versions = await pipeline.execute()
+        if generation is not None and generation != int(current_generation or 0):
+            return
+
+        versions = dict(zip(namespaces, versions))
+        expire = max(1, math.ceil(self.ttl if ttl is None else ttl))
+        pipeline = self.client.pipeline(transaction=False)
+        for namespace, key, value in items:
+            pipeline.set(self._entry_key(namespace, versions[namespace], key), value, ex=expire)
+        await pipeline.execute()
+
+    async def generation(self) -> int:
+        return int(await self.client.get(self._key("generation")) or 0)
+
+    async def invalidate(self, namespaces: Iterable[str]) -> None:
+        namespaces = list(namespaces)
+        generation = await self.client.incr(self._key("generation"))
+        pipeline = self.client.pipeline(transaction=False)
+        for namespace in namespaces:
+            pipeline.set(self._version_key(namespace), generation)
+        await pipeline.execute()
+        self.stats.invalidations += len(namespaces)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=f"{self.prefix}*")]
+        if keys:
+            await self.client.delete(*keys)
+
+    def occupancy(self) -> Dict[str, int]:
+        return {}
+
+
+def create_cache_backend(url: str | None) -> CacheBackend:
+    """
+    Creates the cache backend configured by the URL.
+
+    Arguments:
+        url: 'redis://' or 'rediss://' URL of a shared cache, None or 'memory://' for the in-process cache.
+
+    Returns:
+        CacheBackend: Configured cache backend.
+    """
+    if url and url.startswith(("redis://", "rediss://", "unix://")):
+        logger.info("Using the Redis cache backend.")
+        return RedisCacheBackend.from_url(url, ttl=settings.cache_ttl)
+
+    return InMemoryCacheBackend(
+        LRUCache(max_entries=settings.cache_max_entries, max_bytes=settings.cache_max_bytes, ttl=settings.cache_ttl)
+    )
+
+
+cache_backend = create_cache_backend(settings.cache_url)
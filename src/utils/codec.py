@@ -0,0 +1,184 @@
+# Third party imports
+import struct
+from enum import Enum
+from typing import Any, List, Tuple, Union, get_args
+
+from pydantic import BaseModel
+
+FORMAT_VERSION = 1
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _TUPLE = range(7)
+_HEADER = struct.Struct("<B")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+
+Packable = Union[None, bool, int, float, str, Tuple["Packable", ...]]
+
+
+def pack(value: Packable) -> bytes:
+    """
+    Encodes None, booleans, integers, floats, strings and nested tuples of them into a compact binary form
+    prefixed with the format version. Unlike pickle the decoder never builds arbitrary objects, so it is safe
+    on data read from a cache shared with other processes.
+
+    Arguments:
+        value: Value to encode.
+
+    Returns:
+        bytes: Encoded value.
+    """
+    chunks = [_HEADER.pack(FORMAT_VERSION)]
+    _pack_into(value, chunks)
+
+    return b"".join(chunks)
+
+
+def _pack_into(value: Packable, chunks: List[bytes]) -> None:
+    """Appends the tagged encoding of the value to the chunks."""
+    if value is None:
+        chunks.append(_HEADER.pack(_NONE))
+    elif value is True or value is False:
+        chunks.append(_HEADER.pack(_TRUE if value else _FALSE))
+    elif isinstance(value, int):
+        chunks.append(_HEADER.pack(_INT) + _INT64.pack(value))
+    elif isinstance(value, float):
+        chunks.append(_HEADER.pack(_FLOAT) + _FLOAT64.pack(value))
+    elif isinstance(value, str):
+        encoded = value.encode()
+        chunks.append(_HEADER.pack(_STR) + _LENGTH.pack(len(encoded)) + encoded)
+    elif isinstance(value, (tuple, list)):
+        chunks.append(_HEADER.pack(_TUPLE) + _LENGTH.pack(len(value)))
+        for item in value:
+            _pack_into(item, chunks)
+    else:
+        raise TypeError(f"Cannot pack value of type {type(value).__name__}.")
+
+
+def unpack(data: bytes) -> Packable:
+    """
+    Decodes a value encoded by 'pack'.
+
+    Arguments:
+        data: Encoded value.
+
+    Returns:
+        Packable: Decoded value, sequences are decoded as tuples.
+
+    Raises:
+        ValueError: If the data was encoded in another format version.
+    """
+    if not data or data[0] != FORMAT_VERSION:
+        raise ValueError("Unsupported cache value format.")
+
+    value, _ = _unpack_from(memoryview(data), 1)
+
+    return value
+
+
+def _unpack_from(data: memoryview, offset: int) -> Tuple[Packable, int]:
+    """Decodes the value starting at the offset and returns it with the offset of the next value."""
+    tag = data[offset]
+    offset += 1
+
+    if tag == _NONE:
+        return None, offset
+    if tag in (_FALSE, _TRUE):
+        return tag == _TRUE, offset
+    if tag == _INT:
+        return _INT64.unpack_from(data, offset)[0], offset + _INT64.size
+    if tag == _FLOAT:
+        return _FLOAT64.unpack_from(data, offset)[0], offset + _FLOAT64.size
+
+    (length,) = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    if tag == _STR:
+        return str(data[offset : offset + length], "utf-8"), offset + length
+    if tag == _TUPLE:
+        items = []
+        for _ in range(length):
+            item, offset = _unpack_from(data, offset)
+            items.append(item)
+        return tuple(items), offset
+
+    raise ValueError(f"Unknown cache value tag {tag}.")
+
+
+def _nested_schema(annotation: Any) -> type[BaseModel] | None:
+    """Returns the model class of a field annotated with a model or an optional model."""
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+
+    return None
+
+
+def model_to_tuple(model: BaseModel) -> Tuple[Packable, ...]:
+    """
+    Converts the model into a tuple of its field values in declaration order, nested models into nested tuples.
+    Computed fields are left out, they are recomputed when the model is rebuilt.
+
+    Arguments:
+        model: Model to convert.
+
+    Returns:
+        Tuple[Packable, ...]: Positional field values.
+    """
+    values = []
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        if isinstance(value, BaseModel):
+            value = model_to_tuple(value)
+        elif isinstance(value, Enum):
+            value = value.value
+        values.append(value)
+
+    return tuple(values)
+
+
+def tuple_to_model(schema: type[BaseModel], values: Tuple[Packable, ...]) -> BaseModel:
+    """
+    Rebuilds and validates a model of the schema from the positional field values made by 'model_to_tuple'.
+
+    Arguments:
+        schema: Model class of the values.
+        values: Positional field values.
+
+    Returns:
+        BaseModel: Rebuilt model.
+    """
+    fields = {}
+    for (name, field), value in zip(schema.model_fields.items(), values):
+        nested_schema = _nested_schema(field.annotation)
+        if nested_schema is not None and value is not None:
+            value = tuple_to_model(nested_schema, value)
+        fields[name] = value
+
+    return schema.model_validate(fields)
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """
+    Encodes the model into the compact positional binary form.
+
+    Arguments:
+        model: Model to encode.
+
+    Returns:
+        bytes: Encoded model.
+    """
+    return pack(model_to_tuple(model))
+
+
+def decode_model(schema: type[BaseModel], data: bytes) -> BaseModel:
+    """
+    Decodes a model of the schema encoded by 'encode_model'.
+
+    Arguments:
+        schema: Model class of the encoded model.
+        data: Encoded model.
+
+    Returns:
+        BaseModel: Decoded model.
+    """
+    return tuple_to_model(schema, unpack(data))
@@ -0,0 +1,49 @@
+# Third party imports
+from typing import Dict
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Builds a strong entity tag from the parts identifying the version of a representation.
+
+    Arguments:
+        parts: values identifying the representation, e.g. the kind of resource, its 'id' and version.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    return '"{}"'.format("-".join(str(part) for part in parts))
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Checks the 'If-None-Match' request header against the current entity tag, with the weak comparison
+    required for this header.
+
+    Arguments:
+        if_none_match: value of the 'If-None-Match' header, None when it is missing.
+        etag: current entity tag of the representation.
+
+    Returns:
+        bool: True if the client already holds the current representation.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def revalidation_headers(etag: str) -> Dict[str, str]:
+    """
+    Returns the headers letting clients and proxies store a response, as long as they revalidate it
+    with the entity tag before every reuse.
+
+    Arguments:
+        etag: current entity tag of the representation.
+
+    Returns:
+        Dict[str, str]: 'ETag' and 'Cache-Control' headers.
+    """
+    return {"ETag": etag, "Cache-Control": "no-cache"}
@@ -1,8 +1,14 @@
+# Third party imports
+from sqlalchemy import text
+
 # Internal imports
 from src.config.database import engine
 from src.models import Base
 
 
-def create_tables():
-    """Creates all tables in the database."""
-    Base.metadata.create_all(bind=engine)
+async def create_tables():
+    """Creates all tables in the database, with the 'pg_trgm' extension their trigram indexes need on PostgreSQL."""
+    async with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.run_sync(Base.metadata.create_all)
@@ -0,0 +1,116 @@
+# Third party imports
+import math
+
+import numpy as np
+
+# Internal imports
+from src.config.database import settings
+from src.utils.cache import LRUCache
+
+
+def flight_range(ground_speed, fuel, fuel_consumption):
+    """
+    Calculates the range [km] of the linear engine, flying at the ground speed until the fuel is burnt
+    at the constant consumption. 'Performance' and the performance tables compute every linear range with it,
+    and 'AircraftData.flight_range' builds its SQL expression from it.
+
+    Arguments:
+        ground_speed: Ground speed, the cruise speed with the wind component, a number, array or SQL expression.
+        fuel: Fuel on board.
+        fuel_consumption: Fuel consumption per hour.
+
+    Returns:
+        Range of the same kind as the arguments.
+    """
+    return ground_speed * fuel / fuel_consumption
+
+
+class PerformanceTable:
+    """
+    Range and endurance of a single aircraft precomputed on a regular grid of fuel amounts and wind speeds,
+    held in contiguous arrays. A lookup finds the grid cell by arithmetic and interpolates between its corners,
+    so it costs the same whatever the size of the grid. Range is bilinear and endurance linear in fuel and wind,
+    which makes the interpolated values exact up to rounding.
+
+    Attributes:
+        name: Name of the aircraft.
+        fuel: Fuel amounts of the grid, from 0 to the fuel capacity of the aircraft.
+        wind_speed: Wind speeds of the grid, symmetric around 0.
+        range: Range for every fuel amount (rows) and wind speed (columns).
+        endurance: Endurance in hours for every fuel amount.
+    """
+
+    def __init__(
+        self, name: str, cruise_speed: float, fuel_consumption: float, max_fuel: float, max_wind: float, size: int
+    ) -> None:
+        self.name = name
+        self.fuel = np.linspace(0.0, max_fuel, size)
+        self.wind_speed = np.linspace(-max_wind, max_wind, size)
+        self.range = flight_range(cruise_speed + self.wind_speed[None, :], self.fuel[:, None], fuel_consumption)
+        self.endurance = self.fuel / fuel_consumption
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the size of the arrays of the table."""
+        return self.fuel.nbytes + self.wind_speed.nbytes + self.range.nbytes + self.endurance.nbytes
+
+    @staticmethod
+    def _cell(value: float, grid: np.ndarray) -> tuple[int, float] | None:
+        """Returns the index of the grid cell holding the value and the position within it, None outside the grid."""
+        if not grid[0] <= value <= grid[-1] or grid[0] == grid[-1]:
+            return None
+
+        position = (value - grid[0]) / (grid[1] - grid[0])
+        index = min(int(position), len(grid) - 2)
+
+        return index, position - index
+
+    def lookup_range(self, fuel: float, wind_speed: float) -> float | None:
+        """
+        Interpolates the range between the four grid points around the fuel amount and the wind speed.
+
+        Arguments:
+            fuel: Fuel amount.
+            wind_speed: Wind speed.
+
+        Returns:
+            float | None: Range, None if the arguments are outside the grid.
+        """
+        fuel_cell, wind_cell = self._cell(fuel, self.fuel), self._cell(wind_speed, self.wind_speed)
+        if fuel_cell is None or wind_cell is None:
+            return None
+
+        (i, fuel_weight), (j, wind_weight) = fuel_cell, wind_cell
+        lower = self.range[i, j] + (self.range[i, j + 1] - self.range[i, j]) * wind_weight
+        upper = self.range[i + 1, j] + (self.range[i + 1, j + 1] - self.range[i + 1, j]) * wind_weight
+
+        return float(lower + (upper - lower) * fuel_weight)
+
+    def lookup_endurance(self, fuel: float) -> float | None:
+        """
+        Interpolates the endurance between the two grid points around the fuel amount.
+
+        Arguments:
+            fuel: Fuel amount.
+
+        Returns:
+            float | None: Endurance in hours, None if the fuel amount is outside the grid.
+        """
+        fuel_cell = self._cell(fuel, self.fuel)
+        if fuel_cell is None:
+            return None
+
+        i, fuel_weight = fuel_cell
+
+        return float(self.endurance[i] + (self.endurance[i + 1] - self.endurance[i]) * fuel_weight)
+
+
+# Tables are held per aircraft 'id' and version, the repository invalidates them when the aircraft changes.
+performance_tables = LRUCache(
+    max_entries=settings.performance_table_max_entries, max_bytes=settings.cache_max_bytes, ttl=math.inf
+)
+
+# Flight times of the Breguet engine by aircraft 'id' and (version, fuel), invalidated with the tables.
+flight_time_memo = LRUCache(
+    max_entries=settings.flight_time_memo_max_entries, max_bytes=settings.cache_max_bytes, ttl=math.inf
+)
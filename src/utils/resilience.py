@@ -0,0 +1,240 @@
+# Third party imports
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Tuple
+
+
+class BreakerState(str, Enum):
+    """State of a circuit breaker."""
+
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a remote service. After 'failure_threshold' consecutive failures the circuit opens and calls
+    are refused without waiting for the service. Once 'reset_timeout' seconds passed the circuit is half open and
+    lets a single trial call through: its success closes the circuit, its failure opens it again.
+
+    Attributes:
+        failure_threshold: Consecutive failures opening the circuit.
+        reset_timeout: Seconds the circuit stays open before a trial call.
+        failures: Consecutive failures so far.
+        opened: Number of times the circuit opened.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened = 0
+        self._opened_at: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> BreakerState:
+        """Returns the current state of the circuit."""
+        if self._opened_at is None:
+            return BreakerState.closed
+        if self.clock() - self._opened_at >= self.reset_timeout:
+            return BreakerState.half_open
+
+        return BreakerState.open
+
+    def allow(self) -> bool:
+        """
+        Checks whether a call may be made, a half open circuit lets only one trial call through at a time.
+
+        Returns:
+            bool: True if the call may be made, it has to be followed by 'record_success', 'record_failure'
+            or 'release'.
+        """
+        state = self.state
+        if state is BreakerState.closed:
+            return True
+        if state is BreakerState.half_open and not self._trial:
+            self._trial = True
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        """Closes the circuit after a successful call."""
+        self.failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def record_failure(self) -> None:
+        """Counts a failed call, opening the circuit at the threshold or when the trial call failed."""
+        self.failures += 1
+        if self._trial or self.failures >= self.failure_threshold:
+            if self._opened_at is None or self._trial:
+                self.opened += 1
+            self._opened_at = self.clock()
+        self._trial = False
+
+    def release(self, trial: bool) -> None:
+        """
+        Forgets a call abandoned before its outcome was known, e.g. a cancelled hedged request.
+
+        Arguments:
+            trial: Whether the call was let through as the trial call of the half open circuit, only then
+                another trial call may be made.
+        """
+        if trial:
+            self._trial = False
+
+
+class RetryBudget:
+    """
+    Limits retries to a share of the requests, so retries cannot multiply the load of a failing service. Every
+    request deposits 'ratio' tokens and every retry withdraws one, up to 'max_tokens' are kept for bursts.
+
+    Attributes:
+        ratio: Retries allowed per request in the long run.
+        max_tokens: Maximum number of tokens, also the initial number.
+        tokens: Tokens available.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self) -> None:
+        """Adds the tokens of a request."""
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Takes the token of a retry.
+
+        Returns:
+            bool: True if the retry is allowed.
+        """
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class TokenBucket:
+    """
+    Rate limiter letting 'rate' calls per second through on average, with bursts of up to 'burst' calls. Callers
+    reserve their token at once, so they are served in the order they asked, and wait until it is refilled.
+
+    Attributes:
+        rate: Calls per second, infinity disables the limit.
+        burst: Maximum number of tokens, also the initial number.
+    """
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._tokens = burst
+        self._updated = clock()
+
+    @property
+    def tokens(self) -> float:
+        """Returns the tokens available now, negative when callers wait for them."""
+        return min(self.burst, self._tokens + (self.clock() - self._updated) * self.rate)
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly ahead of its refill.
+
+        Returns:
+            float: Seconds to wait before the call.
+        """
+        if math.isinf(self.rate):
+            return 0.0
+
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate) - 1
+        self._updated = now
+
+        return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self) -> None:
+        """Waits for a token."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def backoff_delay(attempt: int, base: float, cap: float, jitter: Callable[[], float] = random.random) -> float:
+    """
+    Returns the delay before a retry with exponential backoff and full jitter, so clients retrying together spread
+    their retries instead of hitting the service in waves.
+
+    Arguments:
+        attempt: Number of the retry, from 0.
+        base: Delay ceiling of the first retry [s].
+        cap: Maximum delay ceiling [s].
+        jitter: Source of random numbers between 0 and 1.
+
+    Returns:
+        float: Delay [s] drawn uniformly between 0 and 'min(cap, base * 2 ** attempt)'.
+    """
+    return jitter() * min(cap, base * 2**attempt)
+
+
+class LatencyTracker:
+    """
+    Rolling latencies of a remote service: the last 'max_samples' samples not older than 'window' seconds.
+
+    Attributes:
+        window: Seconds a sample is kept.
+        max_samples: Maximum number of samples kept.
+    """
+
+    def __init__(self, window: float, max_samples: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.window = window
+        self.max_samples = max_samples
+        self.clock = clock
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._samples)
+
+    def _expire(self) -> None:
+        """Drops the samples older than the window."""
+        oldest = self.clock() - self.window
+        while self._samples and self._samples[0][0] < oldest:
+            self._samples.popleft()
+
+    def record(self, latency: float) -> None:
+        """
+        Adds a sample.
+
+        Arguments:
+            latency: Duration of a call [s].
+        """
+        self._samples.append((self.clock(), latency))
+
+    def percentile(self, percent: float = 95.0) -> float | None:
+        """
+        Returns the latency below which the percentage of the samples falls (nearest rank).
+
+        Arguments:
+            percent: Percentage between 0 and 100.
+
+        Returns:
+            float | None: Latency [s], None without samples.
+        """
+        self._expire()
+        if not self._samples:
+            return None
+
+        latencies = sorted(latency for _, latency in self._samples)
+        return latencies[max(0, math.ceil(percent / 100 * len(latencies)) - 1)]
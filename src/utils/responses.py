@@ -0,0 +1,54 @@
+# Third party imports
+from typing import Any, Dict
+
+from fastapi import Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+# Internal imports
+from src.config.database import settings
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response serialized by pydantic-core straight from the models built by the repository, without
+    converting them to dictionaries first. Endpoints return it directly, so FastAPI neither validates the content
+    against 'response_model' again nor passes it through 'jsonable_encoder'.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def json_response(
+    content: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: Dict[str, str] | None = None,
+    response: Response | None = None,
+    validate: bool = True,
+) -> Any:
+    """
+    Wraps the trusted content in FastJSONResponse when fast JSON responses are enabled, otherwise returns
+    the content for FastAPI to validate and serialize, with the headers set on the response FastAPI sends.
+    Content which does not follow the 'response_model' of the endpoint, like sparse fieldsets, is serialized
+    by a JSONResponse instead.
+
+    Arguments:
+        content: Models or plain data built by the application.
+        status_code: Status code of the response.
+        headers: Headers of the response.
+        response: Response injected into the endpoint, receives the headers when FastAPI serializes the content.
+        validate: Whether the content follows the 'response_model' of the endpoint.
+
+    Returns:
+        FastJSONResponse, JSONResponse or the content itself.
+    """
+    if settings.fast_json_responses:
+        return FastJSONResponse(content=content, status_code=status_code, headers=headers)
+    if not validate:
+        return JSONResponse(content=jsonable_encoder(content), status_code=status_code, headers=headers)
+    if headers and response is not None:
+        response.headers.update(headers)
+
+    return content
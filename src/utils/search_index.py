@@ -0,0 +1,250 @@
+# Third party imports
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from typing import Iterable, List, Tuple
+
+
+class NgramIndex:
+    """
+    In-memory search index of aircraft names and manufacturers, used when the database has no trigram index.
+    Terms are matched by prefix with a sorted list and fuzzily by the Jaccard similarity of their n-grams,
+    like PostgreSQL 'pg_trgm' does. The n-gram posting lists are bucketed by the number of n-grams of the terms,
+    which fixes the similarity of a term for each number of shared n-grams, so a fuzzy search visits the terms from
+    the most similar and stops once the limit is filled. The index is local to the process: the repository applies
+    the writes of the process and reloads the index once the fleet version shows writes of other processes.
+
+    Attributes:
+        n: Length of the n-grams.
+        loaded: Whether the index holds all the aircraft of the database.
+        version: Version of the fleet the index reflects, None when unknown.
+    """
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.loaded = False
+        self.version: int | None = None
+        self._aircrafts: dict[int, Tuple[str, str]] = {}
+        self._term_aircraft_ids: defaultdict[str, set[int]] = defaultdict(set)
+        self._size_ngram_terms: defaultdict[int, defaultdict[str, set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._sorted_terms: List[str] = []
+
+    def ngrams(self, term: str) -> set[str]:
+        """
+        Returns the n-grams of the lower-cased term padded with spaces, so short terms and word boundaries count.
+
+        Arguments:
+            term: Term to split.
+
+        Returns:
+            set[str]: N-grams of the term.
+        """
+        padded = f"{' ' * (self.n - 1)}{term.lower()} "
+        return {padded[start : start + self.n] for start in range(len(padded) - self.n + 1)}
+
+    def load(self, aircrafts: Iterable[Tuple[int, str, str]], version: int | None = None) -> None:
+        """
+        Replaces the content of the index with the given aircraft and marks it as loaded.
+
+        Arguments:
+            aircrafts: 'id', name and manufacturer of every aircraft.
+            version: Version of the fleet read before the aircraft.
+        """
+        self.clear()
+        for aircraft_id, name, manufacturer in aircrafts:
+            self._aircrafts[aircraft_id] = (name, manufacturer)
+            self._index_terms(aircraft_id)
+        self._sorted_terms = sorted(self._term_aircraft_ids)
+        self.loaded = True
+        self.version = version
+
+    def advance(self, version: int | None) -> None:
+        """
+        Records that the write which moved the fleet to the version was applied to the index. When the index
+        did not reflect the previous version, other processes wrote in between and the index stays outdated.
+
+        Arguments:
+            version: Version of the fleet after the write, None when the write changed nothing.
+        """
+        if version is not None and self.version is not None and self.version == version - 1:
+            self.version = version
+
+    def clear(self) -> None:
+        """Removes all the aircraft from the index and marks it as not loaded."""
+        self.loaded = False
+        self.version = None
+        self._aircrafts.clear()
+        self._term_aircraft_ids.clear()
+        self._size_ngram_terms.clear()
+        self._sorted_terms = []
+
+    def add(self, aircraft_id: int, name: str, manufacturer: str) -> None:
+        """
+        Adds or replaces the searchable terms of the aircraft.
+
+        Arguments:
+            aircraft_id: 'id' of the aircraft.
+            name: Name of the aircraft.
+            manufacturer: Manufacturer of the aircraft.
+        """
+        self.remove(aircraft_id)
+        self._aircrafts[aircraft_id] = (name, manufacturer)
+
+        for term in self._index_terms(aircraft_id):
+            insort(self._sorted_terms, term)
+
+    def _index_terms(self, aircraft_id: int) -> List[str]:
+        """
+        Registers the terms of the aircraft and the n-grams of the terms which were not indexed yet.
+
+        Arguments:
+            aircraft_id: 'id' of the aircraft.
+
+        Returns:
+            List[str]: Terms which were not indexed yet.
+        """
+        new_terms = []
+        for term in self._terms(aircraft_id):
+            if term not in self._term_aircraft_ids:
+                new_terms.append(term)
+                term_ngrams = self.ngrams(term)
+                ngram_terms = self._size_ngram_terms[len(term_ngrams)]
+                for ngram in term_ngrams:
+                    ngram_terms[ngram].add(term)
+            self._term_aircraft_ids[term].add(aircraft_id)
+
+        return new_terms
+
+    def update(self, aircraft_id: int, name: str | None = None, manufacturer: str | None = None) -> None:
+        """
+        Replaces the name and/or the manufacturer of an indexed aircraft, omitted values are kept.
+
+        Arguments:
+            aircraft_id: 'id' of the aircraft.
+            name: New name of the aircraft.
+            manufacturer: New manufacturer of the aircraft.
+        """
+        if aircraft_id not in self._aircrafts:
+            return
+
+        current_name, current_manufacturer = self._aircrafts[aircraft_id]
+        self.add(aircraft_id, name or current_name, manufacturer or current_manufacturer)
+
+    def remove(self, aircraft_id: int) -> None:
+        """
+        Removes the aircraft from the index, unknown ids are ignored.
+
+        Arguments:
+            aircraft_id: 'id' of the aircraft.
+        """
+        terms = self._terms(aircraft_id)
+        self._aircrafts.pop(aircraft_id, None)
+
+        for term in terms:
+            aircraft_ids = self._term_aircraft_ids[term]
+            aircraft_ids.discard(aircraft_id)
+            if aircraft_ids:
+                continue
+
+            del self._term_aircraft_ids[term]
+            del self._sorted_terms[bisect_left(self._sorted_terms, term)]
+            term_ngrams = self.ngrams(term)
+            ngram_terms = self._size_ngram_terms[len(term_ngrams)]
+            for ngram in term_ngrams:
+                ngram_terms[ngram].discard(term)
+                if not ngram_terms[ngram]:
+                    del ngram_terms[ngram]
+            if not ngram_terms:
+                del self._size_ngram_terms[len(term_ngrams)]
+
+    def _terms(self, aircraft_id: int) -> set[str]:
+        """Returns the lower-cased searchable terms of an indexed aircraft."""
+        return {term.lower() for term in self._aircrafts.get(aircraft_id, ()) if term}
+
+    def search(self, query: str, limit: int, threshold: float = 0.3) -> List[int]:
+        """
+        Returns ids of the aircraft whose name or manufacturer starts with the query, followed by the ones
+        similar to the query, from the most similar.
+
+        Arguments:
+            query: Searched text.
+            limit: Maximum number of returned ids.
+            threshold: Minimum similarity of a fuzzy match, between 0 and 1.
+
+        Returns:
+            List[int]: Ids of the matching aircraft.
+        """
+        query = query.lower().strip()
+        matches: dict[int, None] = {}
+
+        position = bisect_left(self._sorted_terms, query)
+        while position < len(self._sorted_terms) and self._sorted_terms[position].startswith(query):
+            for aircraft_id in sorted(self._term_aircraft_ids[self._sorted_terms[position]]):
+                matches.setdefault(aircraft_id)
+            if len(matches) >= limit:
+                return list(matches)[:limit]
+            position += 1
+
+        # A term with 'size' n-grams sharing 'shared' of them with the query has the similarity
+        # shared / (len(query_ngrams) + size - shared). The (size, shared) pairs are visited from the most similar
+        # and the visit stops below the similarity of the last match within the limit, so the number of verified
+        # terms depends on the result rather than on the size of the index. A term sharing 'shared' n-grams is in
+        # one of the shortest 'len(query_ngrams) - shared + 1' posting lists of its bucket (prefix filtering),
+        # which are opened one at a time as 'shared' decreases.
+        query_ngrams = self.ngrams(query)
+        pairs = sorted(
+            (
+                (shared / (len(query_ngrams) + size - shared), size, shared)
+                for size in self._size_ngram_terms
+                for shared in range(1, min(len(query_ngrams), size) + 1)
+                if shared / (len(query_ngrams) + size - shared) >= threshold
+            ),
+            reverse=True,
+        )
+        postings: dict[int, List[set[str]]] = {}
+        opened: dict[int, int] = {}
+        terms_by_shared: defaultdict[Tuple[int, int], List[str]] = defaultdict(list)
+        similar_terms: List[Tuple[float, str]] = []
+        found_aircrafts, floor = 0, None
+        for similarity, size, shared in pairs:
+            if floor is not None and similarity < floor:
+                break
+
+            if size not in postings:
+                ngram_terms = self._size_ngram_terms[size]
+                postings[size] = sorted((ngram_terms.get(ngram, set()) for ngram in query_ngrams), key=len)
+                opened[size] = 0
+            size_postings = postings[size]
+            while opened[size] < len(query_ngrams) - shared + 1:
+                # Terms of the opened list are counted in the lists not opened yet, they are in none of the others.
+                new_terms = size_postings[opened[size]].difference(*size_postings[: opened[size]])
+                shared_counts = Counter()
+                for posting in size_postings[opened[size] :]:
+                    shared_counts.update(new_terms.intersection(posting))
+                for term, count in shared_counts.items():
+                    terms_by_shared[size, count].append(term)
+                opened[size] += 1
+
+            for term in terms_by_shared.pop((size, shared), ()):
+                similar_terms.append((-similarity, term))
+                found_aircrafts += len(self._term_aircraft_ids[term])
+
+            # Once the matched terms hold enough aircraft, only terms as similar as the last one needed, which
+            # are ordered by the term, can still change the result.
+            if floor is None and found_aircrafts >= limit - len(matches):
+                found = set(matches)
+                for _, term in similar_terms:
+                    found.update(self._term_aircraft_ids[term])
+                    if len(found) >= limit:
+                        floor = similarity
+                        break
+
+        for _, term in sorted(similar_terms):
+            for aircraft_id in sorted(self._term_aircraft_ids[term]):
+                matches.setdefault(aircraft_id)
+            if len(matches) >= limit:
+                break
+
+        return list(matches)[:limit]
+
+
+aircraft_search_index = NgramIndex()
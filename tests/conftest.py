@@ -1,51 +1,67 @@
 # Third party imports
 import os
-from typing import Callable, Generator
+from typing import AsyncGenerator, Callable
 
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
-from sqlalchemy import StaticPool, create_engine
-from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import StaticPool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 # Internal imports
+from src.config.database import configure_sqlite
 from src.models import Aircraft, AircraftData, AircraftType, Base
 from src.schemas import AircraftDisplaySchema, AircraftUpdateSchema
+from src.use_cases.performance import flight_time_memo
+from src.use_cases.weather import weather_cache
+from src.utils.cache import cache_backend
+from src.utils.performance_table import performance_tables
+from src.utils.search_index import aircraft_search_index
 
 load_dotenv(r"C:\PyCharm\Aircraft_Manager\src\.env.testing")
 
-engine = create_engine(
-    os.getenv("TEST_DATABASE_URL"),
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+engine = configure_sqlite(
+    create_async_engine(
+        os.getenv("TEST_DATABASE_URL"),
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
 )
 
-Local_session = scoped_session(sessionmaker(bind=engine))
+Local_session = async_sessionmaker(bind=engine, expire_on_commit=False)
 
 
-@pytest.fixture
-def db_session() -> Generator[Session, None, None]:
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """
-    Yields database session based on the engine bound by 'sessionmaker' class.
+    Yields database session based on the engine bound by 'async_sessionmaker' class.
     """
-    Base.metadata.create_all(engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
     local_session = Local_session()
     try:
         yield local_session
     finally:
-        local_session.rollback()
-        local_session.close()
-        Base.metadata.drop_all(engine)
+        await local_session.rollback()
+        await local_session.close()
+        aircraft_search_index.clear()
+        await cache_backend.clear()
+        performance_tables.clear()
+        flight_time_memo.clear()
+        weather_cache.clear()
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all)
 
 
-@pytest.fixture
-def load_data(db_session: Session) -> None:
+@pytest_asyncio.fixture(loop_scope="session")
+async def load_data(db_session: AsyncSession) -> None:
     """
     Creates tables in database and loads data into the database.
 
     Arguments:
-        db_session {sqlalchemy.orm.session} -- Database session object.
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- Database session object.
     """
     aircraft = Aircraft(
         aircraft_id=100,
@@ -66,26 +82,44 @@ def load_data(db_session: Session) -> None:
     )
 
     db_session.add(aircraft)
-    db_session.flush()
+    await db_session.flush()
+
+
+class FakeClock:
+    """Clock of the tests, it stands still until 'now' is set."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
 
 
 @pytest.fixture
-def override_get_db(db_session: Session) -> Callable:
+def clock() -> FakeClock:
+    """
+    Returns a clock standing at 0 seconds, for the caches, rate limits and circuit breakers under test.
+    """
+    return FakeClock()
+
+
+@pytest.fixture
+def override_get_db(db_session: AsyncSession) -> Callable:
     """
     Returns generator function that yields database session object.
 
     Arguments:
-        db_session {sqlalchemy.orm.session} -- Database session object.
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- Database session object.
     """
 
-    def generate_db():
+    async def generate_db():
         """
         Yields the test database session for dependency injection.
         """
         try:
             yield db_session
         finally:
-            db_session.close()
+            await db_session.close()
 
     return generate_db
 
@@ -106,15 +140,17 @@ def app(override_get_db: Callable) -> FastAPI:
     return app
 
 
-@pytest.fixture
-def client(app: FastAPI) -> Generator[TestClient, None, None]:
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
     """
-    Yields FastAPI client.
+    Yields asynchronous FastAPI client.
 
     Arguments:
         app {FastAPI} -- FastAPI application.
     """
-    with TestClient(app=app, base_url="http://test") as test_client:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test", follow_redirects=True
+    ) as test_client:
         yield test_client
 
 
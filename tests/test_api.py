@@ -1,31 +1,47 @@
 # Third party imports
-from fastapi.testclient import TestClient
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 
 # Internal imports
-from src.models import Aircraft
+from src.config.database import settings
+from src.exceptions import WeatherProviderError
+from src.models import Aircraft, AircraftData, AircraftType, FleetState
 from src.repository import AircraftRepository
+from src.router.weather_api import WeatherData
+from src.use_cases.sweep import shutdown_sweep_executor
+from src.use_cases.weather import weather_cache
+from src.utils.search_index import NgramIndex, aircraft_search_index
 from tests.conftest import db_session, load_data, new_aircraft_fixture
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
-def test_api_startup(client: TestClient):
+async def test_api_startup(client: AsyncClient):
     """Tests API starts and checks root endpoint is available.
 
     Arguments:
-        client {TestClient} -- fastapi.testclient object.
+        client {AsyncClient} -- httpx asynchronous client object.
 
     Expected behaviour:
         show_aircrafts() -> {'detail': 'Not Found'}.
     """
-    response = client.get("/")
+    response = await client.get("/")
 
     assert response.status_code in [200, 404]
 
 
-def test_routes_exist(client: TestClient):
+async def test_routes_exist(client: AsyncClient):
     """Tests key API routes exist.
 
     Arguments:
-        client {TestClient} -- fastapi.testclient object.
+        client {AsyncClient} -- httpx asynchronous client object.
 
     Expected behaviour:
         show_aircrafts() -> {'status_code': 200},
@@ -44,16 +60,16 @@ def test_routes_exist(client: TestClient):
         "/performance/endurance/",
     ]
     for route in expected_routes:
-        response = client.get(route)
+        response = await client.get(route)
 
         assert response.status_code in [200, 201, 404, 405]
 
 
-def test_injection_dependency(db_session):
+async def test_injection_dependency(db_session):
     """Ensure the database dependency is properly injected.
 
     Arguments:
-        db_session {sqlalchemy.orm.session} -- database session.
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
 
     Expected behaviour:
         db_session -> session.
@@ -61,68 +77,726 @@ def test_injection_dependency(db_session):
     from src.config.database import get_db
 
     try:
-        db_session = next(get_db())
+        db_session = await anext(get_db())
         assert db_session is not None
     except Exception as e:
         assert False, f"Dependency injection failed: {e}."
 
 
-def test_health_check(client: TestClient):
+async def test_health_check(client: AsyncClient):
     """Tests the 'health' endpoint of the application. This test verifies that the client is working as expected.
 
     Arguments:
-        client {TestClient} -- fastapi.testclient object.
+        client {AsyncClient} -- httpx asynchronous client object.
 
     Expected behaviour:
         health_check() -> {'status': 'OK'}.
     """
-    response = client.get("/health")
+    response = await client.get("/health")
 
     assert response.status_code == 200
     assert response.json() == {"status": "HEALTHY", "database": "OK"}
 
 
-def test_show_aircrafts_empty(client: TestClient, db_session):
-    response = client.get("/aircrafts/")
+async def test_show_aircrafts_empty(client: AsyncClient, db_session):
+    response = await client.get("/aircrafts/")
 
     assert response.status_code == 200
     assert response.json() == []
 
 
-def test_show_aircrafts(client: TestClient, load_data, db_session):
+async def test_show_aircrafts(client: AsyncClient, load_data, db_session):
     """Tests the 'show_aircrafts' endpoint of the application. This test verifies if the client is returning list of
     AircraftDisplaySchema objects correctly.
 
     Arguments:
-         client {TestClient} -- fastapi.testclient object,
+         client {AsyncClient} -- httpx asynchronous client object,
          load_data {pytest.fixture} -- creates database structure and loads data,
-         db_session {sqlalchemy.orm.session} -- database session.
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
 
     Expected behaviour:
         show_aircrafts() -> list[AircraftDisplaySchema(aircraft_id=100, name='C-152', manufacturer='Cessna'...)].
     """
-    response = client.get("/aircrafts/")
+    response = await client.get("/aircrafts/")
     data = response.json()
 
     assert response.status_code == 200
     assert data[0]["name"] == "C-152"
 
 
-def test_input_aircraft(client: TestClient, load_data, db_session, new_aircraft_fixture):
+async def test_show_aircrafts_paginated(client: AsyncClient, load_data, db_session):
+    """Tests keyset pagination of the 'show_aircrafts' endpoint.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        show_aircrafts(limit=1) -> first aircraft and 'X-Next-After-Id' header pointing to it,
+        show_aircrafts(after_id=100) -> remaining aircraft without 'X-Next-After-Id' header.
+    """
+    db_session.add(
+        Aircraft(
+            aircraft_id=101,
+            name="C-172",
+            manufacturer="Cessna",
+            aircraft_type=AircraftType.Trainer,
+            first_flight="1955-06-12",
+            aircraft_data=AircraftData(
+                fuel_consumption=18, ceiling=4100, weight=770, fuel=150, max_speed=300, cruise_speed=220
+            ),
+        )
+    )
+    await db_session.commit()
+
+    first_page = await client.get("/aircrafts/", params={"limit": 1})
+
+    assert first_page.status_code == 200
+    assert [aircraft["aircraft_id"] for aircraft in first_page.json()] == [100]
+    assert first_page.headers["X-Next-After-Id"] == "100"
+
+    second_page = await client.get("/aircrafts/", params={"limit": 1, "after_id": 100, "approximate_total": True})
+
+    assert [aircraft["aircraft_id"] for aircraft in second_page.json()] == [101]
+    assert int(second_page.headers["X-Total-Count-Approximate"]) >= 2
+
+    last_page = await client.get("/aircrafts/", params={"after_id": 101})
+
+    assert last_page.json() == []
+    assert "X-Next-After-Id" not in last_page.headers
+
+
+async def test_show_aircrafts_stream(client: AsyncClient, load_data, db_session):
+    """Tests the NDJSON streaming mode of the 'show_aircrafts' endpoint.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        show_aircrafts(stream=True) -> one JSON document per aircraft.
+    """
+    await db_session.commit()
+
+    response = await client.get("/aircrafts/", params={"stream": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["name"] for line in lines] == ["C-152"]
+
+
+async def test_show_aircrafts_filtered_and_sorted(client: AsyncClient, load_data, db_session, new_aircraft_fixture):
+    """Tests the filters and sort order of the 'show_aircrafts' endpoint, paginated with the keyset cursor.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+         new_aircraft {AircraftBaseSchema} -- AircraftBaseSchema object.
+
+    Expected behaviour:
+        show_aircrafts(aircraft_type=1, manufacturer='Lockheed', sort_by='max_speed', descending=True) ->
+        fighters of the manufacturer from the fastest, split into pages of a single aircraft.
+    """
+    aircraft = new_aircraft_fixture.model_dump(exclude={"aircraft_id"})
+    fighters = [
+        {
+            **aircraft,
+            "name": name,
+            "manufacturer": manufacturer,
+            "aircraft_type": AircraftType.Fighter,
+            "aircraft_data": {**aircraft["aircraft_data"], "max_speed": max_speed},
+        }
+        for name, manufacturer, max_speed in (
+            ("F-104", "Lockheed", 2137),
+            ("F-16", "Lockheed", 2120),
+            ("F-22", "Lockheed", 2414),
+            ("F-15", "McDonnell Douglas", 2655),
+            ("F-80", "Lockheed", 960),
+        )
+    ]
+    await client.post(url="/aircrafts/bulk", json=fighters)
+
+    params = {
+        "aircraft_type": AircraftType.Fighter.value,
+        "manufacturer": "Lockheed",
+        "max_speed_gte": 1000,
+        "sort_by": "max_speed",
+        "descending": True,
+        "limit": 2,
+    }
+    first_page = await client.get("/aircrafts/", params=params)
+
+    assert [aircraft["name"] for aircraft in first_page.json()] == ["F-22", "F-104"]
+
+    after_id = first_page.headers["X-Next-After-Id"]
+    second_page = await client.get("/aircrafts/", params={**params, "after_id": after_id})
+
+    assert [aircraft["name"] for aircraft in second_page.json()] == ["F-16"]
+
+
+async def test_show_aircrafts_sorted_by_nullable_column(client: AsyncClient, db_session):
+    """Tests the keyset cursor pages through the aircraft whose sort column is NULL, because their data is missing
+    or has no value, placed after the other ones in ascending order and before them in descending order.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        show_aircrafts(sort_by='max_speed', limit=2) -> all six aircraft across the pages, NULLs last ascending and
+        first descending.
+    """
+    for aircraft_id, max_speed, has_data in (
+        (1, 300, True),
+        (2, None, True),
+        (3, 200, True),
+        (4, None, False),
+        (5, 300, True),
+        (6, None, True),
+    ):
+        db_session.add(
+            Aircraft(
+                aircraft_id=aircraft_id,
+                name=f"A-{aircraft_id}",
+                manufacturer="Cessna",
+                aircraft_type=AircraftType.Trainer,
+                aircraft_data=AircraftData(max_speed=max_speed) if has_data else None,
+            )
+        )
+    await db_session.commit()
+
+    async def pages(params: dict) -> list[int]:
+        ids, after_id = [], None
+        while True:
+            page_params = {**params, "fields": "name,max_speed", "sort_by": "max_speed", "limit": 2}
+            if after_id is not None:
+                page_params["after_id"] = after_id
+            response = await client.get("/aircrafts/", params=page_params)
+            ids += [aircraft["aircraft_id"] for aircraft in response.json()]
+            after_id = response.headers.get("X-Next-After-Id")
+            if after_id is None:
+                return ids
+
+    assert await pages({}) == [3, 1, 5, 2, 4, 6]
+    assert await pages({"descending": True}) == [6, 4, 2, 5, 1, 3]
+    assert await pages({"max_speed_gte": 250}) == [1, 5]
+
+
+async def test_show_aircrafts_sparse_fields(client: AsyncClient, load_data, db_session):
+    """Tests the 'fields' parameter of the 'show_aircrafts' and 'show_aircraft' endpoints returns only
+    the requested fields.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        show_aircrafts(fields='name') -> [{'aircraft_id': 100, 'name': 'C-152'}],
+        show_aircraft(100, fields='name,ceiling') -> aircraft with 'aircraft_data' holding only the ceiling.
+    """
+    await db_session.commit()
+
+    response = await client.get("/aircrafts/", params={"fields": "name", "limit": 1})
+
+    assert response.status_code == 200
+    assert response.json() == [{"aircraft_id": 100, "name": "C-152"}]
+    assert response.headers["X-Next-After-Id"] == "100"
+
+    response = await client.get("/aircrafts/100", params={"fields": "name,ceiling,take_off_weight"})
+
+    assert response.json() == {
+        "aircraft_id": 100,
+        "name": "C-152",
+        "aircraft_data": {"ceiling": 2800, "take_off_weight": 870},
+    }
+
+    response = await client.get("/aircrafts/100")
+
+    assert response.json()["aircraft_data"]["cruise_speed"] == 190
+
+    response = await client.get("/aircrafts/", params={"fields": "name,wingspan"})
+
+    assert response.status_code == 422
+
+    response = await client.get("/aircrafts/101")
+
+    assert response.status_code == 404
+
+
+async def test_conditional_requests(client: AsyncClient, load_data, db_session):
+    """Tests the ETag of the read and performance endpoints, which is kept until the aircraft is updated.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        repeated requests with 'If-None-Match' -> 304 until the aircraft is updated, then 200 with a new ETag.
+    """
+    await db_session.commit()
+    urls = [
+        "/aircrafts/",
+        "/aircrafts/100",
+        "/aircrafts/performance/range/aircraft_id/wind_speed/fuel?aircraft_id=100&wind_speed=0&fuel=100",
+        "/aircrafts/performance/endurance/aircraft_id/fuel?aircraft_id=100&fuel=60",
+    ]
+
+    etags = {}
+    for url in urls:
+        response = await client.get(url)
+
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etags[url] = response.headers["ETag"]
+
+        response = await client.get(url, headers={"If-None-Match": etags[url]})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etags[url]
+
+    await client.patch(url="/aircrafts/update_aircraft/100", json={"aircraft_data": {"cruise_speed": 200}})
+
+    for url in urls:
+        response = await client.get(url, headers={"If-None-Match": etags[url]})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etags[url]
+
+
+async def test_deleted_aircraft_id_not_reused(client: AsyncClient, load_data, db_session, new_aircraft_fixture):
+    """Tests a new aircraft does not take the id of a deleted one, so the ETag of the deleted aircraft does not
+    match it.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+         new_aircraft {AircraftBaseSchema} -- AircraftBaseSchema object.
+
+    Expected behaviour:
+        add_aircraft() after delete_aircraft(100) -> id 101, the old ETag of aircraft 100 -> 404.
+    """
+    await db_session.commit()
+    etag = (await client.get("/aircrafts/100")).headers["ETag"]
+
+    await client.delete(url="/aircrafts/delete_aircraft/100")
+    response = await client.post(
+        url="/aircrafts/add_aircraft", json=new_aircraft_fixture.model_dump(exclude={"aircraft_id"})
+    )
+
+    assert response.json()["aircraft_id"] == 101
+    assert (await client.get("/aircrafts/100", headers={"If-None-Match": etag})).status_code == 404
+
+
+async def test_cached_reads(client: AsyncClient, load_data, db_session):
+    """Tests repeated reads are answered from the aircraft cache, which is invalidated by updates.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        second read -> cache hit, read after update -> updated aircraft.
+    """
+    await db_session.commit()
+
+    for _ in range(2):
+        response = await client.get("/aircrafts/100")
+
+        assert response.json()["name"] == "C-152"
+
+    stats = (await client.get("/monitoring/caches")).json()["shared"]
+
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+    await client.patch(url="/aircrafts/update_aircraft/100", json={"name": "C-152 Aerobat"})
+    response = await client.get("/aircrafts/100")
+
+    assert response.json()["name"] == "C-152 Aerobat"
+    assert (await client.get("/monitoring/caches")).json()["shared"]["invalidations"] == 1
+
+
+async def test_fast_json_responses(client: AsyncClient, load_data, db_session, monkeypatch):
+    """Tests the fast JSON response path returns the same body and headers as the validated one.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+         monkeypatch {pytest.MonkeyPatch} -- fixture used to enable the fast responses.
+
+    Expected behaviour:
+        read, sparse read and performance endpoints -> identical JSON, ETag and paging headers in both modes.
+    """
+    await db_session.commit()
+    urls = [
+        "/aircrafts/",
+        "/aircrafts/?fields=name,max_speed&limit=1",
+        "/aircrafts/100",
+        "/aircrafts/100?fields=name",
+        "/aircrafts/search?q=Cess",
+        "/aircrafts/performance/capable?distance=100&fuel=100",
+        "/aircrafts/performance/range/aircraft_id/wind_speed/fuel?aircraft_id=100&wind_speed=0&fuel=100",
+        "/aircrafts/performance/endurance/aircraft_id/fuel?aircraft_id=100&fuel=60",
+    ]
+
+    responses = {}
+    for enabled in (False, True):
+        monkeypatch.setattr(settings, "fast_json_responses", enabled)
+        responses[enabled] = [await client.get(url) for url in urls]
+
+    for validated, fast in zip(responses[False], responses[True]):
+        assert fast.status_code == validated.status_code == 200
+        assert fast.json() == validated.json()
+        assert fast.headers.get("ETag") == validated.headers.get("ETag")
+        assert fast.headers.get("X-Next-After-Id") == validated.headers.get("X-Next-After-Id")
+
+
+async def test_performance_batch(client: AsyncClient, load_data, db_session):
+    """Tests the batch performance endpoint calculates the grid of every aircraft and reports the missing ones.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        get_performance_batch() -> same values as the single endpoints, endurance not wrapped past 24 hours.
+    """
+    await db_session.commit()
+    response = await client.post(
+        url="/aircrafts/performance/batch",
+        json={"aircraft_ids": [100, 999, 100], "fuel": [60, 450], "wind_speed": [10, -10, 0]},
+    )
+
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["missing_ids"] == [999]
+    assert len(data["aircraft"]) == 1
+
+    aircraft = data["aircraft"][0]
+    single_range = await client.get(
+        "/aircrafts/performance/range/aircraft_id/wind_speed/fuel?aircraft_id=100&wind_speed=10&fuel=60"
+    )
+    assert aircraft["name"] == "C-152"
+    assert aircraft["range"][0][0] == single_range.json()["range"]
+    assert aircraft["endurance_hours"] == [4.0, 30.0]
+    assert aircraft["endurance"] == ["04:00", "30:00"]
+
+    response = await client.post(
+        url="/aircrafts/performance/batch", json={"aircraft_ids": [100], "fuel": [60], "engine": "breguet"}
+    )
+    single_range = await client.get(
+        "/aircrafts/performance/range/aircraft_id/wind_speed/fuel?aircraft_id=100&wind_speed=0&fuel=60&engine=breguet"
+    )
+
+    assert response.json()["aircraft"][0]["range"][0][0] == pytest.approx(single_range.json()["range"])
+    assert response.json()["aircraft"][0]["endurance_hours"][0] > 4.0
+
+
+async def test_performance_lookup_table(client: AsyncClient, load_data, db_session):
+    """Tests the opt-in lookup table path of the performance endpoints and its invalidation by updates.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        lookup_table=true -> same range and endurance as the calculation, updated after the aircraft is updated.
+    """
+    await db_session.commit()
+    range_url = (
+        "/aircrafts/performance/range/aircraft_id/wind_speed/fuel?aircraft_id=100&wind_speed=10&fuel=60&lookup_table=1"
+    )
+    endurance_url = "/aircrafts/performance/endurance/aircraft_id/fuel?aircraft_id=100&fuel=60&lookup_table=1"
+
+    response = await client.get(range_url)
+
+    assert response.json()["range"] == pytest.approx(800.0)
+    assert (await client.get(endurance_url)).json()["endurance"] == "04:00"
+
+    await client.patch(url="/aircrafts/update_aircraft/100", json={"aircraft_data": {"fuel_consumption": 30}})
+    response = await client.get(range_url)
+
+    assert response.json()["range"] == pytest.approx(400.0)
+    assert (await client.get(endurance_url)).json()["endurance"] == "02:00"
+
+
+async def test_capable_aircrafts(client: AsyncClient, load_data, db_session, new_aircraft_fixture):
+    """Tests the fleet-wide capable aircraft query filters and sorts by the range calculated in the database.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+         new_aircraft_fixture {AircraftDisplaySchema} -- second aircraft added to the fleet.
+
+    Expected behaviour:
+        get_capable_aircrafts() -> aircraft reaching the distance, longest range first, headwind included.
+    """
+    await db_session.commit()
+    await client.post(url="/aircrafts/add_aircraft", json=new_aircraft_fixture.model_dump())
+    url = "/aircrafts/performance/capable"
+
+    response = await client.get(url, params={"distance": 500, "fuel": 60})
+
+    assert response.status_code == 200
+    assert [aircraft["name"] for aircraft in response.json()] == ["C-152", "C-172"]
+    assert response.json()[0]["range"] == pytest.approx(760.0)
+    assert response.json()[0]["endurance"] == "04:00"
+
+    response = await client.get(url, params={"distance": 700, "fuel": 60, "wind": -30})
+
+    assert response.json() == []
+    assert (await client.get(url, params={"distance": 500, "fuel": 60, "limit": 1})).json()[0]["name"] == "C-152"
+
+
+async def test_range_polar(client: AsyncClient, load_data, db_session):
+    """Tests the range polar applies the wind components on every heading, in JSON and in binary form.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        get_range_polar() -> headwind range on the heading of the wind, tailwind range on the opposite one.
+    """
+    await db_session.commit()
+    params = {"fuel": 60, "wind_speed": 10, "wind_direction": 90, "heading_step": 90}
+
+    response = await client.get("/aircrafts/performance/polar", params=params)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["heading_step"] == 90
+    assert data["aircraft"][0]["aircraft_id"] == 100
+    north, east, south, west = data["aircraft"][0]["range"]
+    assert east == pytest.approx((190 - 10) * 4)
+    assert west == pytest.approx((190 + 10) * 4)
+    assert north == south == pytest.approx(round((190**2 - 10**2) ** 0.5 * 4, 1))
+
+    response = await client.get("/aircrafts/performance/polar", params={**params, "binary": True, "aircraft_ids": 100})
+
+    assert response.headers["X-Aircraft-Ids"] == "100"
+    assert np.frombuffer(response.content, dtype="<f4").tolist() == pytest.approx([north, east, south, west], abs=0.1)
+
+
+async def test_reachable_airports(client: AsyncClient, load_data, db_session):
+    """Tests the airports reachable from the origin are found within the range on the course to each of them.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        get_reachable_airports() -> Warsaw, Kraków and Berlin within 760 km in calm air, Berlin not in headwind,
+        unknown aircraft in missing_ids.
+    """
+    await db_session.commit()
+    params = {"latitude": 52.1658, "longitude": 20.9672, "fuel": 60, "aircraft_ids": 100}
+
+    response = await client.get("/aircrafts/performance/reachable", params=params)
+
+    assert response.status_code == 200
+    aircraft = response.json()["aircraft"][0]
+    idents = [airport["ident"] for airport in aircraft["airports"]]
+    assert idents[:2] == ["EPWA", "EPKK"]
+    assert "EDDB" in idents
+    assert "EGLL" not in idents
+    assert aircraft["reachable_count"] == len(idents)
+    assert response.json()["missing_ids"] == []
+
+    response = await client.get(
+        "/aircrafts/performance/reachable", params={**params, "wind_speed": 80, "wind_direction": 270}
+    )
+
+    assert "EDDB" not in [airport["ident"] for airport in response.json()["aircraft"][0]["airports"]]
+
+    response = await client.get("/aircrafts/performance/reachable", params={**params, "aircraft_ids": [100, 999]})
+
+    assert [item["aircraft_id"] for item in response.json()["aircraft"]] == [100]
+    assert response.json()["missing_ids"] == [999]
+
+
+async def test_range_live_wind(client: AsyncClient, load_data, db_session, monkeypatch):
+    """Tests the range without a wind speed uses the component of the live wind of the location on the heading,
+    which is part of the ETag.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+         monkeypatch {pytest.MonkeyPatch} -- replaces the weather providers.
+
+    Expected behaviour:
+        get_range() -> 503 until the wind is fetched, then tailwind and headwind ranges, new ETag on a new wind.
+    """
+    await db_session.commit()
+    fetch = AsyncMock(return_value=WeatherData(name="Warsaw", current_wind_speed="10", current_wind_direction=270))
+    monkeypatch.setattr(weather_cache, "fetch", fetch)
+    url = "/aircrafts/performance/range/aircraft_id/wind_speed/fuel?aircraft_id=100&fuel=60&location=waw"
+
+    response = await client.get(f"{url}&heading=90")
+
+    assert response.status_code == 503
+    await asyncio.sleep(0)
+
+    response = await client.get(f"{url}&heading=90")
+
+    assert response.status_code == 200
+    assert response.json()["range"] == pytest.approx((190 + 10) * 4)
+    assert (await client.get(url)).json()["range"] == pytest.approx((190 - 10) * 4)
+    assert (
+        await client.get("/aircrafts/performance/range/aircraft_id/wind_speed/fuel?aircraft_id=100&fuel=60")
+    ).status_code == 422
+
+    fetch.return_value = WeatherData(name="Warsaw", current_wind_speed=20.0, current_wind_direction=270)
+    await weather_cache.refresh("waw")
+
+    renewed = await client.get(f"{url}&heading=90", headers={"If-None-Match": response.headers["ETag"]})
+    assert renewed.status_code == 200
+    assert renewed.headers["X-Wind-Speed"] == "20.0"
+
+
+async def test_weather_monitoring(client: AsyncClient):
+    """Tests the weather cache and the health of the weather providers are exposed for monitoring.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object.
+
+    Expected behaviour:
+        show_weather_cache(), show_weather_providers() -> counters, closed circuits of both providers.
+    """
+    response = await client.get("/monitoring/weather")
+
+    assert response.status_code == 200
+    assert response.json()["entries"] == 0
+
+    response = await client.get("/monitoring/weather/providers")
+
+    assert response.status_code == 200
+    providers = response.json()["providers"]
+    assert [provider["state"] for provider in providers] == ["closed", "closed"]
+    assert providers[0]["api_url"] == "http://api.weatherapi.com/v1/current.json"
+
+
+async def test_weather_stations(client: AsyncClient, monkeypatch):
+    """Tests the observations of many locations are fetched at once, every distinct location once, and returned
+    in numbers in the order of the locations.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         monkeypatch {pytest.MonkeyPatch} -- replaces the weather providers.
+
+    Expected behaviour:
+        get_weather_stations() -> numeric observations, error of the unknown location; 422 without or with too
+        many locations.
+    """
+
+    async def fetch(location: str) -> WeatherData:
+        if location == "nowhere":
+            raise WeatherProviderError()
+        return WeatherData(
+            name=location.title(), last_updated="2026-10-17 12:00", current_wind_speed="11.2", current_temperature=9
+        )
+
+    fetch = AsyncMock(side_effect=fetch)
+    monkeypatch.setattr(weather_cache, "fetch", fetch)
+
+    response = await client.post("/weather/stations", json={"locations": ["waw", "krk", "nowhere", "waw"]})
+
+    assert response.status_code == 200
+    stations = response.json()["stations"]
+    assert [station["location"] for station in stations] == ["waw", "krk", "nowhere", "waw"]
+    assert stations[0] == {
+        "location": "waw",
+        "name": "Waw",
+        "last_updated": "2026-10-17 12:00",
+        "wind_speed": 11.2,
+        "wind_direction": None,
+        "temperature": 9.0,
+        "error": None,
+    }
+    assert stations[2]["error"] == WeatherProviderError.message
+    assert fetch.await_count == 3
+
+    assert (await client.post("/weather/stations", json={"locations": []})).status_code == 422
+    monkeypatch.setattr(settings, "weather_max_stations", 2)
+    assert (await client.post("/weather/stations", json={"locations": ["a", "b", "c"]})).status_code == 422
+
+
+async def test_performance_sweep(client: AsyncClient, load_data, db_session, monkeypatch):
+    """Tests the sweep streams the grid and the ranges of every chunk of aircraft evaluated on the process pool,
+    as JSON lines and as binary frames.
+
+    Arguments:
+         client {AsyncClient} -- httpx asynchronous client object,
+         load_data {pytest.fixture} -- creates database structure and loads data,
+         db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+         monkeypatch {pytest.MonkeyPatch} -- limits the pool to one worker.
+
+    Expected behaviour:
+        sweep_performance() -> headwind and tailwind ranges of every fuel amount and wind speed, progress 1.
+    """
+    await db_session.commit()
+    monkeypatch.setattr(settings, "sweep_workers", 1)
+    sweep = {"aircraft_ids": [100], "fuel": [30, 60], "wind_speed": [0, 10], "wind_direction": 90, "heading_step": 90}
+
+    try:
+        response = await client.post("/aircrafts/performance/sweep", json=sweep)
+
+        assert response.status_code == 200
+        header, *chunks = [json.loads(line) for line in response.text.splitlines()]
+        assert header["shape"] == [1, 2, 2, 4]
+        assert chunks[-1]["progress"] == 1
+        assert chunks[0]["aircraft_ids"] == [100]
+        calm, windy = chunks[0]["range"][0][1]
+        assert calm == pytest.approx([190 * 4] * 4)
+        assert windy[1] == pytest.approx((190 - 10) * 4)
+        assert windy[3] == pytest.approx((190 + 10) * 4)
+
+        response = await client.post("/aircrafts/performance/sweep?binary=1", json=sweep)
+
+        content = response.content
+        header_length = int.from_bytes(content[:4], "little")
+        content = content[4 + header_length :]
+        header_length = int.from_bytes(content[:4], "little")
+        assert json.loads(content[4 : 4 + header_length])["shape"] == [1, 2, 2, 4]
+        ranges = np.frombuffer(content[4 + header_length :], dtype="<f4").reshape(1, 2, 2, 4)
+        assert ranges[0, 1, 1].tolist() == pytest.approx(windy, abs=0.1)
+    finally:
+        shutdown_sweep_executor()
+
+
+async def test_input_aircraft(client: AsyncClient, load_data, db_session, new_aircraft_fixture):
     """Tests the 'input_aircraft' endpoint of the application. This test verifies if the client is adding new aircraft
     object into the database.
 
     Arguments:
-        client {TestClient} -- fastapi.testclient object,
+        client {AsyncClient} -- httpx asynchronous client object,
         load_data {Callable} -- Function that creates database and loads data into database,
-        db_session {sqlalchemy.orm.session} -- database session,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
         new_aircraft {AircraftBaseSchema} -- AircraftBaseSchema object.
 
     Expected behaviour:
         input_aircraft() -> adds AircraftDisplaySchema(aircraft_id=100, name='C-152', manufacturer='Cessna'...)
         object into the database.
     """
-    response = client.post(url="/aircrafts/add_aircraft", json=new_aircraft_fixture.model_dump())
+    response = await client.post(url="/aircrafts/add_aircraft", json=new_aircraft_fixture.model_dump())
 
     assert response.status_code == 201
 
@@ -132,8 +806,74 @@ def test_input_aircraft(client: TestClient, load_data, db_session, new_aircraft_
     assert data["aircraft_data"]["fuel_consumption"] == 18
 
 
-def test_modify_aircraft(
-    client: TestClient,
+async def test_input_aircrafts(client: AsyncClient, load_data, db_session, new_aircraft_fixture):
+    """Tests the 'input_aircrafts' endpoint of the application. This test verifies if the client is adding many
+    aircraft objects into the database in chunks and returns them in the order of the request.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {Callable} -- Function that creates database and loads data into database,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+        new_aircraft {AircraftBaseSchema} -- AircraftBaseSchema object.
+
+    Expected behaviour:
+        input_aircrafts() -> adds three aircraft after the existing one and reports no errors.
+    """
+    aircrafts = [
+        {**new_aircraft_fixture.model_dump(exclude={"aircraft_id"}), "name": name}
+        for name in ("C-172", "C-182", "C-206")
+    ]
+
+    response = await client.post(url="/aircrafts/bulk", params={"chunk_size": 2}, json=aircrafts)
+
+    assert response.status_code == 201
+
+    data = response.json()
+    assert data["errors"] == []
+    assert [aircraft["name"] for aircraft in data["created"]] == ["C-172", "C-182", "C-206"]
+    assert [aircraft["aircraft_id"] for aircraft in data["created"]] == [101, 102, 103]
+    assert data["created"][2]["aircraft_data"]["fuel_consumption"] == 18
+
+
+async def test_input_aircrafts_reports_invalid_items(
+    client: AsyncClient, load_data, db_session, new_aircraft_fixture, mocker
+):
+    """Tests the 'input_aircrafts' endpoint rejects only the aircraft which the database refuses to store.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {Callable} -- Function that creates database and loads data into database,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+        new_aircraft {AircraftBaseSchema} -- AircraftBaseSchema object,
+        mocker {pytest_mock.MockerFixture} -- mocker fixture.
+
+    Expected behaviour:
+        input_aircrafts() -> adds valid aircraft, reports the one refused by the database with its index.
+    """
+    insert_aircrafts = AircraftRepository._insert_aircrafts
+
+    async def refuse_invalid(self, aircrafts):
+        if any(aircraft.name == "invalid" for _, aircraft in aircrafts):
+            raise IntegrityError(statement="INSERT", params={}, orig=Exception("constraint failed"))
+        return await insert_aircrafts(self, aircrafts)
+
+    mocker.patch.object(AircraftRepository, "_insert_aircrafts", refuse_invalid)
+    aircrafts = [
+        {**new_aircraft_fixture.model_dump(exclude={"aircraft_id"}), "name": name}
+        for name in ("C-172", "invalid", "C-206")
+    ]
+
+    response = await client.post(url="/aircrafts/bulk", json=aircrafts)
+
+    assert response.status_code == 201
+
+    data = response.json()
+    assert [aircraft["name"] for aircraft in data["created"]] == ["C-172", "C-206"]
+    assert data["errors"] == [{"index": 1, "message": "constraint failed"}]
+
+
+async def test_modify_aircraft(
+    client: AsyncClient,
     load_data,
     db_session,
     update_aircraft,
@@ -143,16 +883,16 @@ def test_modify_aircraft(
     object as expected.
 
     Arguments:
-        client {TestClient} -- fastapi.testclient object,
+        client {AsyncClient} -- httpx asynchronous client object,
         load_data {Callable} -- Function that creates database and loads data into database,
-        db_session {sqlalchemy.orm.session} -- database session,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
         update_aircraft {AircraftBaseSchema} -- pytest fixture with updated aircraft object,
         aircraft_id {int} -- aircraft id.
 
     Expected behaviour:
         modify_aircraft() -> AircraftUpdateSchema(aircraft_id=100, name='C-182', aircraft_data{cruise_speed=170}).
     """
-    response = client.patch(
+    response = await client.patch(
         url=f"/aircrafts/update_aircraft/{aircraft_id}",
         json=update_aircraft.model_dump(exclude_none=True),
     )
@@ -167,21 +907,21 @@ def test_modify_aircraft(
     assert data["aircraft_data"]["fuel_consumption"] == 15
 
 
-def test_modify_aircraft_2(client: TestClient, load_data, db_session):
+async def test_modify_aircraft_2(client: AsyncClient, load_data, db_session):
     """Tests the 'modify_aircraft' endpoint of the application. This test verifies if the client is modifying aircraft
     object as expected but instead of injected 'update_aircraft' fixture, this test is retrieving aircraft data from
     the mock database and then modifies aircraft object.
 
     Arguments:
-        client {TestClient} -- fastapi.testclient object,
+        client {AsyncClient} -- httpx asynchronous client object,
         load_data {pytest.fixture} -- creates database structure and loads data,
-        db_session {sqlalchemy.orm.session} -- database session.
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
 
     Expected behaviour:
         modify_aircraft() -> AircraftUpdateSchema(aircraft_id=100, name='C-100', aircraft_data{cruise_speed=190}).
     """
     aircraft_repo = AircraftRepository(db_session)
-    list_of_aircrafts = aircraft_repo.display_aircrafts()
+    list_of_aircrafts = await aircraft_repo.display_aircrafts()
     aircraft_to_update = list_of_aircrafts[0].model_dump()
 
     aircraft_id = aircraft_to_update["aircraft_id"]
@@ -189,7 +929,7 @@ def test_modify_aircraft_2(client: TestClient, load_data, db_session):
     aircraft_to_update["name"] = "C-100"
     aircraft_to_update["aircraft_data"]["cruise_speed"] = 190
 
-    response = client.patch(
+    response = await client.patch(
         url=f"/aircrafts/update_aircraft/{aircraft_id}",
         json=aircraft_to_update,
     )
@@ -202,13 +942,57 @@ def test_modify_aircraft_2(client: TestClient, load_data, db_session):
     assert data["aircraft_data"]["cruise_speed"] == 190
 
 
-def test_remove_aircraft(client: TestClient, load_data, db_session):
+async def test_modify_aircraft_partial(client: AsyncClient, load_data, db_session):
+    """Tests the 'modify_aircraft' endpoint returns the aircraft as stored in the database, including the fields
+    which were not part of the request.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {pytest.fixture} -- creates database structure and loads data,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        modify_aircraft() -> AircraftDisplaySchema(aircraft_id=100, name='C-152', aircraft_data{fuel=100}).
+    """
+    response = await client.patch(url="/aircrafts/update_aircraft/100", json={"aircraft_data": {"fuel": 100}})
+
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["aircraft_id"] == 100
+    assert data["name"] == "C-152"
+    assert data["aircraft_data"]["fuel"] == 100
+    assert data["aircraft_data"]["cruise_speed"] == 190
+    assert data["aircraft_data"]["take_off_weight"] == 820
+
+    stored_data = await db_session.scalar(select(AircraftData).filter_by(aircraft_id=100))
+    assert stored_data.take_off_weight == 820
+
+
+async def test_modify_aircraft_not_found(client: AsyncClient, load_data, db_session):
+    """Tests the 'modify_aircraft' endpoint responds with 404 for an unknown 'aircraft_id'.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {pytest.fixture} -- creates database structure and loads data,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        modify_aircraft() -> {'status_code': 404}.
+    """
+    response = await client.patch(url="/aircrafts/update_aircraft/999", json={"name": "C-100"})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Aircraft with id 999 not found."}
+
+
+async def test_remove_aircraft(client: AsyncClient, load_data, db_session):
     """Tests 'remove_aircraft' endpoint of the application. This test verifies if the client is removing pointed
     aircraft object from the database.
 
     Arguments:
-        client {TestClient} -- fastapi.testclient object,
-        db_session {sqlalchemy.orm.session} -- database session,
+        client {AsyncClient} -- httpx asynchronous client object,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
         aircraft_id {int} -- aircraft id.
 
     Expected behaviour:
@@ -216,8 +1000,225 @@ def test_remove_aircraft(client: TestClient, load_data, db_session):
     """
     aircraft_id = 100
 
-    response = client.delete(url=f"/aircrafts/delete_aircraft/{aircraft_id}")
+    response = await client.delete(url=f"/aircrafts/delete_aircraft/{aircraft_id}")
     assert response.status_code == 204
 
-    data = db_session.query(Aircraft).filter_by(aircraft_id=aircraft_id).first()
+    data = await db_session.scalar(select(Aircraft).filter_by(aircraft_id=aircraft_id))
     assert data is None
+
+
+async def test_remove_aircraft_cascades(client: AsyncClient, load_data, db_session):
+    """Tests 'remove_aircraft' endpoint removes the aircraft data along with the aircraft and responds with 404 when
+    the aircraft does not exist anymore.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {pytest.fixture} -- creates database structure and loads data,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        remove_aircraft() -> AircraftData object is None, second call -> {'status_code': 404}.
+    """
+    response = await client.delete(url="/aircrafts/delete_aircraft/100")
+    assert response.status_code == 204
+
+    data = await db_session.scalar(select(AircraftData).filter_by(aircraft_id=100))
+    assert data is None
+
+    response = await client.delete(url="/aircrafts/delete_aircraft/100")
+    assert response.status_code == 404
+
+
+async def test_modify_aircrafts(client: AsyncClient, load_data, db_session, new_aircraft_fixture):
+    """Tests the 'modify_aircrafts' endpoint updates existing aircraft in bulk and reports unknown ids.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {pytest.fixture} -- creates database structure and loads data,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+        new_aircraft {AircraftBaseSchema} -- AircraftBaseSchema object.
+
+    Expected behaviour:
+        modify_aircrafts() -> {'results': {'100': 'updated', '101': 'updated', '999': 'not_found'}}.
+    """
+    await client.post(url="/aircrafts/bulk", json=[new_aircraft_fixture.model_dump(exclude={"aircraft_id"})])
+
+    response = await client.request(
+        method="PATCH",
+        url="/aircrafts/bulk",
+        params={"chunk_size": 1},
+        json=[
+            {"aircraft_id": 100, "name": "C-152A", "aircraft_data": {"weight": 800}},
+            {"aircraft_id": 101, "aircraft_data": {"weight": 900}},
+            {"aircraft_id": 999, "name": "Unknown"},
+        ],
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"results": {"100": "updated", "101": "updated", "999": "not_found"}}
+
+    aircrafts = {
+        aircraft.aircraft_id: aircraft for aircraft in await AircraftRepository(db_session).display_aircrafts()
+    }
+    assert aircrafts[100].name == "C-152A"
+    assert aircrafts[100].aircraft_data.weight == 800
+    assert aircrafts[101].name == "C-172"
+    assert aircrafts[101].aircraft_data.weight == 900
+
+
+async def test_remove_aircrafts(client: AsyncClient, load_data, db_session, new_aircraft_fixture):
+    """Tests the 'remove_aircrafts' endpoint deletes aircraft matching the criteria in bulk.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {pytest.fixture} -- creates database structure and loads data,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+        new_aircraft {AircraftBaseSchema} -- AircraftBaseSchema object.
+
+    Expected behaviour:
+        remove_aircrafts() -> {'results': {'100': 'deleted', '999': 'not_found'}}, aircraft 101 is kept.
+    """
+    await client.post(url="/aircrafts/bulk", json=[new_aircraft_fixture.model_dump(exclude={"aircraft_id"})])
+
+    response = await client.request(
+        method="DELETE", url="/aircrafts/bulk", json={"aircraft_ids": [100, 999], "manufacturer": "Cessna"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"results": {"100": "deleted", "999": "not_found"}}
+
+    remaining_ids = await db_session.scalars(select(AircraftData.aircraft_id))
+    assert remaining_ids.all() == [101]
+
+    response = await client.request(method="DELETE", url="/aircrafts/bulk", json={})
+
+    assert response.status_code == 422
+
+
+async def test_search_aircrafts(client: AsyncClient, load_data, db_session, new_aircraft_fixture):
+    """Tests the 'search_aircrafts' endpoint finds aircraft by name prefix and fuzzy manufacturer, and follows
+    aircraft added, updated and deleted afterwards.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {pytest.fixture} -- creates database structure and loads data,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session,
+        new_aircraft {AircraftBaseSchema} -- AircraftBaseSchema object.
+
+    Expected behaviour:
+        search_aircrafts(q='C-1') -> [C-152], search_aircrafts(q='Cesna') -> [C-152, C-172].
+    """
+    await db_session.commit()
+
+    response = await client.get("/aircrafts/search", params={"q": "C-1"})
+
+    assert response.status_code == 200
+    assert [aircraft["name"] for aircraft in response.json()] == ["C-152"]
+
+    await client.post(url="/aircrafts/add_aircraft", json=new_aircraft_fixture.model_dump())
+    response = await client.get("/aircrafts/search", params={"q": "Cesna"})
+
+    assert [aircraft["name"] for aircraft in response.json()] == ["C-152", "C-172"]
+
+    await client.patch(url="/aircrafts/update_aircraft/100", json={"name": "Skyhawk"})
+    await client.delete(url="/aircrafts/delete_aircraft/101")
+    response = await client.get("/aircrafts/search", params={"q": "sky"})
+
+    assert [aircraft["name"] for aircraft in response.json()] == ["Skyhawk"]
+
+    response = await client.get("/aircrafts/search", params={"q": "C-1"})
+
+    assert response.json() == []
+
+
+async def test_search_aircrafts_follows_other_workers(client: AsyncClient, load_data, db_session):
+    """Tests the 'search_aircrafts' endpoint reloads the in-memory index once the fleet version shows a write it
+    did not apply, as happens when another worker changes the fleet.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {pytest.fixture} -- creates database structure and loads data,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        search_aircrafts(q='sky') -> [] before and [Skyhawk] after the other worker renamed C-152.
+    """
+    await db_session.commit()
+    response = await client.get("/aircrafts/search", params={"q": "sky"})
+
+    assert response.json() == []
+
+    await db_session.execute(update(Aircraft).where(Aircraft.aircraft_id == 100).values(name="Skyhawk"))
+    await db_session.execute(update(FleetState).values(version=FleetState.version + 1))
+    await db_session.commit()
+    response = await client.get("/aircrafts/search", params={"q": "sky"})
+
+    assert [aircraft["name"] for aircraft in response.json()] == ["Skyhawk"]
+    assert aircraft_search_index.version == await AircraftRepository(db_session).fleet_version()
+
+
+async def test_cached_reads_follow_other_workers(client: AsyncClient, load_data, db_session):
+    """Tests a write of another worker, whose invalidation never reached the cache of this one, is not answered
+    with the cached body under the new ETag.
+
+    Arguments:
+        client {AsyncClient} -- httpx asynchronous client object,
+        load_data {pytest.fixture} -- creates database structure and loads data,
+        db_session {sqlalchemy.ext.asyncio.AsyncSession} -- database session.
+
+    Expected behaviour:
+        list, single and range reads after the write -> new ETag with the renamed aircraft.
+    """
+    await db_session.commit()
+    urls = [
+        "/aircrafts/",
+        "/aircrafts/100",
+        "/aircrafts/100?fields=name",
+        "/aircrafts/performance/range/aircraft_id/wind_speed/fuel?aircraft_id=100&wind_speed=0&fuel=100",
+    ]
+    primed = [await client.get(url) for url in urls]
+
+    await db_session.execute(
+        update(Aircraft).where(Aircraft.aircraft_id == 100).values(name="C-152 Aerobat", version=Aircraft.version + 1)
+    )
+    await db_session.execute(update(FleetState).values(version=FleetState.version + 1))
+    await db_session.commit()
+
+    for url, before in zip(urls, primed):
+        response = await client.get(url)
+        body = response.json()
+
+        assert response.headers["ETag"] != before.headers["ETag"]
+        assert (body[0] if isinstance(body, list) else body)["name"] == "C-152 Aerobat"
+
+
+async def test_search_index_ranking():
+    """Tests the fuzzy search of the in-memory index, which stops once the limit is filled, returns the same aircraft
+    in the same order as ranking every indexed term by its similarity.
+
+    Expected behaviour:
+        search() -> prefix matches, then the aircraft of the most similar terms, ties ordered by term and 'id'.
+    """
+    prefixes, manufacturers = ["F", "FA", "B", "BO", "CE"], ["Boeing", "Cessna", "Cessna Aircraft"]
+    index = NgramIndex()
+    index.load(
+        (aircraft_id, f"{prefixes[aircraft_id % 5]}-{aircraft_id % 97}", manufacturers[aircraft_id % 3])
+        for aircraft_id in range(1, 1001)
+    )
+
+    for query, limit in [("Boing", 5), ("Cesna", 40), ("bo-7", 20), ("f-12", 100), ("xyz", 10)]:
+        query_ngrams = index.ngrams(query.lower())
+        ranked = {
+            aircraft_id: None
+            for term in sorted(index._term_aircraft_ids)
+            if term.startswith(query.lower())
+            for aircraft_id in sorted(index._term_aircraft_ids[term])
+        }
+        for negative_similarity, term in sorted(
+            (-len(query_ngrams & index.ngrams(term)) / len(query_ngrams | index.ngrams(term)), term)
+            for term in index._term_aircraft_ids
+        ):
+            if -negative_similarity >= 0.3:
+                ranked.update(dict.fromkeys(sorted(index._term_aircraft_ids[term])))
+
+        assert index.search(query, limit=limit, threshold=0.3) == list(ranked)[:limit]
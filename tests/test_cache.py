@@ -0,0 +1,210 @@
+# Third party imports
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Internal imports
+from src.models import AircraftType
+from src.router.weather_api import WeatherData, fetch_weather_data, unknown_weather_data
+from src.schemas import AircraftDataBaseSchema, AircraftDisplaySchema, aircraft_projection_schema
+from src.utils.cache import InMemoryCacheBackend, LRUCache, RedisCacheBackend
+from src.utils.codec import decode_model, encode_model, pack, unpack
+
+
+class FakeRedis:
+    """Local stand-in of the redis.asyncio client, implementing the commands used by RedisCacheBackend."""
+
+    def __init__(self):
+        self.data = {}
+        self.expirations = {}
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        if ex is not None:
+            self.expirations[key] = ex
+        return True
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    """Tests the least recently used entries are evicted once the entry or byte limit is exceeded.
+
+    Expected behaviour:
+        the entry not read since the others were stored is evicted first, oversized values are not stored.
+    """
+    cache = LRUCache(max_entries=2, max_bytes=100, ttl=60)
+    cache.set("aircraft", 1, "F-16", size=10)
+    cache.set("aircraft", 2, "F-22", size=10)
+    cache.get("aircraft", 1)
+    cache.set("aircraft", 3, "F-35", size=10)
+
+    assert cache.get("aircraft", 2) is None
+    assert cache.get("aircraft", 1) == "F-16"
+
+    cache.set("aircraft", 4, "B-52", size=95)
+
+    assert len(cache) == 1
+    assert cache.size_bytes == 95
+
+    cache.set("aircraft", 5, "C-5", size=101)
+
+    assert cache.get("aircraft", 5) is None
+    assert cache.stats.evictions == 3
+
+
+def test_ttl_and_invalidation(clock):
+    """Tests entries expire after the time to live and invalidation removes every entry of the namespace.
+
+    Expected behaviour:
+        expired and invalidated entries are missed and counted.
+    """
+    cache = LRUCache(max_entries=10, max_bytes=1000, ttl=60, clock=clock)
+    cache.set(("aircraft", 1), None, "F-16")
+    cache.set(("aircraft", 1), frozenset({"name"}), "F-16")
+    cache.set("aircrafts", (None, 100), ["F-16"])
+
+    cache.invalidate([("aircraft", 1)])
+
+    assert cache.get(("aircraft", 1), None) is None
+    assert cache.stats.invalidations == 2
+
+    clock.now = 61
+
+    assert cache.get("aircrafts", (None, 100)) is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_codec_round_trip():
+    """Tests models and weather data survive the compact positional encoding.
+
+    Expected behaviour:
+        decode_model(encode_model(aircraft)) == aircraft, projections and tuples included.
+    """
+    aircraft = AircraftDisplaySchema(
+        aircraft_id=100,
+        name="C-152",
+        manufacturer="Cessna",
+        aircraft_type=AircraftType.Trainer,
+        first_flight="1977-08-12",
+        aircraft_data=AircraftDataBaseSchema(
+            fuel_consumption=15, ceiling=2800, weight=750, fuel=120, max_speed=270, cruise_speed=190
+        ),
+    )
+    encoded = encode_model(aircraft)
+
+    assert decode_model(AircraftDisplaySchema, encoded) == aircraft
+    assert len(encoded) < len(aircraft.model_dump_json())
+
+    projection = aircraft_projection_schema(frozenset({"aircraft_id", "name", "take_off_weight"}))
+    partial = projection.model_validate(
+        {"aircraft_id": 100, "name": "C-152", "aircraft_data": {"take_off_weight": 834}}
+    )
+
+    assert decode_model(projection, encode_model(partial)) == partial
+
+    weather = WeatherData(name="Warsaw", last_updated="2026-10-17 12:00", current_wind_speed=11.2)
+
+    assert WeatherData(*unpack(pack(tuple(vars(weather).values())))) == weather
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("backend_type", ["memory", "redis"])
+async def test_cache_backends(backend_type):
+    """Tests both backends store, multi-get and invalidate entries, and skip values loaded during invalidation.
+
+    Arguments:
+        backend_type {str} -- Tested backend.
+
+    Expected behaviour:
+        the same entries are visible through both backends, stale values are not stored.
+    """
+    if backend_type == "memory":
+        backend = InMemoryCacheBackend(LRUCache(max_entries=10, max_bytes=1000, ttl=60))
+    else:
+        backend = RedisCacheBackend(FakeRedis(), ttl=60)
+
+    generation = await backend.generation()
+    await backend.set_many(
+        [("aircraft:1", "*", b"F-16"), ("aircraft:2", "*", b"F-22"), ("aircrafts", "page", b"1,2")],
+        generation=generation,
+    )
+
+    assert await backend.get_many([("aircraft:1", "*"), ("aircraft:2", "*"), ("aircraft:3", "*")]) == [
+        b"F-16",
+        b"F-22",
+        None,
+    ]
+
+    await backend.invalidate(["aircrafts", "aircraft:1"])
+
+    assert await backend.get_many([("aircraft:1", "*"), ("aircrafts", "page")]) == [None, None]
+
+    await backend.set_many([("aircraft:1", "*", b"F-16")], generation=generation)
+
+    assert await backend.get_many([("aircraft:1", "*")]) == [None]
+    assert backend.stats.hits == 2
+    assert backend.stats.misses == 4
+
+    await backend.set_many([("aircraft:1", "*", b"F-16"), ("aircraft:4", "*", b"F-35")], ttl=5)
+
+    assert await backend.get_many([("aircraft:1", "*"), ("aircraft:4", "*")]) == [b"F-16", b"F-35"]
+    if backend_type == "redis":
+        # Every entry expires on its own, writes do not extend the life of the other entries.
+        assert sorted(backend.client.expirations.values()) == [5, 5, 60, 60, 60]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_fetch_weather_data_cached():
+    """Tests the weather data of a location is fetched once and then read from the shared cache, and incomplete
+    data is not cached.
+
+    Expected behaviour:
+        fetch_weather_data() twice -> one fetch, equal results; unknown data -> fetched every time.
+    """
+    backend = RedisCacheBackend(FakeRedis(), ttl=60)
+    fetch = AsyncMock(return_value=WeatherData(name="Warsaw", last_updated="2026-10-17 12:00", current_wind_speed=11.2))
+
+    first = await fetch_weather_data("waw", fetch, cache=backend)
+    second = await fetch_weather_data("waw", fetch, cache=backend)
+
+    assert first == second
+    assert fetch.await_count == 1
+
+    fetch.return_value = unknown_weather_data()
+    await fetch_weather_data("krk", fetch, cache=backend)
+    await fetch_weather_data("krk", fetch, cache=backend)
+
+    assert fetch.await_count == 3
@@ -1,18 +1,29 @@
 # Third party imports
-from unittest.mock import Mock, patch
+import json
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 
 # Internal imports
+from src.config.database import settings
+from src.repository import AircraftRepository
 from src.schemas import (
     InputAircraftPerformanceEnduranceSchema,
     InputAircraftPerformanceRangeSchema,
     OutputAircraftPerformanceEnduranceSchema,
     OutputAircraftPerformanceRangeSchema,
+    PerformanceEngine,
 )
-from src.use_cases.performance import Performance
+from src.use_cases.performance import Performance, breguet_flight_time, flight_time_memo
+from src.use_cases.sweep import PerformanceSweep, evaluate_ranges
+from src.utils.airports import EARTH_RADIUS, AirportIndex, unit_vectors
 from tests.conftest import db_session, load_data
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
 class TestPerformance:
     @pytest.fixture
@@ -42,14 +53,14 @@ class TestPerformance:
             OutputAircraftPerformanceEnduranceSchema(name="C-152", endurance="04:00"),
         )
 
-    def test_calculate_range(
+    async def test_calculate_range(
         self,
         mock_input_aircraft_performance_range_schema,
         mock_output_aircraft_performance_range_schema,
         load_data,
         db_session,
     ):
-        output = Performance(db_session).calculate_range(input_data=mock_input_aircraft_performance_range_schema)
+        output = await Performance(db_session).calculate_range(input_data=mock_input_aircraft_performance_range_schema)
 
         expected_output = mock_output_aircraft_performance_range_schema
 
@@ -57,8 +68,8 @@ class TestPerformance:
         assert output.name == "C-152"
         assert output.range == 800.0
 
-    def test_calculate_range_2(self, mock_input_aircraft_performance_range_schema):
-        mock_session = Mock()
+    async def test_calculate_range_2(self, mock_input_aircraft_performance_range_schema):
+        mock_session = AsyncMock()
         performance = Performance(mock_session)
 
         mock_aircraft = Mock()
@@ -68,24 +79,22 @@ class TestPerformance:
         mock_aircraft_data.cruise_speed = 190
         mock_aircraft_data.fuel_consumption = 15
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
-            mock_aircraft,
-            mock_aircraft_data,
-        ]
-        result = performance.calculate_range(mock_input_aircraft_performance_range_schema)
+        mock_aircraft.aircraft_data = mock_aircraft_data
+        performance.aircraft_repo.get_aircraft = AsyncMock(return_value=mock_aircraft)
+        result = await performance.calculate_range(mock_input_aircraft_performance_range_schema)
 
         assert isinstance(result, OutputAircraftPerformanceRangeSchema)
         assert result.name == "C-152"
         assert result.range == 800
 
-    def test_calculate_endurance(
+    async def test_calculate_endurance(
         self,
         mock_input_aircraft_performance_endurance_schema,
         mock_output_aircraft_performance_endurance_schema,
         load_data,
         db_session,
     ):
-        output = Performance(db_session).calculate_endurance(
+        output = await Performance(db_session).calculate_endurance(
             input_data=mock_input_aircraft_performance_endurance_schema
         )
 
@@ -95,8 +104,8 @@ class TestPerformance:
         assert output.name == "C-152"
         assert output.endurance == "04:00"
 
-    def test_calculate_endurance_2(self, mock_input_aircraft_performance_endurance_schema):
-        mock_session = Mock()
+    async def test_calculate_endurance_2(self, mock_input_aircraft_performance_endurance_schema):
+        mock_session = AsyncMock()
         performance = Performance(mock_session)
 
         mock_aircraft = Mock()
@@ -105,13 +114,114 @@ class TestPerformance:
         mock_aircraft_data = Mock()
         mock_aircraft_data.fuel_consumption = 15
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
-            mock_aircraft,
-            mock_aircraft_data,
-        ]
+        mock_aircraft.aircraft_data = mock_aircraft_data
+        performance.aircraft_repo.get_aircraft = AsyncMock(return_value=mock_aircraft)
 
-        result = performance.calculate_endurance(input_data=mock_input_aircraft_performance_endurance_schema)
+        result = await performance.calculate_endurance(input_data=mock_input_aircraft_performance_endurance_schema)
 
         assert isinstance(result, OutputAircraftPerformanceEnduranceSchema)
         assert result.name == "C-152"
         assert result.endurance == "04:00"
+
+    async def test_performance_table(self, load_data, db_session):
+        table = await Performance(db_session).performance_table(100)
+
+        assert table.lookup_range(fuel=60.0, wind_speed=10.0) == pytest.approx(800.0)
+        assert table.lookup_range(fuel=37.5, wind_speed=-12.5) == pytest.approx((190 - 12.5) * 37.5 / 15)
+        assert table.lookup_endurance(fuel=60.0) == pytest.approx(4.0)
+        assert table.lookup_range(fuel=500.0, wind_speed=0.0) is None
+        assert await Performance(db_session).performance_table(100) is table
+
+    async def test_breguet_flight_time(self):
+        weight, fuel_capacity, fuel, fuel_mass_ratio = 750.0, 120.0, np.array([60.0, 120.0]), 0.7
+        reference_weight = weight + fuel_capacity * fuel_mass_ratio
+
+        flight_time = breguet_flight_time(
+            fuel_consumption=np.array([15.0, 15.0]),
+            weight=np.array([weight, np.nan]),
+            fuel_capacity=np.array([fuel_capacity, fuel_capacity]),
+            fuel=fuel,
+            steps=64,
+        )
+
+        # Closed form of the integral with the burn rate proportional to the gross weight.
+        expected = reference_weight / (15.0 * fuel_mass_ratio) * np.log((weight + fuel * fuel_mass_ratio) / weight)
+        assert flight_time[0] == pytest.approx(expected, rel=1e-4)
+        assert flight_time[1] == pytest.approx(fuel / 15.0)
+
+    async def test_calculate_range_breguet(self, mock_input_aircraft_performance_range_schema, load_data, db_session):
+        performance = Performance(db_session)
+
+        output = await performance.calculate_range(
+            mock_input_aircraft_performance_range_schema, engine=PerformanceEngine.breguet
+        )
+
+        assert output.name == "C-152"
+        assert output.range > 800.0
+        assert len(flight_time_memo) == 1
+        assert (
+            await performance.calculate_range(
+                mock_input_aircraft_performance_range_schema, engine=PerformanceEngine.breguet
+            )
+            == output
+        )
+        assert flight_time_memo.stats.hits == 1
+
+        await AircraftRepository(db_session).delete_aircraft(mock_input_aircraft_performance_range_schema.aircraft_id)
+        assert len(flight_time_memo) == 0
+
+    async def test_sweep_chunks_bounded(self, monkeypatch):
+        created = []
+
+        class CountedSharedMemory(SharedMemory):
+            def __init__(self, *args, create: bool = False, **kwargs):
+                super().__init__(*args, create=create, **kwargs)
+                if create:
+                    created.append(self.size)
+
+        monkeypatch.setattr("src.use_cases.sweep.SharedMemory", CountedSharedMemory)
+        monkeypatch.setattr(settings, "sweep_pending_chunks", 2)
+        aircraft = np.array([[190.0 + index, 15.0, 750.0, 120.0] for index in range(7)])
+        sweep = PerformanceSweep(
+            aircraft_ids=list(range(7)),
+            aircraft=aircraft,
+            fuel=[30.0, 60.0],
+            wind_speed=[0.0, 10.0],
+            wind_direction=90.0,
+            heading_step=90.0,
+            engine=PerformanceEngine.linear,
+        )
+        expected = evaluate_ranges(
+            aircraft, sweep.fuel, sweep.wind_speed, 90.0, sweep.headings, PerformanceEngine.linear, 1
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            chunks = [chunk async for chunk in sweep.chunks(executor, chunk_points=32)]
+            encoded = [chunk async for chunk in sweep.chunks(executor, chunk_points=32, encode=True)]
+
+        # Input matrix and two reused output blocks of two aircraft, then the input matrix only.
+        assert created == [aircraft.nbytes, 2 * 16 * 4, 2 * 16 * 4, aircraft.nbytes]
+        ranges = np.concatenate(
+            [np.frombuffer(data, dtype=np.float32).reshape(stop - start, 2, 2, 4) for start, stop, data in chunks]
+        )
+        order = np.concatenate([np.arange(start, stop) for start, stop, _ in chunks])
+        assert ranges == pytest.approx(expected[order], rel=1e-6)
+        assert sorted(start for start, _, _ in encoded) == [0, 2, 4, 6]
+        assert json.loads(encoded[0][2]) == pytest.approx(np.round(expected[encoded[0][0] : encoded[0][1]], 1))
+
+    async def test_airport_index(self):
+        rng = np.random.default_rng(0)
+        latitudes = np.degrees(np.arcsin(rng.uniform(-1, 1, 5000)))
+        longitudes = rng.uniform(-180, 180, 5000)
+        index = AirportIndex([str(number) for number in range(5000)], ["Airport"] * 5000, latitudes, longitudes)
+
+        positions, distances, courses = index.within(latitude=52.0, longitude=179.0, radius=1500.0)
+
+        chords = np.linalg.norm(unit_vectors(latitudes, longitudes) - unit_vectors([52.0], [179.0]), axis=1)
+        expected_distances = 2 * EARTH_RADIUS * np.arcsin(chords / 2)
+        assert sorted(index.idents[positions]) == sorted(
+            str(number) for number in np.flatnonzero(expected_distances <= 1500)
+        )
+        assert np.all(np.diff(distances) >= 0)
+        assert index.courses(0.0, 0.0, np.array([], dtype=int)).size == 0
+        assert index.within(latitude=52.0, longitude=179.0, radius=30_000)[0].size == 5000
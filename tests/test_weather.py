@@ -0,0 +1,185 @@
+# Third party imports
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Internal imports
+from src.exceptions import WeatherProviderError
+from src.router.weather_api import WeatherData
+from src.use_cases.weather import WeatherCache, WindObservation
+from tests.conftest import FakeClock
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+WARSAW = WeatherData(name="Warsaw", last_updated="2026-10-17 12:00", current_wind_speed=11.2)
+WARSAW_LATER = WeatherData(name="Warsaw", last_updated="2026-10-17 12:05", current_wind_speed=14.8)
+
+
+def weather_cache(fetch: AsyncMock, clock: FakeClock) -> WeatherCache:
+    return WeatherCache(fetch=fetch, ttl=300, stale_ttl=600, refresh_interval=60, clock=clock)
+
+
+async def test_weather_cache_single_flight(clock):
+    """Tests concurrent reads of a missing location share one fetch and later reads are answered from the cache.
+
+    Expected behaviour:
+        get() ten times at once -> one fetch, ten equal observations; peek() -> fresh hit.
+    """
+    fetch = AsyncMock(return_value=WARSAW)
+    cache = weather_cache(fetch, clock)
+
+    results = await asyncio.gather(*(cache.get("waw") for _ in range(10)))
+
+    assert results == [WARSAW] * 10
+    assert fetch.await_count == 1
+    assert cache.peek("waw") == WARSAW
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.refreshes) == (1, 10, 1)
+
+
+async def test_weather_cache_stale_while_revalidate(clock):
+    """Tests a stale observation is served at once while refreshed in the background, and kept when the refresh
+    fails.
+
+    Expected behaviour:
+        peek() of a stale location -> stale observation, then the refreshed one; failed refresh -> stale kept.
+    """
+    fetch = AsyncMock(return_value=WARSAW)
+    cache = weather_cache(fetch, clock)
+    assert cache.peek("waw") is None
+    await asyncio.sleep(0)
+
+    clock.now = 400
+    fetch.return_value = WARSAW_LATER
+    assert cache.peek("waw") == WARSAW
+    await asyncio.sleep(0)
+    assert cache.peek("waw") == WARSAW_LATER
+
+    clock.now = 800
+    fetch.side_effect = WeatherProviderError("Timeout.")
+    assert cache.peek("waw") == WARSAW_LATER
+    await asyncio.sleep(0)
+    assert cache.peek("waw") == WARSAW_LATER
+    assert cache.stats.failures == 1
+
+    clock.now = 2000
+    assert cache.peek("waw") is None
+    with pytest.raises(WeatherProviderError):
+        await cache.get("waw")
+
+
+async def test_weather_cache_background_refresh(clock):
+    """Tests the background pass refreshes the locations about to expire and forgets the ones nobody reads.
+
+    Expected behaviour:
+        refresh_due() -> due and preloaded locations fetched, idle location dropped.
+    """
+    fetch = AsyncMock(return_value=WARSAW)
+    cache = weather_cache(fetch, clock)
+    cache.locations = {"krk"}
+    await cache.get("waw")
+
+    clock.now = 100
+    await cache.refresh_due()
+    assert [call.args[0] for call in fetch.await_args_list] == ["waw", "krk"]
+
+    clock.now = 250
+    await cache.refresh_due()
+    assert [call.args[0] for call in fetch.await_args_list[2:]] == ["waw"]
+
+    clock.now = 1000
+    await cache.refresh_due()
+    assert len(cache) == 1
+    assert cache.peek("krk") == WARSAW
+
+    cache.start()
+    await cache.stop()
+
+
+async def test_weather_cache_bounded_tracking(clock):
+    """Tests the read locations are tracked up to the limit, and a failing location is backed off and not
+    refreshed in the background.
+
+    Expected behaviour:
+        three reads with a limit of two -> least recently read forgotten; failures -> no fetch until the backoff
+        (60 s, then 120 s) passed, none from refresh_due().
+    """
+    fetch = AsyncMock(return_value=WARSAW)
+    cache = WeatherCache(fetch=fetch, ttl=300, stale_ttl=600, refresh_interval=60, max_locations=2, clock=clock)
+    for location in ("waw", "krk", "waw", "gdn"):
+        await cache.get(location)
+
+    assert cache.occupancy()["tracked"] == 2
+    assert len(cache) == 2
+    assert cache.peek("waw") == cache.peek("gdn") == WARSAW
+    assert fetch.await_count == 3
+
+    fetch.reset_mock()
+    fetch.side_effect = WeatherProviderError("Unknown location.")
+    with pytest.raises(WeatherProviderError):
+        await cache.get("nowhere")
+    with pytest.raises(WeatherProviderError):
+        await cache.get("nowhere")
+    await cache.refresh_due()
+    assert fetch.await_count == 1
+    assert cache.occupancy()["backing_off"] == 1
+
+    clock.now = 61
+    with pytest.raises(WeatherProviderError):
+        await cache.get("nowhere")
+    clock.now = 150
+    assert cache.peek("nowhere") is None
+    await cache.refresh_due()
+    assert [call.args[0] for call in fetch.await_args_list] == ["nowhere", "nowhere"]
+
+
+async def test_weather_cache_get_many(clock):
+    """Tests many locations are fetched concurrently within the concurrency limit, every distinct location once,
+    and a location no provider answered is reported without failing the others.
+
+    Expected behaviour:
+        get_many() -> one fetch per distinct location, at most three at once, the error of the failed location.
+    """
+    running, peak = 0, 0
+
+    async def fetch(location: str) -> WeatherData:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if location == "nowhere":
+            raise WeatherProviderError()
+        return WeatherData(name=location, current_wind_speed="5")
+
+    fetch = AsyncMock(side_effect=fetch)
+    cache = WeatherCache(fetch=fetch, ttl=300, stale_ttl=600, refresh_interval=60, concurrency=3, clock=clock)
+    locations = [f"station-{index % 10}" for index in range(30)] + ["nowhere"]
+
+    results, again = await asyncio.gather(cache.get_many(locations), cache.get_many(["station-0", "station-1"]))
+
+    assert list(results) == list(dict.fromkeys(locations))
+    assert results["station-7"].name == "station-7"
+    assert isinstance(results["nowhere"], WeatherProviderError)
+    assert again["station-1"] == results["station-1"]
+    assert fetch.await_count == 11
+    assert peak == 3
+    assert cache.occupancy()["in_flight"] == 0
+
+
+async def test_wind_observation():
+    """Tests the wind reported by the providers is normalized into numbers and split into its along-track component.
+
+    Expected behaviour:
+        from_weather_data() -> numeric wind, None without a speed; tailwind() -> component on the heading.
+    """
+    wind = WindObservation.from_weather_data(WeatherData(current_wind_speed="12.5", current_wind_direction="Unknown"))
+    assert wind == WindObservation(speed=12.5, direction=None)
+    assert wind.tailwind(90) == -12.5
+    assert WindObservation.from_weather_data(WeatherData(current_wind_speed="Unknown")) is None
+
+    wind = WindObservation(speed=20.0, direction=270.0)
+    assert wind.tailwind(90) == pytest.approx(20.0)
+    assert wind.tailwind(270) == pytest.approx(-20.0)
+    assert wind.tailwind(0) == pytest.approx(0.0, abs=1e-9)
+    assert wind.tailwind() == -20.0
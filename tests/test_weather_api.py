@@ -0,0 +1,339 @@
+# Third party imports
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+# Internal imports
+from src.config.database import settings
+from src.exceptions import WeatherProviderError
+from src.router.weather_api import (
+    WEATHERAPI_FIELDS,
+    WEATHERSTACK_FIELDS,
+    ProviderStrategy,
+    WeatherApi,
+    WeatherData,
+    WeatherProviders,
+    unknown_weather_data,
+)
+from src.utils.resilience import (
+    BreakerState,
+    CircuitBreaker,
+    LatencyTracker,
+    RetryBudget,
+    TokenBucket,
+    backoff_delay,
+)
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class StubWeatherHandler(BaseHTTPRequestHandler):
+    """Answers like weatherapi.com on '/weatherapi' and like weatherstack on '/weatherstack'. The 'delay' query
+    parameter delays the answer by seconds and 'status' sets the status code."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        self.server.requests.append((url.path, params, self.client_address))
+        time.sleep(float(params.get("delay", 0)))
+
+        location = params.get("q") or params.get("query", "waw")
+        if url.path == "/weatherapi":
+            body = {
+                "location": {"name": location},
+                "current": {"last_updated": "2026-10-17 12:00", "wind_kph": 11.2, "wind_degree": 270, "temp_c": 9.0},
+            }
+        else:
+            body = {"location": {"name": location}, "current": {"observation_time": "12:00 PM", "wind_speed": 13}}
+
+        content = json.dumps(body).encode()
+        self.send_response(int(params.get("status", 200)))
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class StubWeatherServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        """Ignores the clients leaving before the delayed answer, like the cancelled hedged requests."""
+
+
+@pytest.fixture
+def weather_server() -> Generator[StubWeatherServer, None, None]:
+    """
+    Yields a local stub of the weather services listening on a free port, with the received requests
+    in its 'requests' attribute.
+    """
+    server = StubWeatherServer(("127.0.0.1", 0), StubWeatherHandler)
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def test_get_weather_data(weather_server):
+    """Tests the weather data is parsed and the pooled connection is reused between requests, and a failed request
+    does not report the data of the previous one.
+
+    Expected behaviour:
+        get_weather_data() twice -> same data, all the requests on one connection, other location queried,
+        failed request -> "Unknown" data.
+    """
+    async with httpx.AsyncClient() as client:
+        weather_api = WeatherApi(
+            api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, client=client, q="waw"
+        )
+
+        first = await weather_api.get_weather_data()
+        second = await weather_api.get_weather_data()
+        other = await weather_api.get_weather_data("krk")
+        weather_api.api_params["status"] = "500"
+        failed = await weather_api.get_weather_data()
+
+    assert first == second == WeatherData("waw", "2026-10-17 12:00", 11.2, 270, 9.0)
+    assert other.name == "krk"
+    assert failed == unknown_weather_data()
+    assert len({client_address for _, _, client_address in weather_server.requests}) == 1
+
+
+async def test_get_weather_data_timeout(weather_server):
+    """Tests a provider answering after the read timeout and a failing one give "Unknown" data without waiting.
+
+    Expected behaviour:
+        get_weather_data() -> "Unknown" values within the timeout.
+    """
+    async with httpx.AsyncClient(timeout=httpx.Timeout(0.2, connect=0.2)) as client:
+        slow_api = WeatherApi(
+            api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, client=client, delay="2"
+        )
+        failing_api = WeatherApi(
+            api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, client=client, status="500"
+        )
+
+        start_time = time.perf_counter()
+        slow_data = await slow_api.get_weather_data()
+
+        assert time.perf_counter() - start_time < 1
+        assert slow_data.name == slow_data.current_wind_speed == "Unknown"
+        assert (await failing_api.get_weather_data()).name == "Unknown"
+
+
+async def test_weather_providers_first(weather_server):
+    """Tests the hedged request returns the first good answer and starts the next provider on a failure
+    or after the hedge delay.
+
+    Expected behaviour:
+        get_weather_data() -> answer of the fast provider, not waiting for the slow one.
+    """
+    async with httpx.AsyncClient() as client:
+        slow_api = WeatherApi(
+            api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, client=client, delay="2"
+        )
+        failing_api = WeatherApi(
+            api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, client=client, status="503"
+        )
+        fast_api = WeatherApi(
+            api_url=f"{weather_server.url}/weatherstack", fields=WEATHERSTACK_FIELDS, client=client, query="krk"
+        )
+
+        start_time = time.perf_counter()
+        weather_data = await WeatherProviders([slow_api, fast_api], hedge_delay=0.1).get_weather_data()
+
+        assert time.perf_counter() - start_time < 1
+        assert weather_data.name == "krk"
+        assert (await WeatherProviders([failing_api, fast_api], hedge_delay=10).get_weather_data()).name == "krk"
+        assert (await WeatherProviders([failing_api]).get_weather_data()).name == "Unknown"
+
+
+async def test_weather_providers_merge(weather_server):
+    """Tests the merge takes every field from the first provider knowing it, skipping the failing ones.
+
+    Expected behaviour:
+        get_weather_data() -> name and wind speed of weatherstack, temperature of weatherapi.com.
+    """
+    async with httpx.AsyncClient() as client:
+        providers = WeatherProviders(
+            [
+                WeatherApi(api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, status="500"),
+                WeatherApi(api_url=f"{weather_server.url}/weatherstack", fields=WEATHERSTACK_FIELDS, query="krk"),
+                WeatherApi(api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, q="waw"),
+            ],
+            strategy=ProviderStrategy.merge,
+        )
+        for provider in providers.providers:
+            provider.client = client
+
+        weather_data = await providers.get_weather_data()
+
+    assert weather_data == WeatherData("krk", "12:00 PM", 13, 270, 9.0)
+
+
+async def test_circuit_breaker(clock):
+    """Tests the circuit opens after the consecutive failures, lets one trial call through after the reset timeout
+    and closes when it succeeds, and only the release of the trial call lets another one through.
+
+    Expected behaviour:
+        closed -> open after 3 failures -> half open after 30 s -> open on a failed trial -> closed on success.
+    """
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state is BreakerState.open
+    assert not breaker.allow()
+
+    clock.now = 30
+    assert breaker.state is BreakerState.half_open
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.open
+
+    clock.now = 60
+    assert breaker.allow()
+    breaker.release(trial=False)
+    assert not breaker.allow()
+    breaker.release(trial=True)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state is BreakerState.closed
+    assert breaker.opened == 2
+
+
+async def test_circuit_breaker_unexpected_error(monkeypatch, clock):
+    """Tests a trial call failing with an unexpected error opens the circuit again instead of keeping the trial
+    taken forever.
+
+    Expected behaviour:
+        KeyError of the trial call -> circuit open, half open again after the reset timeout.
+    """
+    monkeypatch.setattr(settings, "weather_max_retries", 0)
+    api = WeatherApi(api_url="http://127.0.0.1:1/weatherapi", fields=WEATHERAPI_FIELDS)
+    providers = WeatherProviders([api], clock=clock)
+    breaker = providers.health[api].breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    clock.now = breaker.reset_timeout
+
+    async def malformed_answer(location: str | None) -> WeatherData:
+        raise KeyError("current")
+
+    monkeypatch.setattr(api, "request_weather_data", malformed_answer)
+    with pytest.raises(KeyError):
+        await providers.request_weather_data()
+
+    assert breaker.state is BreakerState.open
+    clock.now += breaker.reset_timeout
+    assert breaker.allow()
+
+
+async def test_retry_budget_and_latency(clock):
+    """Tests the retries are limited to the share of the requests, the backoff is capped and the latency
+    percentiles roll over the window.
+
+    Expected behaviour:
+        two retries from the initial tokens, one more after five requests; p95 of the recent samples only.
+    """
+    budget = RetryBudget(ratio=0.2, max_tokens=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+    for _ in range(5):
+        budget.deposit()
+    assert budget.withdraw()
+
+    assert backoff_delay(0, base=0.1, cap=2.0, jitter=lambda: 1.0) == pytest.approx(0.1)
+    assert backoff_delay(10, base=0.1, cap=2.0, jitter=lambda: 1.0) == 2.0
+    assert backoff_delay(3, base=0.1, cap=2.0, jitter=lambda: 0.0) == 0.0
+
+    latency = LatencyTracker(window=60, max_samples=100, clock=clock)
+    for sample in range(1, 101):
+        latency.record(sample / 1000)
+    assert latency.percentile(95) == pytest.approx(0.095)
+    assert latency.percentile(50) == pytest.approx(0.05)
+
+    clock.now = 61
+    assert latency.percentile(95) is None
+
+
+async def test_weather_providers_routing(weather_server, monkeypatch):
+    """Tests the providers are tried from the fastest healthy one and a failing provider is skipped without
+    a request once its circuit is open.
+
+    Expected behaviour:
+        ranked() -> fast provider first; after the failures -> failing provider last, no more requests to it.
+    """
+    monkeypatch.setattr(settings, "weather_breaker_failures", 2)
+    monkeypatch.setattr(settings, "weather_max_retries", 0)
+    async with httpx.AsyncClient() as client:
+        slow_api, fast_api, failing_api = (
+            WeatherApi(api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, client=client, q=name)
+            for name in ("slow", "fast", "failing")
+        )
+        failing_api.api_params["status"] = "500"
+        providers = WeatherProviders([slow_api, fast_api], hedge_delay=10)
+
+        providers.health[slow_api].latency.record(0.5)
+        providers.health[fast_api].latency.record(0.01)
+
+        assert providers.ranked() == [fast_api, slow_api]
+        assert (await providers.request_weather_data()).name == "fast"
+
+        providers = WeatherProviders([failing_api, fast_api], hedge_delay=10)
+        for _ in range(2):
+            assert (await providers.request_weather_data()).name == "fast"
+        requests = len(weather_server.requests)
+
+        assert providers.health[failing_api].breaker.state is BreakerState.open
+        assert providers.ranked() == [fast_api, failing_api]
+        providers.providers = [failing_api]
+        providers.health[failing_api].breaker.reset_timeout = 60
+        with pytest.raises(WeatherProviderError):
+            await providers.request_weather_data()
+        assert len(weather_server.requests) == requests
+
+
+async def test_token_bucket(weather_server, clock):
+    """Tests the calls beyond the burst wait for the refill of the bucket, in the order they asked, and the calls
+    of a provider are held back to its rate limit.
+
+    Expected behaviour:
+        reserve() -> no wait within the burst, then waits growing by 1 / rate; five requests at 20/s -> >= 0.15 s.
+    """
+    bucket = TokenBucket(rate=10, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == pytest.approx([0.0, 0.0, 0.1, 0.2])
+    clock.now = 1.0
+    assert bucket.tokens == pytest.approx(2.0)
+    assert TokenBucket(rate=float("inf"), burst=1).reserve() == 0.0
+
+    async with httpx.AsyncClient() as client:
+        api = WeatherApi(api_url=f"{weather_server.url}/weatherapi", fields=WEATHERAPI_FIELDS, client=client)
+        providers = WeatherProviders([api])
+        providers.health[api].limiter = TokenBucket(rate=20, burst=2)
+
+        start_time = time.monotonic()
+        await asyncio.gather(*(providers.request_weather_data(f"station-{index}") for index in range(5)))
+
+        assert time.monotonic() - start_time >= 0.15
+        assert len(weather_server.requests) == 5